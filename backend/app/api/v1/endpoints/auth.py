@@ -2,6 +2,7 @@
 Authentication Endpoints
 Handles user registration, login, token refresh, and password management
 """
+import asyncio
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
@@ -89,7 +90,7 @@ async def register(
     try:
         new_user = User(
             email=user_data.email,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=await asyncio.to_thread(get_password_hash, user_data.password),
             full_name=user_data.full_name,
             role=role,
             organization_id=organization_id,
@@ -156,7 +157,7 @@ async def login(
         )
     
     # Verify password
-    if not verify_password(credentials.password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, credentials.password, user.hashed_password):
         # Increment failed login attempts
         user.failed_login_attempts += 1
         
@@ -284,21 +285,27 @@ async def change_password(
     Requires valid JWT token in Authorization header.
     """
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, password_data.current_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect"
         )
     
     # Check if new password is different from current
-    if verify_password(password_data.new_password, current_user.hashed_password):
+    if await asyncio.to_thread(
+        verify_password, password_data.new_password, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="New password must be different from current password"
         )
     
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await asyncio.to_thread(
+        get_password_hash, password_data.new_password
+    )
     db.commit()
     
     return MessageResponse(message="Password changed successfully")
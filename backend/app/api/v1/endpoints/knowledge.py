@@ -26,7 +26,7 @@ from app.schemas.company_knowledge import (
     DocumentType
 )
 from app.services.rag_service import RAGService
-from app.services.embedding_service import EmbeddingService
+from app.services.embedding_service import get_embedding_service
 
 import logging
 
@@ -34,7 +34,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/knowledge", tags=["Company Knowledge"])
 
 # Initialize services (singleton pattern)
-embedding_service = EmbeddingService()
+embedding_service = get_embedding_service()
 rag_service = RAGService(embedding_service)
 
 
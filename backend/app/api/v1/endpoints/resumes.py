@@ -6,6 +6,8 @@ Handles resume upload, parsing, and candidate creation.
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from sqlalchemy.orm import Session
 from typing import Dict
+import asyncio
+import inspect
 import os
 import tempfile
 import logging
@@ -60,8 +62,13 @@ async def parse_resume(
         logger.info(f"Uploaded file saved: {tmp_file_path}")
         
         # Parse resume
+        # LLMResumeParser.parse is async; the local spaCy ResumeParser is
+        # blocking and runs in a worker thread
         parser = get_resume_parser()
-        parsed_data = parser.parse(tmp_file_path)
+        if inspect.iscoroutinefunction(parser.parse):
+            parsed_data = await parser.parse(tmp_file_path)
+        else:
+            parsed_data = await asyncio.to_thread(parser.parse, tmp_file_path)
         
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
@@ -95,6 +102,7 @@ async def parse_resume(
         candidate.total_experience_years = parsed_data.get('total_experience_years')
         candidate.resume_embedding = parsed_data.get('resume_embedding')
         candidate.skills_embedding = parsed_data.get('skills_embedding')
+        candidate.embedding_meta = parsed_data.get('embedding_meta')
         
         logger.info(f"Updated existing candidate: {email}")
     else:
@@ -110,6 +118,7 @@ async def parse_resume(
             total_experience_years=parsed_data.get('total_experience_years'),
             resume_embedding=parsed_data.get('resume_embedding'),
             skills_embedding=parsed_data.get('skills_embedding'),
+            embedding_meta=parsed_data.get('embedding_meta'),
             status=CandidateStatus.NEW
         )
         db.add(candidate)
@@ -122,7 +131,7 @@ async def parse_resume(
     # Create Resume record
     # Remove embeddings from parsed_data before storing as JSONB (embeddings are already in candidate table)
     parsed_data_for_storage = {k: v for k, v in parsed_data.items() 
-                                if k not in ['resume_embedding', 'skills_embedding']}
+                                if k not in ['resume_embedding', 'skills_embedding', 'embedding_meta']}
     
     resume = Resume(
         candidate_id=candidate.id,
@@ -3,9 +3,10 @@ AI Screening API Endpoints
 Handles AI-powered candidate screening and evaluation
 """
 
+import asyncio
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from pydantic import BaseModel, Field
 
 from app.db.database import get_db
@@ -30,6 +31,9 @@ class SubmitResponseRequest(BaseModel):
     question_id: str = Field(..., description="Question ID")
     response: str = Field(..., min_length=10, max_length=2000, description="Candidate's response")
 
+class BulkSubmitResponseRequest(BaseModel):
+    responses: List[SubmitResponseRequest] = Field(..., min_length=1, max_length=15, description="Responses to evaluate")
+
 class ScreeningResponse(BaseModel):
     screening_id: int
     questions: List[Dict[str, Any]]
@@ -43,6 +47,12 @@ class EvaluationResponse(BaseModel):
     completed: bool
     overall_score: Optional[float]
 
+class BulkEvaluationResponse(BaseModel):
+    evaluations: List[Dict[str, Any]]
+    progress: str
+    completed: bool
+    overall_score: Optional[float]
+
 @router.post("/start", response_model=ScreeningResponse)
 async def start_screening(
     request: StartScreeningRequest,
@@ -142,17 +152,63 @@ async def submit_response(
         logger.error(f"Error submitting response: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to evaluate response: {str(e)}")
 
+@router.post("/{screening_id}/responses", response_model=BulkEvaluationResponse)
+async def submit_responses_bulk(
+    screening_id: int,
+    request: BulkSubmitResponseRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Submit several responses at once and evaluate them concurrently
+    """
+    try:
+        # Blocking lookup off the event loop
+        screening = await asyncio.to_thread(
+            lambda: db.query(Screening).filter(Screening.id == screening_id).first()
+        )
+        if not screening:
+            raise HTTPException(status_code=404, detail="Screening not found")
+        
+        if screening.status != ScreeningStatus.IN_PROGRESS:
+            raise HTTPException(
+                status_code=409, 
+                detail=f"Screening is not in progress (status: {screening.status})"
+            )
+        
+        result = await ai_screening_service.evaluate_responses_bulk(
+            screening_id=screening_id,
+            answers=[r.model_dump() for r in request.responses],
+            db=db
+        )
+        
+        logger.info(f"Evaluated {len(request.responses)} responses for screening {screening_id}")
+        
+        return BulkEvaluationResponse(**result)
+        
+    except HTTPException:
+        raise
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as e:
+        logger.error(f"Error submitting responses: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to evaluate responses: {str(e)}")
+
 @router.get("/{screening_id}", response_model=Dict[str, Any])
 def get_screening(screening_id: int, db: Session = Depends(get_db)):
     """
     Get screening details and current status
     """
-    screening = db.query(Screening).filter(Screening.id == screening_id).first()
+    screening = db.query(Screening).options(
+        joinedload(Screening.job),
+        joinedload(Screening.candidate),
+        selectinload(Screening.responses)
+    ).filter(Screening.id == screening_id).first()
     if not screening:
         raise HTTPException(status_code=404, detail="Screening not found")
     
-    job = db.query(Job).filter(Job.id == screening.job_id).first()
-    candidate = db.query(Candidate).filter(Candidate.id == screening.candidate_id).first()
+    job = screening.job
+    candidate = screening.candidate
+    responses = [r.to_dict() for r in screening.responses]
     
     return {
         "screening_id": screening.id,
@@ -160,14 +216,14 @@ def get_screening(screening_id: int, db: Session = Depends(get_db)):
         "candidate_name": candidate.full_name if candidate else "Unknown",
         "status": screening.status,
         "questions": screening.questions,
-        "responses": screening.responses or [],
+        "responses": responses,
         "overall_score": screening.overall_score,
         "created_at": screening.created_at,
         "completed_at": screening.completed_at,
         "progress": {
-            "answered": len(screening.responses or []),
+            "answered": len(responses),
             "total": len(screening.questions),
-            "percentage": round((len(screening.responses or []) / len(screening.questions)) * 100, 1) if screening.questions else 0
+            "percentage": round((len(responses) / len(screening.questions)) * 100, 1) if screening.questions else 0
         }
     }
 
@@ -202,7 +258,9 @@ def list_job_screenings(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    query = db.query(Screening).filter(Screening.job_id == job_id)
+    query = db.query(Screening).options(
+        joinedload(Screening.candidate)
+    ).filter(Screening.job_id == job_id)
     
     if status:
         query = query.filter(Screening.status == status)
@@ -211,7 +269,7 @@ def list_job_screenings(
     
     results = []
     for screening in screenings:
-        candidate = db.query(Candidate).filter(Candidate.id == screening.candidate_id).first()
+        candidate = screening.candidate
         
         results.append({
             "screening_id": screening.id,
@@ -221,7 +279,7 @@ def list_job_screenings(
             "status": screening.status,
             "overall_score": screening.overall_score,
             "questions_count": len(screening.questions),
-            "responses_count": len(screening.responses or []),
+            "responses_count": screening.questions_answered or 0,
             "created_at": screening.created_at,
             "completed_at": screening.completed_at
         })
@@ -243,13 +301,15 @@ def list_candidate_screenings(
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    screenings = db.query(Screening).filter(
+    screenings = db.query(Screening).options(
+        joinedload(Screening.job)
+    ).filter(
         Screening.candidate_id == candidate_id
     ).offset(offset).limit(limit).all()
     
     results = []
     for screening in screenings:
-        job = db.query(Job).filter(Job.id == screening.job_id).first()
+        job = screening.job
         
         results.append({
             "screening_id": screening.id,
@@ -259,7 +319,7 @@ def list_candidate_screenings(
             "status": screening.status,
             "overall_score": screening.overall_score,
             "questions_count": len(screening.questions),
-            "responses_count": len(screening.responses or []),
+            "responses_count": screening.questions_answered or 0,
             "created_at": screening.created_at,
             "completed_at": screening.completed_at
         })
@@ -3,6 +3,7 @@ User Management Endpoints
 Provides CRUD operations for user management with RBAC
 Phase 2: User Management
 """
+import asyncio
 from typing import Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
@@ -88,7 +89,7 @@ async def create_user(
     # Create new user
     new_user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await asyncio.to_thread(get_password_hash, user_data.password),
         full_name=user_data.full_name,
         role=user_data.role,
         phone=user_data.phone,
@@ -353,7 +354,7 @@ async def update_user(
     
     # Handle password change (hash it)
     if user_data.password is not None:
-        user.hashed_password = get_password_hash(user_data.password)
+        user.hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
         user.password_changed_at = datetime.utcnow()
         fields_changed.append("password")
         changes_after["password"] = "***CHANGED***"
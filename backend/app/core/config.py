@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
+    BCRYPT_ROUNDS: int = 12  # Cost factor for password hashing (each +1 doubles hash time)
     
     # Database
     POSTGRES_USER: str = "aihr_user"
@@ -61,6 +62,14 @@ class Settings(BaseSettings):
     OLLAMA_API_KEY: Optional[str] = None  # For Ollama Cloud (set in environment, do NOT commit secrets)
     # Ollama Cloud host (used when OLLAMA_API_KEY is provided). Examples: https://ollama.com
     OLLAMA_CLOUD_URL: str = "https://ollama.com"
+    # Max concurrent generation requests sent to Ollama (match server OLLAMA_NUM_PARALLEL)
+    OLLAMA_NUM_PARALLEL: int = 4
+    # Multiplex concurrent Ollama requests over HTTP/2 (requires httpx[http2])
+    OLLAMA_HTTP2: bool = True
+    # HTTP connection pool for Ollama (generation, embedding batches, health checks)
+    OLLAMA_MAX_CONNECTIONS: int = 256
+    OLLAMA_MAX_KEEPALIVE: int = 128
+    OLLAMA_EMBED_MODEL: str = "nomic-embed-text"  # Used by /api/embed batch embeddings
     
     # Google Gemini (Fallback LLM)
     GOOGLE_API_KEY: Optional[str] = None  # For Gemini API
@@ -68,6 +77,20 @@ class Settings(BaseSettings):
     
     SPACY_MODEL: str = "en_core_web_lg"
     SENTENCE_TRANSFORMER_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
+    # JobBERT inference precision: FP16 on CUDA, dynamic INT8 on CPU (False keeps FP32).
+    # Part of the embedding fingerprint, so enabling it marks stored FP32 vectors stale
+    EMBEDDING_REDUCED_PRECISION: bool = False
+    # Directory with the int8 ONNX export of dslim/bert-base-NER (scripts/export_ner_onnx.py); unset uses PyTorch
+    NER_ONNX_MODEL_DIR: Optional[str] = None
+    # Run the PyTorch NER model in FP16 when CUDA is available (False keeps FP32)
+    NER_REDUCED_PRECISION: bool = True
+    # torch.compile the PyTorch NER model (fused kernels; first load pays the compile time)
+    NER_TORCH_COMPILE: bool = False
+    # Reuse a cached screening evaluation for answers with cosine >= 0.95 to a cached one.
+    # Off by default: a near-identical answer (e.g. a negation) would inherit another candidate's score
+    EVAL_SEMANTIC_CACHE: bool = False
+    # Job matching scores only the limit * N candidates nearest by pgvector cosine (0 scores every candidate)
+    JOB_MATCH_SHORTLIST_FACTOR: int = 0
     # Toggle whether to use the LLM-based resume parser (when True) or the local spaCy parser
     USE_LLM_RESUME_PARSER: bool = True
     WHISPER_MODEL: str = "base"  # base, small, medium, large
@@ -93,6 +116,8 @@ class Settings(BaseSettings):
     
     # File Upload
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    # PDF text extraction for resumes: "pdfium" (pypdfium2, falls back to PyPDF2 if not installed) or "pypdf2"
+    PDF_TEXT_EXTRACTOR: str = "pdfium"
     ALLOWED_EXTENSIONS: List[str] = [".pdf", ".docx", ".txt"]
     
     # CORS - parse as string from .env, split by comma
@@ -5,12 +5,11 @@ Provides dependency injection for authentication and authorization
 from typing import List, Callable
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.user import User, UserRole
-from app.services.auth_service import decode_token
+from app.services.auth_service import decode_token, JWTError
 
 # OAuth2 scheme - points to login endpoint
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
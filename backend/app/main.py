@@ -3,6 +3,7 @@ FastAPI Main Application
 Entry point for the AI-HR Automation Platform backend
 """
 from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -25,10 +26,27 @@ async def lifespan(app: FastAPI):
     # Initialize database tables (in production, use Alembic migrations)
     # init_db()  # Uncomment when models are ready
     
+    # Pre-open LLM provider connections so the first request skips DNS/TCP/TLS
+    from app.services.llm_provider import get_llm_service
+    llm_warmup = asyncio.create_task(get_llm_service().warmup())
+    
     yield
     
     # Shutdown
     print("👋 Shutting down AI-HR Platform")
+    
+    # Close pooled LLM HTTP connections
+    llm_warmup.cancel()
+    await asyncio.gather(llm_warmup, return_exceptions=True)
+    await get_llm_service().aclose()
+    
+    # Close evaluation cache connections
+    from app.services.ai_screening import ai_screening_service
+    await ai_screening_service.eval_cache.aclose()
+    
+    # Stop the embedding micro-batcher
+    from app.services.embedding_service import close_embedding_service
+    await close_embedding_service()
 
 
 # Create FastAPI application
@@ -8,7 +8,7 @@ from app.models.job import Job
 from app.models.candidate import Candidate
 from app.models.resume import Resume
 from app.models.interview import Interview
-from app.models.screening import Screening
+from app.models.screening import Screening, ScreeningResponse
 from app.models.user import User
 from app.models.application import Application
 from app.models.feedback import Feedback
@@ -22,6 +22,7 @@ __all__ = [
     "Resume",
     "Interview",
     "Screening",
+    "ScreeningResponse",
     "User",
     "Application",
     "Feedback",
@@ -2,16 +2,41 @@
 Candidate Model
 Stores candidate information with resume embeddings for semantic search
 """
-from sqlalchemy import Column, String, Integer, DateTime, Text, Enum as SQLEnum, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, LargeBinary, DateTime, Text, Enum as SQLEnum, Boolean, ForeignKey
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from pgvector.sqlalchemy import Vector
 from datetime import datetime
+from typing import Optional, Tuple
 import enum
+import numpy as np
 
 from app.db.database import Base
 
 
+def quantize_embedding_int8(embedding) -> Tuple[Optional[bytes], Optional[float]]:
+    """
+    Symmetric per-vector int8 quantization: embedding ≈ int8 values * scale
+    
+    Returns (None, None) for missing or all-zero embeddings.
+    """
+    if embedding is None:
+        return None, None
+    values = np.asarray(embedding, dtype=np.float32)
+    max_abs = float(np.abs(values).max()) if values.size else 0.0
+    if max_abs == 0.0:
+        return None, None
+    scale = max_abs / 127.0
+    return np.round(values / scale).astype(np.int8).tobytes(), scale
+
+
+def int8_embedding_norm(embedding_i8: Optional[bytes]) -> Optional[float]:
+    """L2 norm of an int8-quantized embedding (None when there is none)"""
+    if embedding_i8 is None:
+        return None
+    return float(np.linalg.norm(np.frombuffer(embedding_i8, dtype=np.int8).astype(np.float32)))
+
+
 class CandidateStatus(str, enum.Enum):
     """Candidate application status"""
     NEW = "new"
@@ -51,6 +76,13 @@ class Candidate(Base):
     # AI/ML - Vector Embeddings (768 dimensions for JobBERT-v3)
     resume_embedding = Column(Vector(768))  # pgvector column for semantic search
     skills_embedding = Column(Vector(768))  # Separate embedding for skills
+    # int8 copy of resume_embedding (768 bytes instead of 3 KB) for bulk matching
+    resume_embedding_i8 = Column(LargeBinary)
+    resume_embedding_scale = Column(Float)  # resume_embedding ≈ i8 * scale
+    resume_embedding_i8_norm = Column(Float)  # L2 norm of the int8 vector; cosine is one dot product
+    # Fingerprint of the model that produced the embeddings (EmbeddingService.fingerprint);
+    # NULL for vectors stored before fingerprints were recorded
+    embedding_meta = Column(JSONB)
     
     # Extracted Information (from AI resume parser)
     skills = Column(JSONB)  # {"technical": [...], "soft": [...]}
@@ -82,6 +114,13 @@ class Candidate(Base):
     screenings = relationship("Screening", back_populates="candidate", cascade="all, delete-orphan")
     feedbacks = relationship("Feedback", back_populates="candidate", cascade="all, delete-orphan")
     
+    @validates("resume_embedding")
+    def _sync_resume_embedding_i8(self, key, embedding):
+        """Keep the int8 copy in step with every resume_embedding write"""
+        self.resume_embedding_i8, self.resume_embedding_scale = quantize_embedding_int8(embedding)
+        self.resume_embedding_i8_norm = int8_embedding_norm(self.resume_embedding_i8)
+        return embedding
+    
     def __repr__(self):
         return f"<Candidate {self.full_name} ({self.email})>"
     
@@ -77,6 +77,8 @@ class Job(Base):
     preferred_skills = Column(JSONB)  # ["Docker", "AWS", "Redis"]
     required_education = Column(String(100))  # "Bachelor's in CS or equivalent"
     required_experience_years = Column(Integer)  # Minimum years
+    # Matcher's NER/keyword extraction: {"fingerprint": ..., "requirements": {...}}
+    extracted_requirements = Column(JSONB)
     
     # AI/ML - Vector Embeddings (768 dimensions for JobBERT-v3)
     job_description_embedding = Column(Vector(768))  # For semantic job matching
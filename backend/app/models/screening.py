@@ -53,15 +53,9 @@ class Screening(Base):
     #   }
     # ]
     
-    responses = Column(JSONB)  # Candidate's answers
-    # Example: [
-    #   {
-    #     "question_id": 1,
-    #     "answer": "I have 3 years experience with FastAPI...",
-    #     "answered_at": "2025-10-25T10:30:00Z",
-    #     "time_taken_seconds": 120
-    #   }
-    # ]
+    # Candidate answers live in the screening_responses child table
+    # (see ScreeningResponse and the `responses` relationship below) so each
+    # evaluation is a single-row INSERT instead of a rewrite of a JSONB array.
     
     # AI Evaluation
     ai_evaluation = Column(JSONB)  # Detailed AI scoring per question
@@ -156,6 +150,12 @@ class Screening(Base):
     candidate = relationship("Candidate", back_populates="screenings")
     job = relationship("Job")
     application = relationship("Application", back_populates="screening")
+    responses = relationship(
+        "ScreeningResponse",
+        back_populates="screening",
+        order_by="ScreeningResponse.timestamp",
+        cascade="all, delete-orphan"
+    )
     
     def __repr__(self):
         return f"<Screening {self.id} for Candidate {self.candidate_id}>"
@@ -272,3 +272,30 @@ class Screening(Base):
             self.session_metadata['ai_observations'] = []
         
         self.session_metadata['ai_observations'].append(observation)
+
+
+class ScreeningResponse(Base):
+    """A candidate's answer to one screening question, with its AI evaluation"""
+    __tablename__ = "screening_responses"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    screening_id = Column(Integer, ForeignKey("screenings.id", ondelete="CASCADE"), nullable=False, index=True)
+    question_id = Column(String(50), nullable=False)
+    response = Column(Text, nullable=False)
+    evaluation = Column(JSONB)  # score, feedback, strengths, weaknesses, ...
+    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    screening = relationship("Screening", back_populates="responses")
+    
+    def __repr__(self):
+        return f"<ScreeningResponse {self.id} for Screening {self.screening_id} ({self.question_id})>"
+    
+    def to_dict(self) -> dict:
+        """Serialize in the same shape as the former JSONB response entries"""
+        return {
+            "question_id": self.question_id,
+            "response": self.response,
+            "evaluation": self.evaluation,
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None
+        }
@@ -4,25 +4,115 @@ Generates interview questions and evaluates responses using Multi-Provider LLM
 Supports Ollama Cloud and Google Gemini with automatic failover
 """
 
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import string
+from typing import List, Dict, Any, Optional, Set, Tuple
 import asyncio
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import distinct, func
+from sqlalchemy.orm import Session, joinedload, selectinload
 from app.core.config import settings
 from app.models.job import Job
 from app.models.candidate import Candidate
-from app.models.screening import Screening, ScreeningStatus, SessionState
-from app.services.llm_provider import get_llm_service, LLMOptions
+from app.models.screening import Screening, ScreeningResponse, ScreeningStatus, SessionState
+from app.services.llm_provider import get_llm_service, LLMOptions, extract_json_object
 from app.services.rag_service import RAGService
-from app.services.embedding_service import EmbeddingService
+from app.services.embedding_service import get_embedding_service
 from app.services.bias_detector import BiasDetector, BiasDetection
+from app.services.eval_cache import EvaluationCache
 
 logger = logging.getLogger(__name__)
 
+# Static prompt headers. Kept byte-identical across calls and placed before any
+# dynamic content so the LLM server can reuse its KV cache for the shared prefix.
+QUESTION_PROMPT_HEADER = """You are an expert HR interviewer designing screening questions.
+
+Generate questions that are:
+1. Relevant to the job requirements AND company context provided
+2. Appropriate for the candidate's experience level
+3. Mix of technical, behavioral, and situational questions
+4. Aligned with company values and technical requirements
+5. Clear and concise
+6. Include expected answer criteria
+
+Return ONLY valid JSON in this exact format:
+{
+    "questions": [
+        {
+            "id": "q1",
+            "type": "technical",
+            "question": "Question text here?",
+            "expected_skills": ["skill1", "skill2"],
+            "evaluation_criteria": "What to look for in the answer",
+            "difficulty": "mid",
+            "max_score": 10
+        }
+    ]
+}
+"""
+
+# Dynamic parts of question generation, filled from the precomputed
+# context["prompt_fields"] (see _build_question_context)
+_RAG_QUERY_TEMPLATE = string.Template("""
+Generate screening interview questions for a $title position.
+Required skills: $skills_csv
+Experience level: $experience_level
+""")
+
+_QGEN_TEMPLATE = string.Template("""$company_context
+
+Generate $num_questions diverse screening questions based on the following additional context:
+
+JOB DETAILS:
+Title: $title
+Description: $description
+Required Skills: $skills_csv
+Experience Level: $experience_level
+
+CANDIDATE PROFILE:
+Name: $candidate_name
+Skills: $candidate_skills
+Experience: $candidate_experience_years years
+
+QUESTION TYPES TO INCLUDE: $qtypes_csv
+""")
+
+EVAL_PROMPT_HEADER = """You are an expert HR interviewer evaluating a candidate's response. Provide a detailed evaluation.
+
+Evaluate the response below and return ONLY valid JSON:
+{
+    "score": 7,
+    "feedback": "Detailed feedback on the response",
+    "strengths": ["strength1", "strength2"],
+    "weaknesses": ["weakness1"],
+    "suggestions": "Specific suggestions for improvement",
+    "technical_accuracy": 8,
+    "communication_clarity": 9,
+    "relevance": 7,
+    "overall_assessment": "good"
+}
+"""
+
+# Score thresholds (descending) and the recommendations for each tier
+_RECOMMENDATION_TIERS = (
+    (80, ("Strong candidate - Recommend for next round",
+          "Demonstrated excellent technical and communication skills")),
+    (65, ("Good candidate - Consider for interview",
+          "Shows potential with some areas for development")),
+    (50, ("Average candidate - Requires careful consideration",
+          "May need additional training or mentorship")),
+)
+_DEFAULT_RECOMMENDATIONS = (
+    "Below threshold - Not recommended for current role",
+    "Consider for junior positions or future opportunities"
+)
+
+
 class QuestionType(str, Enum):
     TECHNICAL = "technical"
     BEHAVIORAL = "behavioral"
@@ -46,8 +136,15 @@ class AIScreeningService:
         self.llm_service = get_llm_service()
         self.session_timeout = 300  # 5 minutes
         # Initialize RAG service with embedding service
-        embedding_service = EmbeddingService()
+        embedding_service = get_embedding_service()
         self.rag_service = RAGService(embedding_service)
+        # Exact cache for response evaluations (semantic tier only when opted in)
+        self.eval_cache = EvaluationCache(
+            embedding_service if settings.EVAL_SEMANTIC_CACHE else None
+        )
+        # In-flight evaluations keyed by prompt digest, so identical concurrent
+        # requests share one LLM call
+        self._inflight: Dict[bytes, asyncio.Task] = {}
         # Initialize Bias Detector
         self.bias_detector = BiasDetector()
         
@@ -63,9 +160,10 @@ class AIScreeningService:
         Generate personalized screening questions based on job and candidate profile
         Enhanced with RAG for company-specific context
         """
-        # Get job and candidate data
-        job = db.query(Job).filter(Job.id == job_id).first()
-        candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        # Get job and candidate data (sync SQLAlchemy runs in a worker thread)
+        job, candidate = await asyncio.to_thread(
+            self._load_job_and_candidate, db, job_id, candidate_id
+        )
         
         if not job or not candidate:
             raise ValueError("Job or candidate not found")
@@ -79,7 +177,7 @@ class AIScreeningService:
             ]
         
         # Create context for AI
-        context = self._build_question_context(job, candidate)
+        context = self._build_question_context(job, candidate, question_types)
         
         # Get organization_id from job
         organization_id = job.organization_id
@@ -98,9 +196,7 @@ class AIScreeningService:
             created_at=datetime.utcnow()
         )
         
-        db.add(screening)
-        db.commit()
-        db.refresh(screening)
+        await asyncio.to_thread(self._save, db, screening)
         
         logger.info(f"Generated {len(questions)} questions for screening {screening.id}")
         
@@ -122,7 +218,7 @@ class AIScreeningService:
         """
         Evaluate a candidate's response to a screening question
         """
-        screening = db.query(Screening).filter(Screening.id == screening_id).first()
+        screening = await asyncio.to_thread(self._get_screening, db, screening_id)
         if not screening:
             raise ValueError("Screening not found")
         
@@ -139,31 +235,108 @@ class AIScreeningService:
         # Evaluate using Ollama
         evaluation = await self._evaluate_response_with_ollama(question, response, screening)
         
-        # Update screening record
-        if not screening.responses:
-            screening.responses = []
+        # Append a single response row; completion is checked with a COUNT
+        record = ScreeningResponse(
+            screening_id=screening.id,
+            question_id=question_id,
+            response=response,
+            evaluation=evaluation,
+            timestamp=datetime.utcnow()
+        )
+        answered_questions = await asyncio.to_thread(
+            self._record_responses, db, screening, [record]
+        )
+        total_questions = len(screening.questions)
         
-        screening.responses.append({
-            "question_id": question_id,
-            "response": response,
+        return {
             "evaluation": evaluation,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "progress": f"{answered_questions}/{total_questions}",
+            "completed": screening.status == ScreeningStatus.COMPLETED,
+            "overall_score": screening.overall_score
+        }
+    
+    async def evaluate_responses_bulk(
+        self,
+        screening_id: int,
+        answers: List[Dict[str, str]],
+        db: Session
+    ) -> Dict[str, Any]:
+        """
+        Evaluate several responses for a screening concurrently
         
-        # Check if all questions are answered
-        answered_questions = len(screening.responses)
-        total_questions = len(screening.questions)
+        LLM calls are fanned out under a semaphore capped at OLLAMA_NUM_PARALLEL
+        and the screening record is committed once after all evaluations finish.
         
-        if answered_questions >= total_questions:
-            screening.status = ScreeningStatus.COMPLETED
-            screening.overall_score = self._calculate_overall_score(screening.responses)
-            screening.completed_at = datetime.utcnow()
+        Args:
+            screening_id: Screening ID
+            answers: List of {"question_id": ..., "response": ...} dicts
+            db: Database session
+        """
+        screening = await asyncio.to_thread(self._get_screening, db, screening_id)
+        if not screening:
+            raise ValueError("Screening not found")
+        
+        questions_by_id = {q.get("id"): q for q in screening.questions or []}
+        answered_ids = await asyncio.to_thread(self._answered_question_ids, db, screening.id)
+        pairs = []
+        seen = set()
+        for answer in answers:
+            question_id = answer.get("question_id")
+            question = questions_by_id.get(question_id)
+            if not question:
+                raise ValueError(f"Question not found: {question_id}")
+            # Reject before any LLM call: a repeated answer would inflate the answered count
+            if question_id in seen:
+                raise ValueError(f"Duplicate response for question: {question_id}")
+            if question_id in answered_ids:
+                raise ValueError(f"Question already answered: {question_id}")
+            seen.add(question_id)
+            pairs.append((question, answer.get("response", "")))
+        
+        if self.llm_service.has_available_provider():
+            semaphore = asyncio.Semaphore(settings.OLLAMA_NUM_PARALLEL or 4)
+            
+            async def _evaluate_one(question: Dict[str, Any], response: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._evaluate_response_with_ollama(question, response, screening)
+            
+            results = await asyncio.gather(
+                *[_evaluate_one(q, r) for q, r in pairs],
+                return_exceptions=True
+            )
+        else:
+            # No LLM provider is up: score the whole batch with the fallback scorer
+            logger.warning(f"No LLM provider available, using fallback scoring for screening {screening_id}")
+            results = [None] * len(pairs)
+        
+        failed = [i for i, result in enumerate(results) if not isinstance(result, dict)]
+        if failed:
+            fallback_scores = self._fallback_scores_bulk([pairs[i][1] for i in failed])
+            for i, score in zip(failed, fallback_scores):
+                question, response = pairs[i]
+                if isinstance(results[i], Exception):
+                    logger.error(f"Bulk evaluation failed for question {question.get('id')}: {results[i]}")
+                results[i] = self._generate_fallback_evaluation(response, question, score)
+        
+        evaluations = []
+        records = []
+        for (question, response), result in zip(pairs, results):
+            evaluations.append({"question_id": question.get("id"), "evaluation": result})
+            records.append(ScreeningResponse(
+                screening_id=screening.id,
+                question_id=question.get("id"),
+                response=response,
+                evaluation=result,
+                timestamp=datetime.utcnow()
+            ))
         
-        db.commit()
-        db.refresh(screening)
+        answered_questions = await asyncio.to_thread(
+            self._record_responses, db, screening, records
+        )
+        total_questions = len(screening.questions)
         
         return {
-            "evaluation": evaluation,
+            "evaluations": evaluations,
             "progress": f"{answered_questions}/{total_questions}",
             "completed": screening.status == ScreeningStatus.COMPLETED,
             "overall_score": screening.overall_score
@@ -173,15 +346,25 @@ class AIScreeningService:
         """
         Get comprehensive screening summary with AI insights
         """
-        screening = db.query(Screening).filter(Screening.id == screening_id).first()
+        # Load screening with its job and candidate in a single query
+        screening = await asyncio.to_thread(
+            self._get_screening, db, screening_id, True
+        )
         if not screening:
             raise ValueError("Screening not found")
         
-        job = db.query(Job).filter(Job.id == screening.job_id).first()
-        candidate = db.query(Candidate).filter(Candidate.id == screening.candidate_id).first()
+        job = screening.job
+        candidate = screening.candidate
+        
+        responses = [r.to_dict() for r in screening.responses]
+        
+        # Single pass over responses for count and formatted highlights
+        _, answered, key_responses = self._summarize_responses(responses)
         
         # Generate AI summary
-        summary = await self._generate_screening_summary(screening, job, candidate)
+        summary = await self._generate_screening_summary(
+            screening, job, candidate, answered, key_responses
+        )
         
         return {
             "screening_id": screening_id,
@@ -189,17 +372,117 @@ class AIScreeningService:
             "candidate_name": candidate.full_name,
             "status": screening.status,
             "overall_score": screening.overall_score,
-            "questions_answered": len(screening.responses or []),
+            "questions_answered": answered,
             "total_questions": len(screening.questions),
             "duration_minutes": self._calculate_duration(screening),
             "ai_summary": summary,
-            "responses": screening.responses,
+            "responses": responses,
             "recommendations": self._generate_recommendations(screening)
         }
     
-    def _build_question_context(self, job: Job, candidate: Candidate) -> Dict[str, Any]:
+    # ============================================================
+    # BLOCKING DB HELPERS (run via asyncio.to_thread)
+    # ============================================================
+    
+    @staticmethod
+    def _load_job_and_candidate(db: Session, job_id: int, candidate_id: int):
+        """Fetch job and candidate rows"""
+        job = db.query(Job).filter(Job.id == job_id).first()
+        candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        return job, candidate
+    
+    @staticmethod
+    def _get_screening(
+        db: Session,
+        screening_id: int,
+        with_relations: bool = False
+    ) -> Optional[Screening]:
+        """Fetch a screening, optionally eager-loading its job, candidate and responses"""
+        query = db.query(Screening)
+        if with_relations:
+            query = query.options(
+                joinedload(Screening.job),
+                joinedload(Screening.candidate),
+                selectinload(Screening.responses)
+            )
+        return query.filter(Screening.id == screening_id).first()
+    
+    @staticmethod
+    def _commit_keep_state(db: Session) -> None:
+        """
+        Commit without expiring loaded objects
+        
+        Everything read back afterwards was just assigned in memory, so a
+        post-commit refresh/reload would only cost an extra SELECT.
+        """
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+    
+    @staticmethod
+    def _answered_question_ids(db: Session, screening_id: int) -> Set[str]:
+        """IDs of the questions that already have a stored response"""
+        rows = db.query(ScreeningResponse.question_id).filter(
+            ScreeningResponse.screening_id == screening_id
+        ).distinct().all()
+        return {question_id for (question_id,) in rows}
+    
+    def _save(self, db: Session, instance) -> None:
+        """Insert a new row; flush assigns the primary key without a SELECT"""
+        db.add(instance)
+        db.flush()
+        self._commit_keep_state(db)
+    
+    def _record_responses(
+        self,
+        db: Session,
+        screening: Screening,
+        records: List[ScreeningResponse]
+    ) -> int:
+        """
+        Insert response rows and complete the screening once every question is answered
+        
+        Returns:
+            Number of answered questions after the insert
+        """
+        db.add_all(records)
+        db.flush()
+        
+        # Distinct questions, so a re-submitted answer never completes the screening early
+        answered = db.query(func.count(distinct(ScreeningResponse.question_id))).filter(
+            ScreeningResponse.screening_id == screening.id
+        ).scalar()
+        screening.questions_answered = answered
+        
+        if answered >= len(screening.questions):
+            rows = db.query(ScreeningResponse.question_id, ScreeningResponse.evaluation).filter(
+                ScreeningResponse.screening_id == screening.id
+            ).order_by(ScreeningResponse.timestamp).all()
+            # Latest evaluation per question
+            evaluations = {question_id: evaluation for question_id, evaluation in rows}
+            screening.status = ScreeningStatus.COMPLETED
+            screening.overall_score = self._calculate_overall_score(
+                [{"evaluation": e} for e in evaluations.values()]
+            )
+            screening.completed_at = datetime.utcnow()
+        
+        self._commit_keep_state(db)
+        return answered
+    
+    def _build_question_context(
+        self,
+        job: Job,
+        candidate: Candidate,
+        question_types: Optional[List[QuestionType]] = None
+    ) -> Dict[str, Any]:
         """
         Build context for question generation
+        
+        Also precomputes the flat string fields substituted into the prompt
+        templates, so joins and nested lookups happen once per screening.
         """
         return {
             "job": {
@@ -216,6 +499,16 @@ class AIScreeningService:
                 "education": candidate.education,
                 "experience": candidate.work_experience,
                 "total_experience_years": candidate.total_experience_years
+            },
+            "prompt_fields": {
+                "title": job.title,
+                "description": job.description,
+                "skills_csv": ", ".join(job.skills_required or []),
+                "experience_level": job.experience_level,
+                "candidate_name": candidate.full_name,
+                "candidate_skills": candidate.skills,
+                "candidate_experience_years": candidate.total_experience_years,
+                "qtypes_csv": ", ".join(question_types or [])
             }
         }
     
@@ -230,12 +523,10 @@ class AIScreeningService:
         """
         Generate questions using LLM with RAG-enhanced context
         """
+        fields = context["prompt_fields"]
+        
         # Build base query for RAG
-        base_query = f"""
-        Generate screening interview questions for a {context['job']['title']} position.
-        Required skills: {', '.join(context['job']['skills_required'] or [])}
-        Experience level: {context['job']['experience_level']}
-        """
+        base_query = _RAG_QUERY_TEMPLATE.substitute(fields)
         
         # Augment prompt with company-specific context using RAG
         enhanced_prompt = await self.rag_service.augment_prompt(
@@ -246,47 +537,12 @@ class AIScreeningService:
             max_context_tokens=1500
         )
         
-        # Build full prompt with RAG context
-        prompt = f"""{enhanced_prompt}
-
-        Generate {num_questions} diverse screening questions based on the following additional context:
-
-        JOB DETAILS:
-        Title: {context['job']['title']}
-        Description: {context['job']['description']}
-        Required Skills: {', '.join(context['job']['skills_required'] or [])}
-        Experience Level: {context['job']['experience_level']}
-
-        CANDIDATE PROFILE:
-        Name: {context['candidate']['name']}
-        Skills: {context['candidate']['skills']}
-        Experience: {context['candidate']['total_experience_years']} years
-
-        QUESTION TYPES TO INCLUDE: {', '.join(question_types)}
-
-        Generate questions that are:
-        1. Relevant to the job requirements AND company context above
-        2. Appropriate for the candidate's experience level
-        3. Mix of technical, behavioral, and situational questions
-        4. Aligned with company values and technical requirements
-        5. Clear and concise
-        6. Include expected answer criteria
-
-        Return ONLY valid JSON in this exact format:
-        {{
-            "questions": [
-                {{
-                    "id": "q1",
-                    "type": "technical",
-                    "question": "Question text here?",
-                    "expected_skills": ["skill1", "skill2"],
-                    "evaluation_criteria": "What to look for in the answer",
-                    "difficulty": "mid",
-                    "max_score": 10
-                }}
-            ]
-        }}
-        """
+        # Static header first, then the per-screening context
+        prompt = QUESTION_PROMPT_HEADER + "\n" + _QGEN_TEMPLATE.substitute(
+            fields,
+            company_context=enhanced_prompt,
+            num_questions=num_questions
+        )
         
         try:
             # Use LLM service with JSON response format
@@ -305,11 +561,7 @@ class AIScreeningService:
                 # Parse JSON from response
                 try:
                     # Extract JSON from response (sometimes LLMs add extra text)
-                    start = response_text.find('{')
-                    end = response_text.rfind('}') + 1
-                    json_str = response_text[start:end]
-                    
-                    questions_data = json.loads(json_str)
+                    questions_data = extract_json_object(response_text)
                     questions = questions_data.get("questions", [])
                     
                     # Add IDs if missing
@@ -341,32 +593,55 @@ class AIScreeningService:
     ) -> Dict[str, Any]:
         """
         Evaluate response using Multi-Provider LLM
+        Repeated and near-duplicate answers are served from the evaluation cache
         """
-        prompt = f"""
-        You are an expert HR interviewer evaluating a candidate's response. Provide a detailed evaluation.
-
-        QUESTION: {question['question']}
-        QUESTION TYPE: {question.get('type', 'general')}
-        EXPECTED SKILLS: {', '.join(question.get('expected_skills', []))}
-        EVALUATION CRITERIA: {question.get('evaluation_criteria', 'General assessment')}
-        MAX SCORE: {question.get('max_score', 10)}
-
-        CANDIDATE'S RESPONSE: {response}
+        cache_key = self.eval_cache.question_key(question)
+        cached = await self.eval_cache.get(cache_key, response)
+        if cached is not None:
+            logger.info(f"Evaluation cache hit for question {question.get('id')}")
+            return cached
+        
+        # Static header first, then the question-specific tail
+        prompt = EVAL_PROMPT_HEADER + "\n" + f"""QUESTION: {question['question']}
+QUESTION TYPE: {question.get('type', 'general')}
+EXPECTED SKILLS: {', '.join(question.get('expected_skills', []))}
+EVALUATION CRITERIA: {question.get('evaluation_criteria', 'General assessment')}
+MAX SCORE: {question.get('max_score', 10)}
 
-        Evaluate this response and return ONLY valid JSON:
-        {{
-            "score": 7,
-            "feedback": "Detailed feedback on the response",
-            "strengths": ["strength1", "strength2"],
-            "weaknesses": ["weakness1"],
-            "suggestions": "Specific suggestions for improvement",
-            "technical_accuracy": 8,
-            "communication_clarity": 9,
-            "relevance": 7,
-            "overall_assessment": "good"
-        }}
-        """
+CANDIDATE'S RESPONSE: {response}
+"""
         
+        # Coalesce with an identical evaluation that is already running. The
+        # request runs as its own task, so a caller that is cancelled (client
+        # disconnect) does not take the shared evaluation down with it.
+        key = hashlib.sha256(prompt.encode("utf-8")).digest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_evaluation(prompt, question, response, cache_key)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        else:
+            logger.info(f"Joining in-flight evaluation for question {question.get('id')}")
+        return dict(await asyncio.shield(task))
+    
+    def _finish_inflight(self, key: bytes, task: asyncio.Task) -> None:
+        """Drop a finished shared evaluation from the in-flight map"""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller has gone
+    
+    async def _request_evaluation(
+        self,
+        prompt: str,
+        question: Dict[str, Any],
+        response: str,
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """
+        Call the LLM for an evaluation, falling back to length-based scoring on failure
+        """
         try:
             # Use LLM service with lower temperature for consistent scoring
             options = LLMOptions(
@@ -383,16 +658,14 @@ class AIScreeningService:
                 
                 try:
                     # Extract and parse JSON
-                    start = response_text.find('{')
-                    end = response_text.rfind('}') + 1
-                    json_str = response_text[start:end]
-                    
-                    evaluation = json.loads(json_str)
+                    evaluation = extract_json_object(response_text)
                     
                     # Ensure score is within bounds
                     max_score = question.get('max_score', 10)
                     evaluation['score'] = min(max_score, max(0, evaluation.get('score', 0)))
                     
+                    await self.eval_cache.set(cache_key, response, evaluation)
+                    
                     return evaluation
                     
                 except json.JSONDecodeError:
@@ -434,12 +707,31 @@ class AIScreeningService:
         
         return questions
     
-    def _generate_fallback_evaluation(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _fallback_scores_bulk(responses: List[str]) -> np.ndarray:
+        """
+        Length-based fallback scores (1-10) for a batch of responses
+        
+        Scores roughly one point per ten words. Computed over the whole batch at
+        once so a screening scored without the LLM does not loop per response.
+        """
+        word_counts = np.fromiter(
+            (len(r.split()) for r in responses), dtype=np.int32, count=len(responses)
+        )
+        return np.clip(word_counts // 10, 1, 10)
+    
+    def _generate_fallback_evaluation(
+        self,
+        response: str,
+        question: Dict[str, Any],
+        score: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Generate fallback evaluation when Ollama is unavailable
         """
-        response_length = len(response.split())
-        base_score = min(10, max(1, response_length // 10))  # Basic scoring based on length
+        if score is None:
+            score = self._fallback_scores_bulk([response])[0]
+        base_score = int(score)
         
         return {
             "score": base_score,
@@ -453,6 +745,29 @@ class AIScreeningService:
             "overall_assessment": "requires_manual_review"
         }
     
+    def _summarize_responses(
+        self,
+        responses: List[Dict[str, Any]],
+        top_n: int = 3
+    ) -> Tuple[float, int, str]:
+        """
+        Walk responses once, collecting total score, count and formatted top responses
+        
+        Returns:
+            (total_score, response_count, formatted_top_responses)
+        """
+        total_score = 0
+        formatted = []
+        for i, response in enumerate(responses):
+            evaluation = response.get('evaluation') or {}
+            score = evaluation.get('score', 0)
+            total_score += score
+            if i < top_n:
+                feedback = evaluation.get('feedback', 'No feedback')
+                formatted.append(f"Q{i+1} (Score: {score}/10): {feedback[:100]}...")
+        
+        return total_score, len(responses), "\n".join(formatted)
+    
     def _calculate_overall_score(self, responses: List[Dict[str, Any]]) -> float:
         """
         Calculate overall screening score
@@ -460,8 +775,8 @@ class AIScreeningService:
         if not responses:
             return 0.0
         
-        total_score = sum(r.get('evaluation', {}).get('score', 0) for r in responses)
-        max_possible = len(responses) * 10  # Assuming max score of 10 per question
+        total_score, count, _ = self._summarize_responses(responses, top_n=0)
+        max_possible = count * 10  # Assuming max score of 10 per question
         
         return round((total_score / max_possible) * 100, 2) if max_possible > 0 else 0.0
     
@@ -479,29 +794,21 @@ class AIScreeningService:
         """
         Generate hiring recommendations based on screening results
         """
-        recommendations = []
         score = screening.overall_score or 0
         
-        if score >= 80:
-            recommendations.append("Strong candidate - Recommend for next round")
-            recommendations.append("Demonstrated excellent technical and communication skills")
-        elif score >= 65:
-            recommendations.append("Good candidate - Consider for interview")
-            recommendations.append("Shows potential with some areas for development")
-        elif score >= 50:
-            recommendations.append("Average candidate - Requires careful consideration")
-            recommendations.append("May need additional training or mentorship")
-        else:
-            recommendations.append("Below threshold - Not recommended for current role")
-            recommendations.append("Consider for junior positions or future opportunities")
+        for threshold, recommendations in _RECOMMENDATION_TIERS:
+            if score >= threshold:
+                return list(recommendations)
         
-        return recommendations
+        return list(_DEFAULT_RECOMMENDATIONS)
     
     async def _generate_screening_summary(
         self,
         screening: Screening,
         job: Job,
-        candidate: Candidate
+        candidate: Candidate,
+        questions_answered: int,
+        key_responses: str
     ) -> str:
         """
         Generate AI-powered screening summary using Multi-Provider LLM
@@ -512,10 +819,10 @@ class AIScreeningService:
         Job: {job.title}
         Candidate: {candidate.full_name}
         Overall Score: {screening.overall_score}%
-        Questions Answered: {len(screening.responses or [])}
+        Questions Answered: {questions_answered}
 
         Key Responses:
-        {self._format_responses_for_summary(screening.responses or [])}
+        {key_responses}
 
         Provide a 2-3 sentence professional summary highlighting:
         1. Overall performance
@@ -543,19 +850,6 @@ class AIScreeningService:
             logger.error(f"Error generating summary: {e}")
             return "AI summary unavailable due to technical issue. Manual review recommended."
     
-    def _format_responses_for_summary(self, responses: List[Dict[str, Any]]) -> str:
-        """
-        Format responses for summary generation
-        """
-        formatted = []
-        for i, response in enumerate(responses[:3]):  # Include top 3 responses
-            evaluation = response.get('evaluation', {})
-            score = evaluation.get('score', 0)
-            feedback = evaluation.get('feedback', 'No feedback')
-            formatted.append(f"Q{i+1} (Score: {score}/10): {feedback[:100]}...")
-        
-        return "\n".join(formatted)
-    
     # ============================================================
     # SESSION MANAGEMENT METHODS (NEW)
     # ============================================================
@@ -820,12 +1114,12 @@ class AIScreeningService:
         Returns:
             Questions with bias_check field added
         """
-        for question in questions:
-            question_text = question.get("question", "")
-            
-            # Run bias detection
-            biases = await self.bias_detector.detect_bias(question_text, use_llm=True)
-            
+        # Run bias detection for all questions concurrently
+        bias_results = await self.bias_detector.detect_bias_batch(
+            [question.get("question", "") for question in questions], use_llm=True
+        )
+        
+        for question, biases in zip(questions, bias_results):
             if biases:
                 # Add bias warnings to question
                 question["bias_warnings"] = [
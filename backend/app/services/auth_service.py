@@ -2,34 +2,49 @@
 Authentication Service
 Handles JWT token generation, password hashing, and verification
 """
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import time
+import jwt
+from jwt import InvalidTokenError as JWTError
+import bcrypt
 
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def _password_bytes(password: str) -> bytes:
+    """Encode a password for bcrypt, truncating to the 72-byte limit."""
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a plain password using bcrypt.
     
+    This is CPU-bound (~100ms at 12 rounds); call it via asyncio.to_thread
+    from async endpoints.
+    
     Args:
         password: Plain text password
         
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(_password_bytes(password), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
     
+    This is CPU-bound (~100ms at 12 rounds); call it via asyncio.to_thread
+    from async endpoints.
+    
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password from database
@@ -37,7 +52,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(_password_bytes(plain_password), hashed_password.encode("utf-8"))
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -60,14 +79,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     if "sub" in to_encode and isinstance(to_encode["sub"], int):
         to_encode["sub"] = str(to_encode["sub"])
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Read the clock once; numeric exp/iat skip datetime conversion in the encoder
+    now = int(time.time())
+    delta = expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + int(delta.total_seconds()),
+        "iat": now,
         "type": "access"
     })
     
@@ -75,10 +93,29 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> dict:
+    """
+    Verify signature and decode a JWT, memoized by token string.
+    
+    Tokens are self-authenticating, so a payload that verified once stays
+    valid until it expires; decode_token re-checks expiry on every call.
+    Invalid tokens raise and are therefore never cached.
+    """
+    return jwt.decode(
+        token,
+        settings.SECRET_KEY,
+        algorithms=[settings.ALGORITHM]
+    )
+
+
 def decode_token(token: str) -> dict:
     """
     Decode and verify a JWT token.
     
+    Repeated calls with the same token are served from an LRU cache instead
+    of re-running HMAC verification; expiry is still checked on every call.
+    
     Args:
         token: JWT token string
         
@@ -89,14 +126,16 @@ def decode_token(token: str) -> dict:
         JWTError: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        return payload
+        payload = _decode_token_cached(token)
     except JWTError as e:
         raise JWTError(f"Token validation failed: {str(e)}")
+    
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise JWTError("Token validation failed: Signature has expired.")
+    
+    # Copy so callers cannot mutate the cached payload
+    return dict(payload)
 
 
 def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -116,14 +155,13 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     if "sub" in to_encode and isinstance(to_encode["sub"], int):
         to_encode["sub"] = str(to_encode["sub"])
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=7)
+    # Read the clock once; numeric exp/iat skip datetime conversion in the encoder
+    now = int(time.time())
+    delta = expires_delta or timedelta(days=7)
     
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
+        "exp": now + int(delta.total_seconds()),
+        "iat": now,
         "type": "refresh"
     })
     
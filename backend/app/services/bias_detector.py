@@ -12,16 +12,103 @@ Detects bias in:
 - Screening feedback
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from enum import Enum
+import asyncio
 import re
 import logging
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 
-from app.services.llm_provider import get_llm_service, LLMOptions
+import msgspec
+
+try:
+    import hyperscan
+except ImportError:  # Optional native dependency (x86 only)
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: pyahocorasick
+    ahocorasick = None
+
+from app.services.llm_provider import get_llm_service, LLMOptions, extract_json_object
 
 logger = logging.getLogger(__name__)
 
+# Static prompt header. Kept byte-identical across calls with the analyzed text
+# appended last, so the LLM server can reuse its KV cache for the shared prefix.
+BIAS_PROMPT_HEADER = """Analyze the text at the end of this prompt for potential hiring bias across these protected categories:
+1. Gender
+2. Age
+3. Race/Ethnicity
+4. Disability
+5. Religion
+6. Nationality
+7. Family Status
+
+Look for:
+- Direct references to protected categories
+- Subtle language that may exclude certain groups
+- Implicit assumptions or stereotypes
+- Coded language or dog whistles
+
+Return ONLY valid JSON in this format:
+{
+    "biases": [
+        {
+            "category": "gender|age|race|disability|religion|nationality|family_status",
+            "severity": "low|medium|high",
+            "text_snippet": "exact quoted text showing bias",
+            "explanation": "why this is biased",
+            "suggestion": "how to rephrase",
+            "confidence": 0.0-1.0
+        }
+    ]
+}
+
+If no bias detected, return: {"biases": []}
+"""
+
+# Variant of the header for several numbered texts in one request
+BIAS_MULTI_PROMPT_HEADER = """Analyze each numbered text at the end of this prompt for potential hiring bias across these protected categories:
+1. Gender
+2. Age
+3. Race/Ethnicity
+4. Disability
+5. Religion
+6. Nationality
+7. Family Status
+
+Look for:
+- Direct references to protected categories
+- Subtle language that may exclude certain groups
+- Implicit assumptions or stereotypes
+- Coded language or dog whistles
+
+Return ONLY valid JSON with one entry per text, in this format:
+{
+    "results": [
+        {
+            "index": 0,
+            "biases": [
+                {
+                    "category": "gender|age|race|disability|religion|nationality|family_status",
+                    "severity": "low|medium|high",
+                    "text_snippet": "exact quoted text showing bias",
+                    "explanation": "why this is biased",
+                    "suggestion": "how to rephrase",
+                    "confidence": 0.0-1.0
+                }
+            ]
+        }
+    ]
+}
+
+Use "biases": [] for texts without bias.
+"""
+
 
 class BiasCategory(str, Enum):
     """Protected categories for bias detection"""
@@ -34,9 +121,9 @@ class BiasCategory(str, Enum):
     FAMILY_STATUS = "family_status"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BiasDetection:
-    """Single bias detection result"""
+    """Single bias detection result (immutable, so scan results can be cached)"""
     category: BiasCategory
     severity: str  # "low", "medium", "high"
     text_snippet: str
@@ -46,6 +133,291 @@ class BiasDetection:
     confidence: float  # 0.0 to 1.0
 
 
+class LLMBiasItem(msgspec.Struct):
+    """One entry of the LLM's "biases" array (validated on its own)"""
+    category: BiasCategory
+    severity: str
+    text_snippet: str
+    explanation: str
+    suggestion: str
+    confidence: float = 0.7
+
+
+# Envelopes keep their entries raw, so one malformed item (an unknown
+# category, a confidence sent as a string) is skipped instead of failing
+# the whole response, which in a multi-text request covers several texts
+
+
+class LLMBiasResult(msgspec.Struct):
+    """LLM response for a single analyzed text"""
+    biases: List[Any] = []
+
+
+class LLMBiasMultiEntry(msgspec.Struct):
+    """Per-text entry of a multi-text LLM response"""
+    index: int
+    biases: List[Any] = []
+
+
+class LLMBiasMultiResult(msgspec.Struct):
+    """LLM response for several numbered texts"""
+    results: List[Any] = []
+
+
+_BIAS_RESULT_DECODER = msgspec.json.Decoder(LLMBiasResult)
+_BIAS_MULTI_RESULT_DECODER = msgspec.json.Decoder(LLMBiasMultiResult)
+
+
+def _decode_llm_json(content: str, decoder: msgspec.json.Decoder):
+    """
+    Decode the envelope of LLM output in one native pass.
+    
+    Entries are left raw for per-item validation. Falls back to extracting the embedded object when the model wrapped
+    the JSON in prose.
+    
+    Raises:
+        msgspec.ValidationError: If the envelope does not match the schema
+        json.JSONDecodeError: If no JSON object can be found
+    """
+    try:
+        return decoder.decode(content)
+    except msgspec.ValidationError:
+        raise
+    except msgspec.DecodeError:
+        return msgspec.convert(extract_json_object(content), type=decoder.type)
+
+
+def _build_combined_pattern(patterns: Dict[BiasCategory, List[str]]) -> re.Pattern:
+    """
+    Fuse every category's patterns into one alternation.
+    
+    Used as a prefilter only: it finds a match wherever any single pattern
+    does, so texts without any hit (the common case) are ruled out in one
+    scan. It cannot report hits itself, because an alternation yields one
+    match per span while overlapping hits from different patterns (e.g.
+    RACE "native speaker" and NATIONALITY "native") must all be raised.
+    """
+    return re.compile(
+        "|".join(pattern for category_patterns in patterns.values() for pattern in category_patterns),
+        re.IGNORECASE
+    )
+
+
+def _compile_patterns(
+    patterns: Dict[BiasCategory, List[str]]
+) -> List[Tuple[BiasCategory, re.Pattern]]:
+    """
+    Compile every pattern on its own, indexed by expression id.
+    
+    Expression ids (position in category, then pattern order) are shared by
+    all scanning backends and define the order hits are reported in.
+    """
+    return [
+        (category, re.compile(pattern, re.IGNORECASE))
+        for category, category_patterns in patterns.items()
+        for pattern in category_patterns
+    ]
+
+
+def _build_hyperscan_database(
+    patterns: Dict[BiasCategory, List[str]]
+) -> Optional[Tuple[Any, List[BiasCategory]]]:
+    """
+    Compile all patterns into a Hyperscan block-mode database.
+    
+    Returns:
+        (database, category per expression id), or None when Hyperscan is
+        not installed or fails to compile the patterns
+    """
+    if hyperscan is None:
+        return None
+    
+    expressions, categories = [], []
+    for category, category_patterns in patterns.items():
+        for pattern in category_patterns:
+            expressions.append(pattern.encode("ascii"))
+            categories.append(category)
+    
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions)
+        )
+    except Exception as e:
+        logger.warning(f"Hyperscan compile failed, using re for bias scanning: {e}")
+        return None
+    
+    logger.info(f"Bias patterns compiled with Hyperscan ({len(expressions)} expressions)")
+    return database, categories
+
+
+# Patterns of the form \b(word|multi word|...)\b whose only regex syntax is an
+# optional letter ("years?"), so they can be expanded into plain keywords
+_LITERAL_ALTERNATION = re.compile(r"^\\b\(([A-Za-z \-|?]+)\)\\b$")
+_OPTIONAL_LETTER = re.compile(r"([A-Za-z])\?")
+
+
+def _literal_keywords(pattern: str) -> Optional[List[str]]:
+    """
+    Expand a word-list pattern into its lowercased literal keywords.
+    
+    ``\b(years? of birth|age)\b`` -> ["year of birth", "years of birth", "age"].
+    
+    Returns:
+        Keywords, or None if the pattern needs a real regex engine
+    """
+    literal = _LITERAL_ALTERNATION.match(pattern)
+    if literal is None:
+        return None
+    
+    keywords = []
+    for alternative in literal.group(1).lower().split("|"):
+        # Every "?" must make a single letter optional
+        parts = _OPTIONAL_LETTER.split(alternative)
+        if "?" in "".join(parts[::2]):
+            return None
+        
+        variants = [""]
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                variants = [variant + part for variant in variants]
+            else:
+                variants = [variant + suffix for variant in variants for suffix in ("", part)]
+        keywords.extend(variants)
+    return keywords
+
+
+# Direct protected category references are high severity
+_HIGH_SEVERITY_TERMS = (
+    "age", "race", "religion", "disability", "pregnant", "married",
+    "citizenship", "visa", "gender", "ethnicity"
+)
+
+_GENDERED_PRONOUNS = frozenset({"he", "she", "his", "her"})
+
+_SUGGESTIONS = {
+    BiasCategory.GENDER: "Use gender-neutral terms (they/them, person, candidate)",
+    BiasCategory.AGE: "Focus on experience and skills, not age",
+    BiasCategory.RACE: "Remove references to race, ethnicity, or national origin",
+    BiasCategory.DISABILITY: "Focus on job requirements, not physical abilities",
+    BiasCategory.RELIGION: "Remove religious references unless bona fide requirement",
+    BiasCategory.NATIONALITY: "Remove citizenship/visa requirements unless legally required",
+    BiasCategory.FAMILY_STATUS: "Remove family/marital status questions"
+}
+
+
+def _assess_severity(category: BiasCategory, matched_text: str) -> str:
+    """Assess severity of bias (low/medium/high)"""
+    matched_lower = matched_text.lower()
+    
+    if any(term in matched_lower for term in _HIGH_SEVERITY_TERMS):
+        return "high"
+    
+    # Gendered pronouns are medium
+    if category == BiasCategory.GENDER and matched_lower in _GENDERED_PRONOUNS:
+        return "medium"
+    
+    return "low"
+
+
+def _get_suggestion(category: BiasCategory) -> str:
+    """Get suggestion for neutral phrasing"""
+    return _SUGGESTIONS.get(category, "Rephrase to focus on job requirements")
+
+
+def _build_match_table(
+    patterns: Dict[BiasCategory, List[str]]
+) -> Dict[Tuple[BiasCategory, str], Tuple[str, str]]:
+    """
+    Precompute (severity, suggestion) for every literal keyword.
+    
+    Keyed by (category, lowercased keyword); hits from patterns that
+    cannot be expanded into keywords are assessed per match.
+    """
+    table = {}
+    for category, category_patterns in patterns.items():
+        for pattern in category_patterns:
+            for keyword in _literal_keywords(pattern) or []:
+                table[(category, keyword)] = (
+                    _assess_severity(category, keyword), _get_suggestion(category)
+                )
+    return table
+
+
+def _build_keyword_automaton(
+    patterns: Dict[BiasCategory, List[str]]
+) -> Optional[Tuple[Any, List[int]]]:
+    """
+    Build an Aho-Corasick automaton over every literal keyword.
+    
+    Each keyword maps to the expression ids of all patterns containing it.
+    Patterns that need a real regex engine are left to their compiled
+    regex (currently none; word boundaries are checked by hand).
+    
+    Returns:
+        (automaton, residual expression ids), or None when pyahocorasick
+        is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    owners: Dict[str, List[int]] = {}
+    residual: List[int] = []
+    expression_id = 0
+    
+    for category_patterns in patterns.values():
+        for pattern in category_patterns:
+            keywords_in_pattern = _literal_keywords(pattern)
+            if keywords_in_pattern is None:
+                residual.append(expression_id)
+            else:
+                for keyword in keywords_in_pattern:
+                    owners.setdefault(keyword, []).append(expression_id)
+            expression_id += 1
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, expression_ids in owners.items():
+        automaton.add_word(keyword, (keyword, tuple(expression_ids)))
+    automaton.make_automaton()
+    logger.info(
+        f"Bias keywords compiled with Aho-Corasick ({len(owners)} keywords, "
+        f"{len(residual)} residual patterns)"
+    )
+    return automaton, residual
+
+
+def _is_word_char(char: str) -> bool:
+    """
+    Same notion of a word character as regex \\w.
+    
+    Two of these index checks per keyword hit replace evaluating \\b at
+    every position of the text.
+    """
+    return char.isalnum() or char == "_"
+
+
+def _select_non_overlapping(hits: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """
+    Reduce raw (expression id, start, end) hits to what re.finditer reports.
+    
+    Overlaps are resolved within each expression only, leftmost first, so
+    hits of different patterns may overlap (as with one finditer per
+    pattern). Returned in expression id order, then text order.
+    """
+    selected = []
+    last_expression, last_end = -1, -1
+    for expression_id, start, end in sorted(hits, key=lambda h: (h[0], h[1], -h[2])):
+        if expression_id != last_expression:
+            last_expression, last_end = expression_id, -1
+        if start >= last_end:
+            selected.append((expression_id, start, end))
+            last_end = end
+    return selected
+
+
 class BiasDetector:
     """
     Dual-layer bias detection system for fair hiring.
@@ -104,6 +476,28 @@ class BiasDetector:
         ]
     }
     
+    # Every pattern compiled once; the list index is the expression id
+    COMPILED_PATTERNS = _compile_patterns(BIAS_PATTERNS)
+    
+    # Single pass that rules out texts without any hit
+    COMBINED_PATTERN = _build_combined_pattern(BIAS_PATTERNS)
+    
+    # (category, keyword) -> (severity, suggestion) for every literal keyword
+    MATCH_TABLE = _build_match_table(BIAS_PATTERNS)
+    
+    # Optional DFA-based multi-pattern scanner (None when hyperscan is unavailable)
+    HYPERSCAN_DB = _build_hyperscan_database(BIAS_PATTERNS)
+    _hyperscan_lock = threading.Lock()
+    
+    # Optional literal-keyword scanner (None when pyahocorasick is unavailable)
+    KEYWORD_AUTOMATON = _build_keyword_automaton(BIAS_PATTERNS)
+    
+    # Batches larger than this run the rule-based scan in a worker thread
+    RULE_BASED_THREAD_THRESHOLD = 64
+    
+    # Rough input-token budget for texts packed into one LLM request
+    LLM_BATCH_MAX_TOKENS = 6000
+    
     def __init__(self):
         """Initialize bias detector with LLM service"""
         self.llm_service = get_llm_service()
@@ -124,29 +518,123 @@ class BiasDetector:
             )
             # Returns: [BiasDetection(category=FAMILY_STATUS, ...)]
         """
-        detections = []
-        text_lower = text.lower()
-        
-        for category, patterns in self.BIAS_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-                for match in matches:
-                    snippet = self._extract_snippet(text, match.start(), match.end())
-                    
-                    detection = BiasDetection(
-                        category=category,
-                        severity=self._assess_severity(category, match.group()),
-                        text_snippet=snippet,
-                        explanation=f"Detected {category.value} bias: '{match.group()}'",
-                        suggestion=self._get_suggestion(category, match.group()),
-                        detection_method="rule_based",
-                        confidence=0.9  # High confidence for pattern matches
-                    )
-                    detections.append(detection)
+        detections = list(self._scan_rule_based(text))
         
         logger.info(f"Rule-based: Found {len(detections)} bias indicators")
         return detections
     
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _scan_rule_based(cls, text: str) -> Tuple[BiasDetection, ...]:
+        """
+        Pure pattern scan, memoized by text.
+        
+        The same question templates get analyzed over and over, so repeat
+        texts are answered from the cache. Returns a tuple so cached results
+        cannot be mutated by callers.
+        """
+        detections = []
+        
+        for start, end, category in cls._scan_patterns(text):
+            matched_text = text[start:end].lower()
+            snippet = cls._extract_snippet(text, start, end)
+            
+            assessment = cls.MATCH_TABLE.get((category, matched_text))
+            if assessment is None:
+                assessment = (_assess_severity(category, matched_text), _get_suggestion(category))
+            severity, suggestion = assessment
+            
+            detection = BiasDetection(
+                category=category,
+                severity=severity,
+                text_snippet=snippet,
+                explanation=f"Detected {category.value} bias: '{matched_text}'",
+                suggestion=suggestion,
+                detection_method="rule_based",
+                confidence=0.9  # High confidence for pattern matches
+            )
+            detections.append(detection)
+        
+        return tuple(detections)
+    
+    @classmethod
+    def _scan_patterns(cls, text: str) -> List[Tuple[int, int, BiasCategory]]:
+        """
+        Find all bias pattern hits as (start, end, category).
+        
+        Every backend reports exactly what one re.finditer per pattern
+        would, in pattern order, then text order. Prefers Hyperscan for
+        ASCII text (byte offsets equal character offsets there), then the
+        Aho-Corasick keyword scan, then the per-pattern regexes.
+        """
+        if cls.HYPERSCAN_DB is not None and text.isascii():
+            hits = cls._scan_hyperscan(text)
+        elif cls.KEYWORD_AUTOMATON is not None:
+            hits = cls._scan_keywords(text)
+        else:
+            hits = cls._scan_regex(text)
+        return [
+            (start, end, cls.COMPILED_PATTERNS[expression_id][0])
+            for expression_id, start, end in hits
+        ]
+    
+    @classmethod
+    def _scan_regex(
+        cls,
+        text: str,
+        expression_ids: Optional[List[int]] = None
+    ) -> List[Tuple[int, int, int]]:
+        """Scan with the compiled patterns (all of them, or the given expression ids)"""
+        if expression_ids is None:
+            if cls.COMBINED_PATTERN.search(text) is None:
+                return []
+            expression_ids = range(len(cls.COMPILED_PATTERNS))
+        return [
+            (expression_id, match.start(), match.end())
+            for expression_id in expression_ids
+            for match in cls.COMPILED_PATTERNS[expression_id][1].finditer(text)
+        ]
+    
+    @classmethod
+    def _scan_hyperscan(cls, text: str) -> List[Tuple[int, int, int]]:
+        """Scan ASCII text with the Hyperscan database"""
+        database, _ = cls.HYPERSCAN_DB
+        raw_hits: List[Tuple[int, int, int]] = []
+        
+        def on_match(expression_id, start, end, flags, context):
+            raw_hits.append((expression_id, start, end))
+        
+        # Hyperscan scratch space is per database and not thread-safe
+        with cls._hyperscan_lock:
+            database.scan(text.encode("ascii"), match_event_handler=on_match)
+        
+        # Hyperscan reports every overlapping hit
+        return _select_non_overlapping(raw_hits)
+    
+    @classmethod
+    def _scan_keywords(cls, text: str) -> List[Tuple[int, int, int]]:
+        """Scan with the Aho-Corasick automaton plus the residual patterns"""
+        automaton, residual = cls.KEYWORD_AUTOMATON
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Case folding changed the length, offsets would not line up
+            return cls._scan_regex(text)
+        
+        raw_hits: List[Tuple[int, int, int]] = []
+        for end_index, (keyword, expression_ids) in automaton.iter(lowered):
+            start, end = end_index - len(keyword) + 1, end_index + 1
+            # Word boundaries, equivalent to the patterns' \b...\b
+            if start > 0 and _is_word_char(lowered[start - 1]):
+                continue
+            if end < len(lowered) and _is_word_char(lowered[end]):
+                continue
+            raw_hits.extend((expression_id, start, end) for expression_id in expression_ids)
+        
+        if residual:
+            raw_hits.extend(cls._scan_regex(text, residual))
+        
+        return _select_non_overlapping(raw_hits)
+    
     async def detect_bias_llm(self, text: str) -> List[BiasDetection]:
         """
         LLM-based bias detection for subtle biases.
@@ -163,40 +651,11 @@ class BiasDetector:
             )
             # May detect age bias (subtle "young person" implication)
         """
-        prompt = f"""Analyze the following text for potential hiring bias across these protected categories:
-1. Gender
-2. Age
-3. Race/Ethnicity
-4. Disability
-5. Religion
-6. Nationality
-7. Family Status
-
+        # Static header first, then the text under analysis
+        prompt = BIAS_PROMPT_HEADER + f'''
 TEXT TO ANALYZE:
-\"\"\"{text}\"\"\"
-
-Look for:
-- Direct references to protected categories
-- Subtle language that may exclude certain groups
-- Implicit assumptions or stereotypes
-- Coded language or dog whistles
-
-Return ONLY valid JSON in this format:
-{{
-    "biases": [
-        {{
-            "category": "gender|age|race|disability|religion|nationality|family_status",
-            "severity": "low|medium|high",
-            "text_snippet": "exact quoted text showing bias",
-            "explanation": "why this is biased",
-            "suggestion": "how to rephrase",
-            "confidence": 0.0-1.0
-        }}
-    ]
-}}
-
-If no bias detected, return: {{"biases": []}}
-"""
+"""{text}"""
+'''
         
         try:
             options = LLMOptions(
@@ -208,21 +667,9 @@ If no bias detected, return: {{"biases": []}}
             llm_response = await self.llm_service.generate(prompt, options)
             
             if llm_response and llm_response.content:
-                import json
-                result = json.loads(llm_response.content)
+                result = _decode_llm_json(llm_response.content, _BIAS_RESULT_DECODER)
                 
-                detections = []
-                for bias in result.get("biases", []):
-                    detection = BiasDetection(
-                        category=BiasCategory(bias["category"]),
-                        severity=bias["severity"],
-                        text_snippet=bias["text_snippet"],
-                        explanation=bias["explanation"],
-                        suggestion=bias["suggestion"],
-                        detection_method="llm_based",
-                        confidence=bias.get("confidence", 0.7)
-                    )
-                    detections.append(detection)
+                detections = self._parse_llm_biases(result.biases)
                 
                 logger.info(f"LLM-based: Found {len(detections)} bias indicators using {llm_response.provider}")
                 return detections
@@ -233,6 +680,103 @@ If no bias detected, return: {{"biases": []}}
             logger.error(f"LLM bias detection failed: {str(e)}")
             return []
     
+    async def _detect_bias_llm_multi(self, texts: List[str]) -> List[List[BiasDetection]]:
+        """
+        LLM-based bias detection for several texts in a single request.
+        
+        Args:
+            texts: Texts to analyze (keep within LLM_BATCH_MAX_TOKENS)
+        
+        Returns:
+            List of BiasDetection lists, one per text in input order
+        """
+        if len(texts) == 1:
+            return [await self.detect_bias_llm(texts[0])]
+        
+        results: List[List[BiasDetection]] = [[] for _ in texts]
+        
+        # Static header first, then the numbered texts
+        numbered = "\n".join(f"[{i}]: {text}" for i, text in enumerate(texts))
+        prompt = BIAS_MULTI_PROMPT_HEADER + f"\nTEXTS:\n{numbered}\n"
+        
+        try:
+            options = LLMOptions(
+                temperature=0.3,  # Low temp for consistent detection
+                max_tokens=min(1000 * len(texts), 8000),
+                response_format="json"
+            )
+            
+            llm_response = await self.llm_service.generate(prompt, options)
+            
+            if llm_response and llm_response.content:
+                result = _decode_llm_json(llm_response.content, _BIAS_MULTI_RESULT_DECODER)
+                
+                for raw_entry in result.results:
+                    try:
+                        entry = msgspec.convert(raw_entry, LLMBiasMultiEntry, strict=False)
+                    except msgspec.ValidationError as e:
+                        logger.warning(f"Skipping malformed LLM bias entry: {e}")
+                        continue
+                    if 0 <= entry.index < len(texts):
+                        results[entry.index] = self._parse_llm_biases(entry.biases)
+                
+                logger.info(
+                    f"LLM-based: Found {sum(len(r) for r in results)} bias indicators "
+                    f"across {len(texts)} texts using {llm_response.provider}"
+                )
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"LLM multi-text bias detection failed: {str(e)}")
+            return results
+    
+    @staticmethod
+    def _parse_llm_biases(items: List[Any]) -> List[BiasDetection]:
+        """Validate raw LLM bias items one by one into BiasDetection objects, skipping bad ones"""
+        detections = []
+        for item in items:
+            try:
+                # Lax mode accepts numbers sent as strings ("0.8")
+                bias = msgspec.convert(item, LLMBiasItem, strict=False)
+            except msgspec.ValidationError as e:
+                logger.warning(f"Skipping malformed LLM bias item: {e}")
+                continue
+            detections.append(BiasDetection(
+                category=bias.category,
+                severity=bias.severity,
+                text_snippet=bias.text_snippet,
+                explanation=bias.explanation,
+                suggestion=bias.suggestion,
+                detection_method="llm_based",
+                confidence=bias.confidence
+            ))
+        return detections
+    
+    @classmethod
+    def _chunk_by_tokens(cls, texts: List[str]) -> List[List[int]]:
+        """
+        Group text indices into batches of at most LLM_BATCH_MAX_TOKENS.
+        
+        Uses the rough 1 token ≈ 4 chars estimate; a text larger than the
+        budget gets a batch of its own.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        
+        for i, text in enumerate(texts):
+            tokens = len(text) // 4 + 1
+            if current and current_tokens + tokens > cls.LLM_BATCH_MAX_TOKENS:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        
+        if current:
+            batches.append(current)
+        return batches
+    
     async def detect_bias(self, text: str, use_llm: bool = True) -> List[BiasDetection]:
         """
         Combined bias detection (rule-based + LLM).
@@ -266,42 +810,72 @@ If no bias detected, return: {{"biases": []}}
         logger.info(f"Combined: {len(deduplicated)} unique biases detected")
         return deduplicated
     
-    def _extract_snippet(self, text: str, start: int, end: int, context_chars: int = 50) -> str:
+    async def detect_bias_batch(
+        self,
+        texts: List[str],
+        use_llm: bool = True,
+        max_concurrency: int = 16
+    ) -> List[List[BiasDetection]]:
+        """
+        Combined bias detection for many texts with concurrent LLM calls.
+        
+        Args:
+            texts: Texts to analyze
+            use_llm: Whether to include LLM-based detection (default True)
+            max_concurrency: Maximum LLM requests in flight at once (each
+                request covers a token-bounded batch of texts)
+        
+        Returns:
+            Deduplicated detections per text, in input order
+        
+        Example:
+            results = await detector.detect_bias_batch(
+                [q["question"] for q in questions]
+            )
+        """
+        # Rule-based is fast; only move large batches off the event loop
+        if len(texts) > self.RULE_BASED_THREAD_THRESHOLD:
+            rule_results = await asyncio.to_thread(
+                lambda: [self.detect_bias_rule_based(text) for text in texts]
+            )
+        else:
+            rule_results = [self.detect_bias_rule_based(text) for text in texts]
+        
+        if not use_llm:
+            return rule_results
+        
+        # Pack texts into token-bounded multi-text prompts, run those concurrently
+        semaphore = asyncio.Semaphore(max_concurrency)
+        batches = self._chunk_by_tokens(texts)
+        
+        async def bounded_llm(indices: List[int]) -> List[List[BiasDetection]]:
+            async with semaphore:
+                return await self._detect_bias_llm_multi([texts[i] for i in indices])
+        
+        batch_results = await asyncio.gather(*(bounded_llm(indices) for indices in batches))
+        
+        llm_results: List[List[BiasDetection]] = [[] for _ in texts]
+        for indices, detections in zip(batches, batch_results):
+            for i, text_detections in zip(indices, detections):
+                llm_results[i] = text_detections
+        
+        results = [
+            self._deduplicate_detections(rule_detections + llm_detections)
+            for rule_detections, llm_detections in zip(rule_results, llm_results)
+        ]
+        
+        logger.info(
+            f"Batch: {sum(len(r) for r in results)} unique biases detected across {len(texts)} texts"
+        )
+        return results
+    
+    @staticmethod
+    def _extract_snippet(text: str, start: int, end: int, context_chars: int = 50) -> str:
         """Extract text snippet with context around match"""
         snippet_start = max(0, start - context_chars)
         snippet_end = min(len(text), end + context_chars)
         return "..." + text[snippet_start:snippet_end].strip() + "..."
     
-    def _assess_severity(self, category: BiasCategory, matched_text: str) -> str:
-        """Assess severity of bias (low/medium/high)"""
-        # Direct protected category references are high severity
-        high_severity_terms = [
-            "age", "race", "religion", "disability", "pregnant", "married",
-            "citizenship", "visa", "gender", "ethnicity"
-        ]
-        
-        if any(term in matched_text.lower() for term in high_severity_terms):
-            return "high"
-        
-        # Gendered pronouns are medium
-        if category == BiasCategory.GENDER and matched_text.lower() in ["he", "she", "his", "her"]:
-            return "medium"
-        
-        return "low"
-    
-    def _get_suggestion(self, category: BiasCategory, matched_text: str) -> str:
-        """Get suggestion for neutral phrasing"""
-        suggestions = {
-            BiasCategory.GENDER: "Use gender-neutral terms (they/them, person, candidate)",
-            BiasCategory.AGE: "Focus on experience and skills, not age",
-            BiasCategory.RACE: "Remove references to race, ethnicity, or national origin",
-            BiasCategory.DISABILITY: "Focus on job requirements, not physical abilities",
-            BiasCategory.RELIGION: "Remove religious references unless bona fide requirement",
-            BiasCategory.NATIONALITY: "Remove citizenship/visa requirements unless legally required",
-            BiasCategory.FAMILY_STATUS: "Remove family/marital status questions"
-        }
-        return suggestions.get(category, "Rephrase to focus on job requirements")
-    
     def _deduplicate_detections(self, detections: List[BiasDetection]) -> List[BiasDetection]:
         """Remove duplicate detections (prefer higher confidence)"""
         # Group by category + text_snippet
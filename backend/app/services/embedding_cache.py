@@ -0,0 +1,141 @@
+"""
+Persistent Embedding Cache
+
+Second tier behind EmbeddingService's in-process LRU. Embeddings are stored in
+Redis as raw float32 bytes keyed by sha256(text), so re-uploaded resumes,
+repeated RAG queries and unchanged job texts skip the model pass across
+restarts and across worker processes.
+
+Keys are namespaced by the embedding fingerprint (model, dimension, tokenizer,
+normalization), so vectors of a previous model are never served.
+
+Lookups only run on the embedding worker thread, never on the event loop or
+request threads, so this uses the blocking redis client. As in
+EvaluationCache, an unreachable Redis disables the tier for
+REDIS_RETRY_SECONDS before it is tried again.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+import hashlib
+import logging
+import time
+
+import numpy as np
+import orjson
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Redis-backed, content-addressed cache of float32 embeddings.
+    """
+
+    KEY_PREFIX = "emb"
+    # After a Redis error, skip the tier for this long, then retry
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(self, fingerprint: Dict[str, Any], dimension: int, ttl_seconds: int = 7 * 86400):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            fingerprint: EmbeddingService.fingerprint of the producing model
+            dimension: Embedding dimension (entries of another size are ignored)
+            ttl_seconds: Expiry for entries in Redis
+        """
+        self.dimension = dimension
+        self.ttl_seconds = ttl_seconds
+        space = hashlib.sha256(orjson.dumps(fingerprint, option=orjson.OPT_SORT_KEYS)).hexdigest()[:16]
+        self._namespace = f"{self.KEY_PREFIX}:{space}"
+
+        self._redis: Optional[redis.Redis] = None
+        self._redis_retry_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        """Build the cache key for a text (exact text, as it is passed to the model)."""
+        return f"{self._namespace}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+    def _get_redis(self) -> Optional[redis.Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL, socket_connect_timeout=1, socket_timeout=1
+            )
+        return self._redis
+
+    def _disable_redis(self, error: Exception):
+        logger.warning(
+            f"Redis unavailable for embedding cache, using in-process cache only "
+            f"for {self.REDIS_RETRY_SECONDS:.0f}s: {error}"
+        )
+        self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            One read-only float32 array per text, or None on miss
+        """
+        client = self._get_redis()
+        if client is None or not texts:
+            return [None] * len(texts)
+        try:
+            values = client.mget([self.key(text) for text in texts])
+        except Exception as e:
+            self._disable_redis(e)
+            return [None] * len(texts)
+
+        results: List[Optional[np.ndarray]] = []
+        for value in values:
+            if value is not None and len(value) == self.dimension * 4:
+                results.append(np.frombuffer(value, dtype=np.float32))
+                self.hits += 1
+            else:
+                results.append(None)
+                self.misses += 1
+        return results
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[np.ndarray]):
+        """
+        Store embeddings.
+
+        Args:
+            texts: Embedded texts
+            embeddings: Embedding of each text
+        """
+        client = self._get_redis()
+        if client is None or not texts:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for text, embedding in zip(texts, embeddings):
+                pipe.set(
+                    self.key(text),
+                    np.asarray(embedding, dtype=np.float32).tobytes(),
+                    ex=self.ttl_seconds
+                )
+            pipe.execute()
+        except Exception as e:
+            self._disable_redis(e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for observability."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "available": time.monotonic() >= self._redis_retry_at
+        }
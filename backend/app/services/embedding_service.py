@@ -16,15 +16,32 @@ Dimensions: 768 (BERT-base)
 Use Cases: Job descriptions, resumes, skills matching, candidate ranking
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+import hashlib
+import json
 import logging
+import math
+import threading
 from sentence_transformers import SentenceTransformer
 import numpy as np
-from functools import lru_cache
 import torch
 
+from app.core.config import settings
+from app.services.embedding_cache import EmbeddingCache
+
 logger = logging.getLogger(__name__)
 
+# Marks the inference worker thread; only it may block on the Redis tier
+_inference_thread = threading.local()
+
+
+def _mark_inference_thread():
+    _inference_thread.active = True
+
 
 def get_optimal_device() -> str:
     """
@@ -56,44 +73,92 @@ class EmbeddingService:
     """
     Service for generating job-specific embeddings using JobBERT-v3.
     
-    This service uses a singleton pattern with LRU caching to avoid
-    loading the model multiple times, which would consume excessive memory.
+    The model, its device and the embedding cache are class-level state
+    loaded exactly once per process (double-checked lock), so any number of
+    instances share one ~400MB model. Prefer get_embedding_service().
+    
+    Invariant: every non-empty embedding it returns is L2-normalized (unit
+    length), so the cosine similarity of two of them is just their dot
+    product. Empty texts map to the zero vector.
     """
     
-    _instance: Optional['EmbeddingService'] = None
     _model: Optional[SentenceTransformer] = None
     _embedding_dim: Optional[int] = None
     _device: Optional[str] = None
+    _fingerprint: Optional[Dict[str, Any]] = None
+    _model_lock = threading.Lock()
+    
+    # Embeddings memoized by blake2b(text); bounded LRU shared by all instances
+    _cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    CACHE_MAX_ENTRIES = 10_000
+    # Persistent second tier in Redis, shared across restarts and workers
+    _persistent_cache: Optional[EmbeddingCache] = None
+    
+    # Single worker that runs all async-requested inference, so the event loop
+    # never blocks on encode() and concurrent callers queue instead of
+    # contending for the GIL across threads
+    _executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="embedding", initializer=_mark_inference_thread
+    )
     
     MODEL_NAME = "TechWolf/JobBERT-v3"
     EXPECTED_DIMENSION = 768  # JobBERT-v3 actually outputs 768-dim (BERT-base)
+    # Bump when post-processing of embeddings changes (1 = L2-normalized)
+    NORMALIZATION_VERSION = 1
+    
+    # Micro-batching of concurrent async single-text requests
+    MICROBATCH_MAX_SIZE = 32
+    MICROBATCH_MAX_WAIT = 0.005  # seconds
     
-    def __new__(cls):
-        """Implement singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super(EmbeddingService, cls).__new__(cls)
-        return cls._instance
+    # Long texts are embedded as the token-weighted mean of up to this many
+    # max_seq_length windows instead of being truncated to the first one
+    LONG_TEXT_MAX_CHUNKS = 8
     
     def __init__(self):
-        """Initialize the embedding service (loads model on first call with GPU optimization)."""
-        if self._model is None:
+        """Initialize the embedding service (loads model on first use with GPU optimization)."""
+        self._load_model()
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+    
+    @classmethod
+    def _load_model(cls):
+        """Load JobBERT-v3 once per process, even under concurrent first use."""
+        if cls._model is not None:
+            return
+        
+        with cls._model_lock:
+            if cls._model is not None:
+                return
+            
             # Detect optimal device
-            self._device = get_optimal_device()
+            device = get_optimal_device()
             
-            logger.info(f"Loading JobBERT-v3 model: {self.MODEL_NAME}")
+            logger.info(f"Loading JobBERT-v3 model: {cls.MODEL_NAME}")
             try:
                 # Load model with device optimization
-                self._model = SentenceTransformer(self.MODEL_NAME, device=self._device)
+                model = SentenceTransformer(cls.MODEL_NAME, device=device)
+                
+                precision = "fp32"
+                if settings.EMBEDDING_REDUCED_PRECISION:
+                    precision = cls._apply_reduced_precision(model, device)
                 
                 # Get actual embedding dimension from model
-                test_emb = self._model.encode("test", convert_to_numpy=True)
-                self._embedding_dim = len(test_emb)
+                test_emb = model.encode("test", convert_to_numpy=True)
+                cls._embedding_dim = len(test_emb)
+                cls._device = device
+                cls._fingerprint = cls._compute_fingerprint(
+                    model, cls._embedding_dim, precision, device
+                )
+                cls._persistent_cache = EmbeddingCache(cls._fingerprint, cls._embedding_dim)
+                # Published last so the unlocked fast path never sees a half-initialized model
+                cls._model = model
                 
-                logger.info(f"✓ Model loaded successfully on {self._device.upper()}")
-                logger.info(f"✓ Embedding dimension: {self._embedding_dim}")
+                logger.info(f"✓ Model loaded successfully on {device.upper()}")
+                logger.info(f"✓ Embedding dimension: {cls._embedding_dim}")
                 
                 # Performance hint
-                if self._device == 'cpu':
+                if device == 'cpu':
                     logger.warning(
                         "⚠️ Running on CPU. For 5-10x faster embeddings, use a machine with:\n"
                         "   - NVIDIA GPU (CUDA support)\n"
@@ -103,27 +168,102 @@ class EmbeddingService:
                 logger.error(f"Failed to load JobBERT-v3 model: {e}")
                 raise RuntimeError(f"Could not initialize embedding service: {e}")
     
+    @staticmethod
+    def _apply_reduced_precision(model: SentenceTransformer, device: str) -> str:
+        """
+        Lower inference precision for the given device.
+        
+        - CUDA: FP16 weights (halves memory bandwidth, inference is bandwidth-bound)
+        - CPU: dynamic INT8 quantization of the Linear layers
+        - MPS: left at FP32
+        
+        Embeddings are still returned as float32.
+        
+        Returns:
+            Precision the model ended up in: 'fp16', 'int8' or 'fp32'
+        """
+        try:
+            if device == 'cuda':
+                model.half()
+                logger.info("✓ JobBERT-v3 running in FP16")
+                return "fp16"
+            if device == 'cpu':
+                torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+                )
+                logger.info("✓ JobBERT-v3 Linear layers quantized to INT8")
+                return "int8"
+        except Exception as e:
+            logger.warning(f"Reduced precision unavailable, keeping FP32: {e}")
+        return "fp32"
+    
     @property
     def EMBEDDING_DIMENSION(self) -> int:
         """Get the actual embedding dimension from the model."""
         return self._embedding_dim if self._embedding_dim is not None else self.EXPECTED_DIMENSION
     
+    @classmethod
+    def _compute_fingerprint(
+        cls,
+        model: SentenceTransformer,
+        dim: int,
+        precision: str = "fp32",
+        device: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Identify the embedding space: model, dimension, tokenizer vocabulary,
+        normalization and, for reduced precision, the precision and device.
+        
+        FP32 fingerprints carry no precision key, so vectors stored before
+        precision was recorded stay current; FP16/INT8 vectors never match them.
+        """
+        vocab = json.dumps(model.tokenizer.get_vocab(), sort_keys=True)
+        fingerprint = {
+            "model": cls.MODEL_NAME,
+            "dim": dim,
+            "tok_sha": hashlib.sha256(vocab.encode("utf-8")).hexdigest()[:16],
+            "norm": cls.NORMALIZATION_VERSION
+        }
+        if precision != "fp32":
+            fingerprint["precision"] = precision
+            fingerprint["device"] = device
+        return fingerprint
+    
+    @property
+    def fingerprint(self) -> Dict[str, Any]:
+        """
+        Fingerprint of the embedding space this service produces.
+        
+        Stored with each persisted vector (Candidate.embedding_meta) so vectors
+        from another model, tokenizer or normalization are not compared with
+        this service's embeddings.
+        
+        Example:
+            >>> get_embedding_service().fingerprint
+            {'model': 'TechWolf/JobBERT-v3', 'dim': 768, 'tok_sha': '...', 'norm': 1}
+        """
+        return dict(self._fingerprint)
+    
     def generate_resume_embedding(
         self, 
         resume_text: str,
         include_skills: Optional[str] = None,
         include_experience: Optional[str] = None
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Generate embedding for a resume.
         
+        Long resumes are embedded as the mean of max_seq_length windows
+        (generate_long_text_embeddings), as on upload, instead of being
+        truncated to the first window.
+        
         Args:
             resume_text: The full resume text
             include_skills: Optional skills summary to emphasize
             include_experience: Optional experience summary to emphasize
             
         Returns:
-            List of 1024 floats representing the embedding
+            float32 array of shape (768,)
             
         Example:
             >>> service = EmbeddingService()
@@ -131,8 +271,8 @@ class EmbeddingService:
             ...     resume_text="Experienced Python developer...",
             ...     include_skills="Python, FastAPI, PostgreSQL"
             ... )
-            >>> len(embedding)
-            1024
+            >>> embedding.shape
+            (768,)
         """
         # Construct weighted text for better embeddings
         text_parts = [resume_text]
@@ -146,14 +286,15 @@ class EmbeddingService:
         
         combined_text = " | ".join(text_parts)
         
-        return self._generate_embedding(combined_text, "resume")
+        embedding, = self.generate_long_text_embeddings([combined_text])
+        return embedding
     
     def generate_job_embedding(
         self,
         job_description: str,
         required_skills: Optional[str] = None,
         job_title: Optional[str] = None
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Generate embedding for a job description.
         
@@ -163,7 +304,7 @@ class EmbeddingService:
             job_title: Optional job title to emphasize
             
         Returns:
-            List of 1024 floats representing the embedding
+            float32 array of shape (768,)
             
         Example:
             >>> service = EmbeddingService()
@@ -172,8 +313,8 @@ class EmbeddingService:
             ...     required_skills="Python, FastAPI, Docker",
             ...     job_title="Senior Backend Engineer"
             ... )
-            >>> len(embedding)
-            1024
+            >>> embedding.shape
+            (768,)
         """
         # Construct weighted text for better embeddings
         text_parts = []
@@ -192,7 +333,7 @@ class EmbeddingService:
         
         return self._generate_embedding(combined_text, "job")
     
-    def generate_text_embedding(self, text: str) -> List[float]:
+    def generate_text_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding for arbitrary text.
         
@@ -203,41 +344,137 @@ class EmbeddingService:
             text: The text to embed
             
         Returns:
-            List of 1024 floats representing the embedding
+            float32 array of shape (768,)
             
         Example:
             >>> service = EmbeddingService()
             >>> embedding = service.generate_text_embedding(
             ...     "Our company values diversity and innovation"
             ... )
-            >>> len(embedding)
-            1024
+            >>> embedding.shape
+            (768,)
         """
         return self._generate_embedding(text, "text")
     
-    def generate_skills_embedding(self, skills: List[str]) -> List[float]:
+    def generate_long_text_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Generate embeddings for texts that may exceed the model's max_seq_length.
+        
+        encode() silently truncates to max_seq_length tokens, so the rest of a
+        long resume would not contribute at all. Each text is cut into
+        consecutive token windows (at most LONG_TEXT_MAX_CHUNKS), all windows
+        of all texts are encoded in one forward pass, and each text gets the
+        token-weighted mean of its windows, re-normalized. A text that fits a
+        single window gets exactly its generate_text_embedding() vector.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One float32 array of shape (768,) per text (empty texts get a zero vector)
+            
+        Example:
+            >>> service = EmbeddingService()
+            >>> resume_emb, skills_emb = service.generate_long_text_embeddings(
+            ...     [long_resume_text, "Python, FastAPI, PostgreSQL"]
+            ... )
+        """
+        splits = [self._split_long_text(text) if text and text.strip() else None for text in texts]
+        windows = [chunk for split in splits if split is not None for chunk in split[0]]
+        try:
+            encoded = iter(self._encode_cached(windows) if windows else [])
+        except Exception as e:
+            logger.error(f"Error generating long text embeddings: {e}")
+            raise RuntimeError(f"Failed to generate embedding: {e}")
+        
+        results = []
+        for split in splits:
+            if split is None:
+                results.append(np.zeros(self.EMBEDDING_DIMENSION, dtype=np.float32))
+                continue
+            chunks, weights = split
+            results.append(self._pool_windows([next(encoded) for _ in chunks], weights))
+        return results
+    
+    def _split_long_text(self, text: str) -> Tuple[List[str], List[int]]:
+        """Consecutive windows of at most max_seq_length tokens, with their token counts."""
+        window = max(1, self._model.max_seq_length - 2)  # room for [CLS] / [SEP]
+        try:
+            offsets = self._model.tokenizer(
+                text, add_special_tokens=False, return_offsets_mapping=True, verbose=False
+            )["offset_mapping"]
+        except NotImplementedError:
+            # Slow (Python) tokenizers have no offsets; keep truncating
+            return [text], [1]
+        if len(offsets) <= window:
+            return [text], [max(1, len(offsets))]
+        
+        chunks, weights = [], []
+        for start in range(0, min(len(offsets), window * self.LONG_TEXT_MAX_CHUNKS), window):
+            piece = offsets[start:start + window]
+            chunks.append(text[piece[0][0]:piece[-1][1]])
+            weights.append(len(piece))
+        return chunks, weights
+    
+    @staticmethod
+    def _pool_windows(embeddings: List[np.ndarray], weights: List[int]) -> np.ndarray:
+        """Token-weighted, re-normalized mean of window embeddings (read-only)."""
+        if len(embeddings) == 1:
+            return embeddings[0]
+        mean = np.average(np.stack(embeddings), axis=0, weights=weights).astype(np.float32)
+        norm = np.linalg.norm(mean)
+        if norm > 0:
+            mean /= norm
+        mean.setflags(write=False)
+        return mean
+    
+    def generate_skills_embedding(self, skills: List[str], mean_of_skills: bool = False) -> np.ndarray:
         """
         Generate embedding for a list of skills.
         
         Args:
             skills: List of skill names
+            mean_of_skills: Opt-in fast path: average the (cached) embedding of
+                each individual skill instead of encoding the joined list.
+                Recurring skill sets become pure cache lookups, but the vector
+                differs from the default one, so do not mix the two modes
+                within one stored column
             
         Returns:
-            List of 1024 floats representing the embedding
+            float32 array of shape (768,)
             
         Example:
             >>> service = EmbeddingService()
             >>> embedding = service.generate_skills_embedding(
             ...     ["Python", "FastAPI", "PostgreSQL", "Docker"]
             ... )
-            >>> len(embedding)
-            1024
+            >>> embedding.shape
+            (768,)
         """
+        if mean_of_skills:
+            return self._mean_skills_embedding(skills)
+        
         # Join skills with commas for natural language processing
         skills_text = ", ".join(skills)
         return self._generate_embedding(skills_text, "skills")
     
-    def _generate_embedding(self, text: str, text_type: str = "general") -> List[float]:
+    def _mean_skills_embedding(self, skills: List[str]) -> np.ndarray:
+        """Unit-length mean of per-skill embeddings; only cache misses are encoded."""
+        names = list(dict.fromkeys(skill.strip() for skill in skills if skill and skill.strip()))
+        if not names:
+            logger.warning("Empty skills list provided for skills embedding, returning zero vector")
+            return np.zeros(self.EMBEDDING_DIMENSION, dtype=np.float32)
+        
+        try:
+            mean = np.mean(self._encode_cached(names), axis=0)
+        except Exception as e:
+            logger.error(f"Error generating skills embedding: {e}")
+            raise RuntimeError(f"Failed to generate embedding: {e}")
+        
+        norm = np.linalg.norm(mean)
+        return mean / norm if norm > 0 else mean
+    
+    def _generate_embedding(self, text: str, text_type: str = "general") -> np.ndarray:
         """
         Internal method to generate embeddings.
         
@@ -246,39 +483,145 @@ class EmbeddingService:
             text_type: Type of text (for logging purposes)
             
         Returns:
-            List of floats representing the embedding
+            float32 array representing the embedding (read-only, it may be
+            shared with other callers through the cache)
         """
         if not text or not text.strip():
             logger.warning(f"Empty text provided for {text_type} embedding, returning zero vector")
-            return [0.0] * self.EMBEDDING_DIMENSION
+            return np.zeros(self.EMBEDDING_DIMENSION, dtype=np.float32)
+        
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        persistent = self._persistent_tier()
+        if persistent is not None:
+            cached = persistent.get_many([text])[0]
+            if cached is not None:
+                self._cache_put(key, cached)
+                return cached
         
         try:
             # Generate embedding
-            embedding = self._model.encode(text, convert_to_numpy=True)
-            
-            # Convert to list of floats
-            embedding_list = embedding.tolist()
+            embedding = self._model.encode(
+                text, convert_to_numpy=True, normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+            embedding.setflags(write=False)
             
             logger.debug(
-                f"Generated {text_type} embedding (dim={len(embedding_list)}, "
+                f"Generated {text_type} embedding (dim={embedding.shape[0]}, "
                 f"norm={np.linalg.norm(embedding):.4f})"
             )
             
-            return embedding_list
+            self._cache_put(key, embedding)
+            if persistent is not None:
+                persistent.put_many([text], [embedding])
+            
+            return embedding
             
         except Exception as e:
             logger.error(f"Error generating {text_type} embedding: {e}")
             raise RuntimeError(f"Failed to generate embedding: {e}")
     
-    def batch_generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def _persistent_tier(self) -> Optional[EmbeddingCache]:
+        """
+        The Redis tier, on the inference worker thread only.
+        
+        Sync callers may be on the event loop or a request thread, where a
+        slow or unreachable Redis would stall them; they use the in-process
+        LRU alone.
+        """
+        if getattr(_inference_thread, "active", False):
+            return self._persistent_cache
+        return None
+    
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    @classmethod
+    def _cache_get(cls, key: bytes) -> Optional[np.ndarray]:
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is not None:
+                cls._cache.move_to_end(key)
+            return cached
+    
+    @classmethod
+    def _cache_put(cls, key: bytes, embedding: np.ndarray):
+        with cls._cache_lock:
+            cls._cache[key] = embedding
+            if len(cls._cache) > cls.CACHE_MAX_ENTRIES:
+                cls._cache.popitem(last=False)
+    
+    def _encode_cached(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Encode non-empty texts in one forward pass, going through the cache.
+        
+        Cache hits (in-process, then Redis on the inference thread) are
+        served directly; duplicates within the batch are encoded once.
+        """
+        keys = [self._cache_key(text) for text in texts]
+        results: List[Optional[np.ndarray]] = [self._cache_get(key) for key in keys]
+        
+        misses: Dict[bytes, str] = {}
+        for key, text, result in zip(keys, texts, results):
+            if result is None:
+                misses.setdefault(key, text)
+        
+        fresh: Dict[bytes, np.ndarray] = {}
+        persistent = self._persistent_tier()
+        if misses and persistent is not None:
+            for key, embedding in zip(list(misses), persistent.get_many(list(misses.values()))):
+                if embedding is not None:
+                    self._cache_put(key, embedding)
+                    fresh[key] = embedding
+                    del misses[key]
+        
+        if misses:
+            encoded = self._model.encode(
+                list(misses.values()),
+                batch_size=len(misses),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+            for key, embedding in zip(misses, encoded):
+                embedding.setflags(write=False)
+                self._cache_put(key, embedding)
+                fresh[key] = embedding
+            if persistent is not None:
+                persistent.put_many(list(misses.values()), [fresh[key] for key in misses])
+            logger.debug(f"Micro-batch encoded {len(misses)} of {len(texts)} texts")
+        
+        if fresh:
+            results = [
+                result if result is not None else fresh[key]
+                for key, result in zip(keys, results)
+            ]
+        return results
+    
+    def batch_generate_embeddings(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        device: Optional[str] = None
+    ) -> np.ndarray:
         """
         Generate embeddings for multiple texts in a batch (more efficient).
         
+        SentenceTransformer.encode sorts inputs by length before batching and
+        restores the original order, so each batch pads to similar lengths.
+        
         Args:
             texts: List of texts to embed
+            batch_size: Texts per forward pass
+            device: Override the inference device for this call (default: model device)
             
         Returns:
-            List of embeddings (each embedding is a list of 1024 floats)
+            float32 array of shape (len(texts), 768), row i for texts[i]
+            (empty texts get a zero vector)
             
         Example:
             >>> service = EmbeddingService()
@@ -286,42 +629,171 @@ class EmbeddingService:
             ...     "Python developer with 5 years experience",
             ...     "Senior data scientist seeking new opportunities"
             ... ])
-            >>> len(embeddings)
-            2
-            >>> len(embeddings[0])
-            1024
+            >>> embeddings.shape
+            (2, 768)
         """
         if not texts:
             logger.warning("Empty text list provided for batch embedding")
-            return []
+            return np.empty((0, self.EMBEDDING_DIMENSION), dtype=np.float32)
         
         try:
-            # Filter out empty texts
-            valid_texts = [t for t in texts if t and t.strip()]
-            if len(valid_texts) != len(texts):
+            # Filter out empty texts, remembering where the valid ones go
+            valid_indices = [i for i, t in enumerate(texts) if t and t.strip()]
+            if len(valid_indices) != len(texts):
                 logger.warning(
-                    f"Filtered out {len(texts) - len(valid_texts)} empty texts from batch"
+                    f"Filtered out {len(texts) - len(valid_indices)} empty texts from batch"
                 )
             
-            if not valid_texts:
-                return [[0.0] * self.EMBEDDING_DIMENSION] * len(texts)
+            embeddings = np.zeros((len(texts), self.EMBEDDING_DIMENSION), dtype=np.float32)
+            if not valid_indices:
+                return embeddings
             
             # Generate embeddings in batch
-            embeddings = self._model.encode(valid_texts, convert_to_numpy=True)
-            
-            # Convert to list of lists
-            embeddings_list = [emb.tolist() for emb in embeddings]
+            embeddings[valid_indices] = self._model.encode(
+                [texts[i] for i in valid_indices],
+                batch_size=batch_size,
+                device=device,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
             
-            logger.info(f"Generated {len(embeddings_list)} embeddings in batch")
+            logger.info(f"Generated {len(valid_indices)} embeddings in batch")
             
-            return embeddings_list
+            return embeddings
             
         except Exception as e:
             logger.error(f"Error in batch embedding generation: {e}")
             raise RuntimeError(f"Failed to generate batch embeddings: {e}")
     
+    async def _run_in_executor(self, func, *args, **kwargs):
+        """Run a sync embedding method on the inference worker thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+    
+    async def agenerate_resume_embedding(
+        self,
+        resume_text: str,
+        include_skills: Optional[str] = None,
+        include_experience: Optional[str] = None
+    ) -> np.ndarray:
+        """Async variant of generate_resume_embedding (for use in async handlers)."""
+        return await self._run_in_executor(
+            self.generate_resume_embedding, resume_text, include_skills, include_experience
+        )
+    
+    async def agenerate_job_embedding(
+        self,
+        job_description: str,
+        required_skills: Optional[str] = None,
+        job_title: Optional[str] = None
+    ) -> np.ndarray:
+        """Async variant of generate_job_embedding (for use in async handlers)."""
+        return await self._run_in_executor(
+            self.generate_job_embedding, job_description, required_skills, job_title
+        )
+    
+    async def agenerate_text_embedding(self, text: str) -> np.ndarray:
+        """
+        Async variant of generate_text_embedding (for use in async handlers).
+        
+        Cache misses are queued and encoded together with other concurrent
+        requests (up to MICROBATCH_MAX_SIZE texts or MICROBATCH_MAX_WAIT).
+        """
+        if not text or not text.strip():
+            return self.generate_text_embedding(text)
+        
+        cached = self._cache_get(self._cache_key(text))
+        if cached is not None:
+            return cached
+        
+        queue = self._ensure_batcher()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        return await future
+    
+    async def agenerate_long_text_embedding(self, text: str) -> np.ndarray:
+        """
+        Async variant of generate_long_text_embeddings for one text.
+        
+        Windows go through the micro-batcher, so they are encoded together
+        (and with other concurrent requests) in one forward pass.
+        """
+        if not text or not text.strip():
+            return await self.agenerate_text_embedding(text)
+        
+        chunks, weights = await self._run_in_executor(self._split_long_text, text)
+        embeddings = await asyncio.gather(*[self.agenerate_text_embedding(chunk) for chunk in chunks])
+        return self._pool_windows(list(embeddings), weights)
+    
+    def _ensure_batcher(self) -> asyncio.Queue:
+        """Start the micro-batching task on first use (needs a running loop)."""
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._batch_worker(), name="embedding-batcher")
+        return self._batch_queue
+    
+    async def _batch_worker(self):
+        """Collect queued texts for a few ms, then encode them as one batch."""
+        queue = self._batch_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await queue.get()]
+            deadline = loop.time() + self.MICROBATCH_MAX_WAIT
+            while len(items) < self.MICROBATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                embeddings = await self._run_in_executor(
+                    self._encode_cached, [text for text, _ in items]
+                )
+            except Exception as e:
+                logger.error(f"Error in micro-batch embedding generation: {e}")
+                error = RuntimeError(f"Failed to generate embedding: {e}")
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            
+            for (_, future), embedding in zip(items, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+    
+    async def aclose(self):
+        """Stop the micro-batching task (call on shutdown)."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+        self._batcher = None
+        self._batch_queue = None
+    
+    async def agenerate_skills_embedding(
+        self,
+        skills: List[str],
+        mean_of_skills: bool = False
+    ) -> np.ndarray:
+        """Async variant of generate_skills_embedding (for use in async handlers)."""
+        return await self._run_in_executor(self.generate_skills_embedding, skills, mean_of_skills)
+    
+    async def abatch_generate_embeddings(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        device: Optional[str] = None
+    ) -> np.ndarray:
+        """Async variant of batch_generate_embeddings (for use in async handlers)."""
+        return await self._run_in_executor(
+            self.batch_generate_embeddings, texts, batch_size, device
+        )
+    
     @staticmethod
-    def cosine_similarity(embedding1: List[float], embedding2: List[float]) -> float:
+    def cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """
         Calculate cosine similarity between two embeddings.
         
@@ -340,28 +812,89 @@ class EmbeddingService:
             >>> 0 <= similarity <= 1
             True
         """
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        # No copy for float32 ndarrays; lists (e.g. legacy JSON values) become
+        # float32 rather than NumPy's default float64
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
         
-        # Calculate cosine similarity
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        # Plain dot products avoid np.linalg.norm's dispatch overhead
+        dot_product = float(vec1 @ vec2)
+        norm1_sq = float(vec1 @ vec1)
+        norm2_sq = float(vec2 @ vec2)
         
-        if norm1 == 0 or norm2 == 0:
+        if norm1_sq == 0 or norm2_sq == 0:
             return 0.0
         
-        similarity = dot_product / (norm1 * norm2)
-        return float(similarity)
+        return dot_product / math.sqrt(norm1_sq * norm2_sq)
+    
+    @staticmethod
+    def cosine_similarity_batch(
+        query: np.ndarray,
+        corpus: np.ndarray,
+        normalized: bool = False
+    ) -> np.ndarray:
+        """
+        Cosine similarity of one query embedding against many embeddings at once.
+        
+        A single matrix-vector product instead of a Python loop over pairs.
+        
+        Args:
+            query: Query embedding, shape (dim,)
+            corpus: Embeddings to compare against, shape (n, dim)
+            normalized: Inputs are known unit vectors (e.g. all produced by
+                this service), so the product is returned without norms
+            
+        Returns:
+            float32 array of shape (n,) with scores between -1 and 1
+            (0 for zero vectors)
+            
+        Example:
+            >>> service = EmbeddingService()
+            >>> job_emb = service.generate_text_embedding("Backend engineer")
+            >>> candidates = service.batch_generate_embeddings(resume_texts)
+            >>> scores = service.cosine_similarity_batch(job_emb, candidates)
+        """
+        query = np.asarray(query, dtype=np.float32)
+        corpus = np.asarray(corpus, dtype=np.float32)
+        if corpus.shape[0] == 0:
+            return np.empty(0, dtype=np.float32)
+        
+        if normalized:
+            return corpus @ query
+        
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return np.zeros(corpus.shape[0], dtype=np.float32)
+        
+        corpus_norms = np.linalg.norm(corpus, axis=1)
+        # Zero rows get a 0 score rather than a division by zero
+        corpus_norms[corpus_norms == 0] = np.inf
+        
+        return (corpus @ (query / query_norm)) / corpus_norms
+    
+    @staticmethod
+    def to_list(embedding: Union[np.ndarray, Sequence[float]]) -> List[float]:
+        """
+        Convert an embedding to a plain list of floats for JSON / text serialization.
+        
+        Example:
+            >>> EmbeddingService.to_list(np.array([0.5, 0.25], dtype=np.float32))
+            [0.5, 0.25]
+        """
+        return np.asarray(embedding, dtype=np.float32).tolist()
 
 
 # Global instance (singleton)
-@lru_cache(maxsize=1)
+_service: Optional[EmbeddingService] = None
+_service_lock = threading.Lock()
+
+
 def get_embedding_service() -> EmbeddingService:
     """
     Get the global embedding service instance.
     
-    This function uses LRU cache to ensure we only create one instance.
+    Created once under a lock; the model itself is loaded by
+    EmbeddingService._load_model.
     
     Returns:
         EmbeddingService instance
@@ -370,4 +903,15 @@ def get_embedding_service() -> EmbeddingService:
         >>> service = get_embedding_service()
         >>> embedding = service.generate_text_embedding("Hello world")
     """
-    return EmbeddingService()
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = EmbeddingService()
+    return _service
+
+
+async def close_embedding_service():
+    """Shut down the global service's background work, if it was ever created."""
+    if _service is not None:
+        await _service.aclose()
@@ -0,0 +1,217 @@
+"""
+Evaluation Cache for AI Screening
+
+Two-tier cache for LLM response evaluations so that repeated or near-duplicate
+candidate answers do not trigger a fresh LLM generation:
+
+1. Exact tier - Redis key per (question, sha256(response)), with an in-process
+   fallback while Redis is unreachable
+2. Semantic tier (opt-in, settings.EVAL_SEMANTIC_CACHE) - in-memory matrix of
+   normalized JobBERT-v3 embeddings per question; a hit requires cosine
+   similarity >= threshold. Off by default, since a near-identical answer with
+   the opposite meaning would inherit an evaluation scored for someone else.
+
+Entries are always scoped to the question (id + text digest), so an answer that
+is similar to one given for a *different* question never produces a false hit.
+"""
+
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import time
+
+import numpy as np
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.services.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluationCache:
+    """
+    Exact + semantic cache for screening response evaluations.
+    """
+
+    KEY_PREFIX = "eval"
+    # After a Redis error, serve from the in-process cache for this long, then retry
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(
+        self,
+        embedding_service: Optional[EmbeddingService] = None,
+        similarity_threshold: float = 0.95,
+        ttl_seconds: int = 86400,
+        max_entries_per_question: int = 256,
+        max_local_entries: int = 4096
+    ):
+        """
+        Initialize the evaluation cache.
+
+        Args:
+            embedding_service: Embedding provider for the semantic tier (disabled if None)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            ttl_seconds: Expiry for exact-match entries in Redis
+            max_entries_per_question: Semantic entries kept per question
+            max_local_entries: Size of the in-process exact-match fallback
+        """
+        self.embedding_service = embedding_service
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_question = max_entries_per_question
+        self.max_local_entries = max_local_entries
+
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_retry_at = 0.0
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # question_key -> (unit embedding matrix, evaluations)
+        self._semantic: Dict[str, Tuple[np.ndarray, List[Dict[str, Any]]]] = {}
+
+    @staticmethod
+    def question_key(question: Dict[str, Any]) -> str:
+        """
+        Build a cache scope for a question from its id and everything the
+        evaluation prompt is built from (text, type, skills, criteria, max score),
+        so editing any of them never serves a stale score.
+        """
+        scope = {
+            field: question.get(field)
+            for field in ("question", "type", "expected_skills", "evaluation_criteria", "max_score")
+        }
+        scope_json = json.dumps(scope, sort_keys=True, default=str)
+        scope_digest = hashlib.sha256(scope_json.encode("utf-8")).hexdigest()[:16]
+        return f"{question.get('id', 'q')}:{scope_digest}"
+
+    @staticmethod
+    def _normalize(response: str) -> str:
+        """Collapse whitespace and case so trivially different answers share a key."""
+        return " ".join(response.lower().split())
+
+    def _exact_key(self, question_key: str, response: str) -> str:
+        digest = hashlib.sha256(self._normalize(response).encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{question_key}:{digest}"
+
+    def _get_redis(self) -> Optional[aioredis.Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, socket_connect_timeout=1)
+        return self._redis
+
+    def _disable_redis(self, error: Exception):
+        logger.warning(
+            f"Redis unavailable for evaluation cache, using in-process cache "
+            f"for {self.REDIS_RETRY_SECONDS:.0f}s: {error}"
+        )
+        self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+
+    async def _embed(self, response: str) -> Optional[np.ndarray]:
+        if self.embedding_service is None:
+            return None
+        try:
+            embedding = await self.embedding_service.agenerate_text_embedding(
+                self._normalize(response)
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+        # EmbeddingService already returns unit vectors; zero means empty text
+        vec = np.asarray(embedding, dtype=np.float32)
+        if not vec.any():
+            return None
+        return vec
+
+    async def get(self, question_key: str, response: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached evaluation (exact tier first, then semantic tier).
+
+        Args:
+            question_key: Scope from question_key()
+            response: Candidate's response text
+
+        Returns:
+            Cached evaluation dict or None on miss
+        """
+        key = self._exact_key(question_key, response)
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                cached = await client.get(key)
+                if cached is not None:
+                    logger.debug(f"Evaluation cache exact hit (redis): {key}")
+                    return json.loads(cached)
+            except Exception as e:
+                self._disable_redis(e)
+
+        if key in self._local:
+            self._local.move_to_end(key)
+            logger.debug(f"Evaluation cache exact hit (local): {key}")
+            return dict(self._local[key])
+
+        entry = self._semantic.get(question_key)
+        if entry is None:
+            return None
+
+        query = await self._embed(response)
+        if query is None:
+            return None
+
+        matrix, evaluations = entry
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            logger.debug(
+                f"Evaluation cache semantic hit for {question_key} "
+                f"(similarity={similarities[best]:.4f})"
+            )
+            return dict(evaluations[best])
+
+        return None
+
+    async def set(self, question_key: str, response: str, evaluation: Dict[str, Any]):
+        """
+        Store an evaluation in both tiers.
+
+        Args:
+            question_key: Scope from question_key()
+            response: Candidate's response text
+            evaluation: Evaluation dict returned by the LLM
+        """
+        key = self._exact_key(question_key, response)
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await client.set(key, json.dumps(evaluation), ex=self.ttl_seconds)
+            except Exception as e:
+                self._disable_redis(e)
+
+        self._local[key] = evaluation
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+        vec = await self._embed(response)
+        if vec is None:
+            return
+
+        matrix, evaluations = self._semantic.get(
+            question_key, (np.empty((0, vec.shape[0]), dtype=np.float32), [])
+        )
+        matrix = np.vstack([matrix, vec[np.newaxis, :]])[-self.max_entries_per_question:]
+        evaluations = (evaluations + [evaluation])[-self.max_entries_per_question:]
+        self._semantic[question_key] = (matrix, evaluations)
+
+    async def aclose(self):
+        """Close the Redis connection."""
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing evaluation cache redis client: {e}")
+            self._redis = None
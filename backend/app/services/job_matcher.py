@@ -3,19 +3,287 @@ Advanced Job-Candidate Matching Service
 Using JobBERT-v3 (768-dim) embeddings and cosine similarity
 """
 
+import hashlib
+import json
 import logging
-from typing import List, Dict, Any, Tuple
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
 import torch
+from sqlalchemy import bindparam, case, func, or_, text
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from pgvector.sqlalchemy import Vector
 from ..models.job import Job
-from ..models.candidate import Candidate
+from ..models.candidate import Candidate, quantize_embedding_int8
 from ..db.database import get_db
+from app.core.config import settings
 from app.services.embedding_service import get_embedding_service
 
+try:
+    from simsimd import cosine as simd_cosine
+except ImportError:  # Optional native dependency, falls back to NumPy
+    simd_cosine = None
+
+try:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForTokenClassification
+except ImportError:  # Optional ONNX Runtime NER backend
+    ort = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: pyahocorasick
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Common technology skills (expand based on your domain)
+SKILL_KEYWORDS = (
+    "python", "java", "javascript", "react", "angular", "vue",
+    "nodejs", "django", "flask", "fastapi", "spring", "sql",
+    "postgresql", "mysql", "mongodb", "docker", "kubernetes",
+    "aws", "azure", "gcp", "machine learning", "ai", "data science",
+    "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy"
+)
+
+# Patterns like "2+ years experience", "3 to 5 years", "minimum 2 years",
+# "at least 4 years" as one alternation, so the text is scanned once. Listed
+# in priority order; group N captures the years of pattern N. The lookahead
+# makes every position a candidate, so a phrase of a higher-priority pattern
+# is never hidden inside an overlapping match of a lower-priority one.
+_EXPERIENCE_RE = re.compile(
+    r"(?="
+    r"(\d+)\+?\s*years?\s*(?:of\s*)?experience"
+    r"|(\d+)\s*to\s*\d+\s*years?"
+    r"|minimum\s*(\d+)\s*years?"
+    r"|at\s*least\s*(\d+)\s*years?"
+    r")",
+    re.IGNORECASE
+)
+
+
+def _build_skill_automaton():
+    """Aho-Corasick automaton over SKILL_KEYWORDS, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, skill in enumerate(SKILL_KEYWORDS):
+        automaton.add_word(skill, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+# One bit per known skill; skill overlap becomes a popcount of an AND
+_SKILL_BITS = {skill: 1 << index for index, skill in enumerate(SKILL_KEYWORDS)}
+
+EDUCATION_HIERARCHY = {
+    "high school": 1,
+    "diploma": 2,
+    "bachelor": 3,
+    "master": 4,
+    "phd": 5,
+    "doctorate": 5
+}
+
+
+def _build_education_automaton():
+    """Aho-Corasick automaton over EDUCATION_HIERARCHY, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for level, value in EDUCATION_HIERARCHY.items():
+        automaton.add_word(level, value)
+    automaton.make_automaton()
+    return automaton
+
+
+_EDUCATION_AUTOMATON = _build_education_automaton()
+
+# Shared by all searches so threads are not created and torn down per request
+_MATCHER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="job-matcher"
+)
+
+NER_MODEL_NAME = "dslim/bert-base-NER"
+
+_ner_pipeline = None
+_ner_pipeline_lock = threading.Lock()
+
+
+def _configured_ner_backend() -> str:
+    """NER backend selected by settings: onnx-int8, pytorch-fp16 or pytorch"""
+    if settings.NER_ONNX_MODEL_DIR and ort is not None:
+        return "onnx-int8"
+    if torch.cuda.is_available() and settings.NER_REDUCED_PRECISION:
+        return "pytorch-fp16"
+    return "pytorch"
+
+
+def _load_ner_model(backend: str):
+    """
+    Load the NER model, preferring the int8 ONNX Runtime export when configured
+    
+    The ONNX model is dynamically quantized for AVX-512 VNNI by
+    scripts/export_ner_onnx.py and runs on CPU with full graph optimizations.
+    The HF pipeline wraps either model, so entity output is identical.
+    Without it, PyTorch NER runs in FP16 on CUDA.
+    """
+    if backend == "onnx-int8":
+        try:
+            session_options = ort.SessionOptions()
+            session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            session_options.intra_op_num_threads = os.cpu_count() or 1
+            model = ORTModelForTokenClassification.from_pretrained(
+                settings.NER_ONNX_MODEL_DIR,
+                file_name="model_quantized.onnx",
+                provider="CPUExecutionProvider",
+                session_options=session_options
+            )
+            logger.info(f"Using int8 ONNX Runtime NER model from {settings.NER_ONNX_MODEL_DIR}")
+            return model, backend
+        except Exception as e:
+            logger.warning(f"Failed to load ONNX NER model, using PyTorch NER: {e}")
+            backend = "pytorch"
+    
+    if backend == "pytorch-fp16":
+        # BERT prefill is compute-bound; FP16 runs on tensor cores
+        logger.info("Loading NER model in FP16 on CUDA")
+        return AutoModelForTokenClassification.from_pretrained(
+            NER_MODEL_NAME, torch_dtype=torch.float16, attn_implementation="sdpa"
+        ), backend
+    
+    # SDPA attention: fused kernels (flash attention on supported GPUs)
+    return AutoModelForTokenClassification.from_pretrained(
+        NER_MODEL_NAME, attn_implementation="sdpa"
+    ), backend
+
+
+def get_ner_pipeline():
+    """
+    The process-wide NER pipeline, loaded on first use
+    
+    Keeps the ~430MB model out of import and service construction, so
+    processes that never extract requirements never load it. Under a
+    preloading server (gunicorn --preload), calling this in the master
+    lets forked workers share the weights copy-on-write. Set HF_HOME to
+    a persistent volume so cold containers do not re-download it.
+    """
+    global _ner_pipeline
+    if _ner_pipeline is None:
+        with _ner_pipeline_lock:
+            if _ner_pipeline is None:
+                if settings.NER_ONNX_MODEL_DIR and ort is None:
+                    logger.warning("NER_ONNX_MODEL_DIR is set but optimum[onnxruntime] is not installed, using PyTorch NER")
+                model, backend = _load_ner_model(_configured_ner_backend())
+                ner = pipeline(
+                    "ner",
+                    model=model,
+                    tokenizer=AutoTokenizer.from_pretrained(NER_MODEL_NAME),
+                    aggregation_strategy="simple",
+                    device=-1 if backend == "onnx-int8" else (0 if torch.cuda.is_available() else -1)
+                )
+                if backend != "onnx-int8" and settings.NER_TORCH_COMPILE:
+                    _compile_ner_pipeline(ner)
+                _ner_pipeline = ner
+    return _ner_pipeline
+
+
+def _compile_ner_pipeline(ner):
+    """
+    torch.compile the pipeline's model to fuse LayerNorm/GELU/attention kernels
+    
+    dynamic=True avoids a recompile for every new sequence length. A warm-up
+    call triggers compilation here, so the first real extraction does not
+    pay for it.
+    """
+    try:
+        ner.model = torch.compile(ner.model, dynamic=True)
+        ner("Senior Python engineer in Bangalore with 5+ years of experience at Acme Corp.")
+        logger.info("NER model compiled with torch.compile")
+    except Exception as e:
+        ner.model = getattr(ner.model, "_orig_mod", ner.model)
+        logger.warning(f"torch.compile failed for NER model, running eagerly: {e}")
+
+
+def _current_embedding_clause(fingerprint: Dict[str, Any]):
+    """
+    SQL filter for candidates whose stored embeddings match fingerprint
+    
+    Rows without embedding_meta predate fingerprinting; every vector in the
+    768-dim columns then came from JobBERT-v3, so they count as current.
+    """
+    return or_(Candidate.embedding_meta.is_(None), Candidate.embedding_meta == fingerprint)
+
+
+class CandidateEmbeddingStore:
+    """
+    Contiguous in-memory matrix of candidate resume embeddings
+    
+    Holds every int8 resume embedding as one (N, 768) float32 matrix plus
+    inverse norms and a candidate-id index, so a search is one GEMV over
+    memory that is already laid out instead of N embeddings fetched and
+    unpacked per request. Rebuilt only when the candidates table
+    signature (row count, latest updated_at) changes. Embeddings whose
+    embedding_meta does not match the given fingerprint are left out.
+    """
+    
+    def __init__(self, fingerprint: Dict[str, Any]):
+        self._fingerprint = fingerprint
+        self._lock = threading.Lock()
+        # (signature, row_of, embeddings, inv_norms), swapped as one object
+        self._snapshot: Optional[Tuple[Any, Dict[int, int], np.ndarray, np.ndarray]] = None
+    
+    def snapshot(self, db: Session) -> Tuple[Dict[int, int], np.ndarray, np.ndarray]:
+        """
+        Current (row_of, embeddings, inv_norms), rebuilding if candidates changed
+        
+        row_of maps candidate id to its matrix row; candidates without a
+        current int8 embedding are not in the store.
+        """
+        signature = tuple(db.query(func.count(Candidate.id), func.max(Candidate.updated_at)).one())
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == signature:
+            return snapshot[1:]
+        
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot[0] == signature:
+                return snapshot[1:]
+            
+            rows = db.query(
+                Candidate.id,
+                Candidate.resume_embedding_i8,
+                Candidate.resume_embedding_i8_norm
+            ).filter(
+                Candidate.resume_embedding_i8.isnot(None),
+                _current_embedding_clause(self._fingerprint)
+            ).yield_per(1000).all()
+            
+            embeddings = np.empty((len(rows), 768), dtype=np.float32)
+            inv_norms = np.zeros(len(rows), dtype=np.float32)
+            row_of: Dict[int, int] = {}
+            for row, (candidate_id, embedding_i8, norm) in enumerate(rows):
+                # Cosine is scale-invariant, so the int8 values are used as-is
+                embeddings[row] = np.frombuffer(embedding_i8, dtype=np.int8)
+                norm = norm or float(np.linalg.norm(embeddings[row]))
+                if norm:
+                    inv_norms[row] = 1.0 / norm
+                row_of[candidate_id] = row
+            
+            self._snapshot = (signature, row_of, embeddings, inv_norms)
+            logger.info(f"Candidate embedding store rebuilt with {len(rows)} embeddings")
+            return row_of, embeddings, inv_norms
+
+
 class JobCandidateMatchingService:
     """
     Advanced job-candidate matching using:
@@ -24,33 +292,165 @@ class JobCandidateMatchingService:
     - Custom scoring algorithm combining multiple factors
     """
     
+    # Weights for the overall match score
+    SCORE_WEIGHTS = {
+        "semantic_similarity": 0.35,
+        "skills_match": 0.30,
+        "experience_match": 0.20,
+        "education_match": 0.10,
+        "location_match": 0.05
+    }
+    _WEIGHT_VECTOR = np.array(list(SCORE_WEIGHTS.values()))
+    
+    # Bump when requirement extraction changes so persisted results are recomputed
+    REQUIREMENTS_VERSION = 2
+    REQUIREMENTS_CACHE_MAX_ENTRIES = 1024
+    
+    # Descriptions per NER forward pass in extract_job_requirements_batch
+    NER_BATCH_SIZE = 16
+    
+    # ivfflat lists scanned for the pgvector shortlist (pgvector default is 1)
+    SHORTLIST_IVFFLAT_PROBES = 10
+    
     def __init__(self):
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         
         # Use embedding service for 768-dim JobBERT-v3 embeddings
         self.embedding_service = get_embedding_service()
+        # Stored vectors from another embedding space are never compared with this one
+        self.embedding_fingerprint = self.embedding_service.fingerprint
+        self.embedding_store = CandidateEmbeddingStore(self.embedding_fingerprint)
+        
+        # The NER model is not loaded here; see get_ner_pipeline()
         
-        # Load BERT-based NER model (discovered through HF research)
-        self.ner_tokenizer = AutoTokenizer.from_pretrained("dslim/bert-base-NER")
-        self.ner_model = AutoModelForTokenClassification.from_pretrained("dslim/bert-base-NER")
-        self.ner_pipeline = pipeline(
-            "ner",
-            model=self.ner_model,
-            tokenizer=self.ner_tokenizer,
-            aggregation_strategy="simple",
-            device=0 if torch.cuda.is_available() else -1
+        # Extracted requirements memoized by description fingerprint (bounded LRU)
+        self._requirements_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._requirements_cache_lock = threading.Lock()
+        self._requirements_tag = (
+            f"{NER_MODEL_NAME}:{_configured_ner_backend()}"
+            f":v{self.REQUIREMENTS_VERSION}"
         )
         
         logger.info("JobCandidateMatchingService initialized with JobBERT-v3 (768-dim)")
     
+    @property
+    def ner_pipeline(self):
+        """BERT-based NER pipeline (discovered through HF research), loaded on first use"""
+        return get_ner_pipeline()
+    
+    def _requirements_fingerprint(self, job_description: str) -> str:
+        """Content hash of the description plus the extractor (NER model, version)"""
+        return hashlib.blake2b(
+            f"{self._requirements_tag}\0{job_description}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+    
     def extract_job_requirements(self, job_description: str) -> Dict[str, Any]:
         """
         Extract structured requirements from job description
         using advanced NER and custom parsing
+        
+        Extraction is pure for a given description, so results are memoized
+        by fingerprint. The returned dict is shared and must not be mutated.
         """
-        # Extract entities using BERT-based NER
-        entities = self.ner_pipeline(job_description)
+        fingerprint = self._requirements_fingerprint(job_description)
+        cached = self._requirements_cache_get(fingerprint)
+        if cached is not None:
+            return cached
+        
+        requirements = self._requirements_from_entities(
+            job_description, self.ner_pipeline(job_description)
+        )
+        self._requirements_cache_put(fingerprint, requirements)
+        return requirements
+    
+    def extract_job_requirements_batch(self, job_descriptions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract requirements for many job descriptions at once
+        
+        Cached descriptions are served from memory; the rest go through NER
+        as padded batches of NER_BATCH_SIZE, which keeps the GPU busy
+        instead of running one sequence per forward pass.
+        """
+        fingerprints = [self._requirements_fingerprint(description) for description in job_descriptions]
+        results: List[Optional[Dict[str, Any]]] = [
+            self._requirements_cache_get(fingerprint) for fingerprint in fingerprints
+        ]
+        
+        misses = [i for i, requirements in enumerate(results) if requirements is None]
+        if misses:
+            batch_entities = self.ner_pipeline(
+                [job_descriptions[i] for i in misses],
+                batch_size=self.NER_BATCH_SIZE
+            )
+            for i, entities in zip(misses, batch_entities):
+                results[i] = self._requirements_from_entities(job_descriptions[i], entities)
+                self._requirements_cache_put(fingerprints[i], results[i])
         
+        return results
+    
+    def _requirements_cache_get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        with self._requirements_cache_lock:
+            cached = self._requirements_cache.get(fingerprint)
+            if cached is not None:
+                self._requirements_cache.move_to_end(fingerprint)
+            return cached
+    
+    def _requirements_cache_put(self, fingerprint: str, requirements: Dict[str, Any]):
+        with self._requirements_cache_lock:
+            self._requirements_cache[fingerprint] = requirements
+            if len(self._requirements_cache) > self.REQUIREMENTS_CACHE_MAX_ENTRIES:
+                self._requirements_cache.popitem(last=False)
+    
+    def _get_job_requirements(self, job: Job, db: Session) -> Dict[str, Any]:
+        """
+        Requirements for a job, reusing the result persisted on the job row
+        
+        The stored fingerprint covers the description and the extractor, so
+        edits to the job or an NER model change never serve stale results.
+        """
+        requirements = self._stored_job_requirements(job)
+        if requirements is None:
+            requirements = self.extract_job_requirements(job.description)
+            self._persist_job_requirements(job, requirements, db)
+        return requirements
+    
+    def _stored_job_requirements(self, job: Job) -> Optional[Dict[str, Any]]:
+        """Requirements persisted on the job row, if still current"""
+        stored = job.extracted_requirements
+        if stored and stored.get("fingerprint") == self._requirements_fingerprint(job.description):
+            return stored["requirements"]
+        return None
+    
+    def _persist_job_requirements(self, job: Job, requirements: Dict[str, Any], db: Session):
+        """
+        Store freshly extracted requirements on the job row (best effort)
+        
+        Written through a short-lived session on the same engine, so the
+        caller's transaction is never committed or rolled back from here.
+        """
+        stored = {
+            "fingerprint": self._requirements_fingerprint(job.description),
+            "requirements": requirements
+        }
+        try:
+            with Session(bind=db.get_bind()) as session:
+                session.query(Job).filter(Job.id == job.id).update(
+                    {Job.extracted_requirements: stored}, synchronize_session=False
+                )
+                session.commit()
+        except Exception as e:
+            logger.warning(f"Could not persist extracted requirements for job {job.id}: {e}")
+            return
+        # Mirror on the loaded row without leaving it dirty in the caller's session
+        set_committed_value(job, "extracted_requirements", stored)
+    
+    def _requirements_from_entities(
+        self,
+        job_description: str,
+        entities: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build requirements from NER entities plus keyword/regex extraction"""
         requirements = {
             "skills": [],
             "organizations": [],
@@ -89,55 +489,56 @@ class JobCandidateMatchingService:
         Calculate comprehensive match score between candidate and job
         """
         # Get candidate and job data
-        candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        candidate = self._candidate_match_query(db).filter(Candidate.id == candidate_id).first()
         job = db.query(Job).filter(Job.id == job_id).first()
         
         if not candidate or not job:
             return {"error": "Candidate or job not found"}
         
-        # Extract job requirements
-        job_requirements = self.extract_job_requirements(job.description)
+        # Extract job requirements (persisted on the job row)
+        job_requirements = self._get_job_requirements(job, db)
         
-        # Calculate different scoring components
-        scores = {
-            "semantic_similarity": self._calculate_semantic_similarity(
-                candidate, job
-            ),
-            "skills_match": self._calculate_skills_match(
-                candidate.skills, job_requirements["skills"]
-            ),
-            "experience_match": self._calculate_experience_match(
-                candidate.experience_years, job_requirements["experience_years"]
-            ),
-            "education_match": self._calculate_education_match(
-                candidate.education, job_requirements["education_level"]
-            ),
-            "location_match": self._calculate_location_match(
-                candidate.location, job_requirements["locations"]
-            )
-        }
-        
-        # Calculate weighted overall score
-        weights = {
-            "semantic_similarity": 0.35,
-            "skills_match": 0.30,
-            "experience_match": 0.20,
-            "education_match": 0.10,
-            "location_match": 0.05
-        }
-        
-        overall_score = sum(
-            scores[component] * weights[component] 
-            for component in scores
+        overall_scores, component_scores = self._score_components(
+            [candidate],
+            [self._calculate_semantic_similarity(candidate, job)],
+            job_requirements
         )
+        scores = {name: float(values[0]) for name, values in component_scores.items()}
         
         return {
-            "overall_score": round(overall_score, 3),
+            "overall_score": float(overall_scores[0]),
             "component_scores": scores,
             "job_requirements": job_requirements,
             "match_explanation": self._generate_match_explanation(scores, job_requirements)
         }
     
+    def _candidate_match_query(self, db: Session, with_embeddings: bool = True):
+        """
+        Candidate query projecting only the columns scoring needs
+        
+        Skips heavy JSONB like work_experience, and transfers the float
+        embedding only for rows without an int8 copy. Batch searches read
+        embeddings from the embedding store and pass with_embeddings=False.
+        """
+        columns = [Candidate.id, Candidate.full_name]
+        if with_embeddings:
+            columns += [
+                Candidate.embedding_meta,
+                Candidate.resume_embedding_i8,
+                Candidate.resume_embedding_i8_norm,
+                case(
+                    (Candidate.resume_embedding_i8.is_(None), Candidate.resume_embedding)
+                ).label("resume_embedding")
+            ]
+        columns += [
+            Candidate.resume_text,
+            Candidate.skills,
+            Candidate.total_experience_years,
+            Candidate.education,
+            Candidate.location
+        ]
+        return db.query(Candidate).with_entities(*columns)
+    
     def find_best_candidates(
         self, 
         job_id: int, 
@@ -147,23 +548,289 @@ class JobCandidateMatchingService:
         """
         Find best matching candidates for a job
         """
-        candidates = db.query(Candidate).all()
-        candidate_scores = []
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            return []
         
-        for candidate in candidates:
-            score_data = self.calculate_match_score(candidate.id, job_id, db)
-            if "error" not in score_data:
-                candidate_scores.append({
-                    "candidate_id": candidate.id,
-                    "candidate_name": f"{candidate.first_name} {candidate.last_name}",
-                    "score": score_data["overall_score"],
-                    "component_scores": score_data["component_scores"],
-                    "explanation": score_data["match_explanation"]
-                })
+        if settings.JOB_MATCH_SHORTLIST_FACTOR > 0:
+            # Only the semantic nearest neighbours are loaded and fully scored
+            similarity_of = self._semantic_shortlist(
+                job, db, limit * settings.JOB_MATCH_SHORTLIST_FACTOR
+            )
+            candidates, job_requirements, similarities = self._prepare_batch(
+                job, db, list(similarity_of), similarity_of
+            )
+        else:
+            candidates, job_requirements, similarities = self._prepare_batch(job, db)
+        if not candidates:
+            return []
         
-        # Sort by score and return top candidates
-        candidate_scores.sort(key=lambda x: x["score"], reverse=True)
-        return candidate_scores[:limit]
+        overall_scores, component_scores = self._score_components(
+            candidates, similarities, job_requirements
+        )
+        
+        # Only the top candidates are ranked and get result dicts/explanations
+        results = []
+        for i in self._top_k_indices(overall_scores, limit):
+            scores = {name: float(values[i]) for name, values in component_scores.items()}
+            results.append({
+                "candidate_id": candidates[i].id,
+                "candidate_name": candidates[i].full_name,
+                "score": float(overall_scores[i]),
+                "component_scores": scores,
+                "explanation": self._generate_match_explanation(scores, job_requirements)
+            })
+        return results
+    
+    def score_candidates_batch(
+        self,
+        job_id: int,
+        db: Session,
+        candidate_ids: Optional[List[int]] = None
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Score many candidates against one job with array operations
+        
+        Args:
+            job_id: Job to match against
+            db: Database session
+            candidate_ids: Candidates to score (default: all candidates)
+        
+        Returns:
+            (candidate_ids, overall_scores, component_scores) where
+            component_scores maps each component name to an array aligned
+            with candidate_ids. All arrays are empty if the job does not exist.
+        
+        Example:
+            ids, overall, components = job_matcher_service.score_candidates_batch(job_id, db)
+            shortlist = ids[overall >= 0.7]
+        """
+        job = db.query(Job).filter(Job.id == job_id).first()
+        candidates, job_requirements, similarities = (
+            self._prepare_batch(job, db, candidate_ids) if job else ([], None, None)
+        )
+        if not candidates:
+            empty = np.empty(0, dtype=np.float64)
+            return np.empty(0, dtype=np.int64), empty, {name: empty for name in self.SCORE_WEIGHTS}
+        
+        overall_scores, component_scores = self._score_components(
+            candidates, similarities, job_requirements
+        )
+        candidate_ids = np.fromiter(
+            (candidate.id for candidate in candidates), dtype=np.int64, count=len(candidates)
+        )
+        return candidate_ids, overall_scores, component_scores
+    
+    def _semantic_shortlist(self, job: Job, db: Session, k: int) -> Dict[int, float]:
+        """
+        Ids and cosine similarities of the k candidates closest to the job
+        
+        pgvector computes the distances server-side using the ivfflat index
+        on resume_embedding, so only the shortlist leaves the database.
+        Candidates without a current stored resume embedding are not considered.
+        """
+        job_embedding = np.asarray(self._get_job_embedding(job), dtype=np.float32)
+        
+        # SET does not take bind parameters; the probe count is an int constant
+        db.execute(text(f"SET LOCAL ivfflat.probes = {int(self.SHORTLIST_IVFFLAT_PROBES)}"))
+        rows = db.execute(text("""
+            SELECT id, 1 - (resume_embedding <=> :job_embedding) AS similarity
+            FROM candidates
+            WHERE resume_embedding IS NOT NULL
+                AND (embedding_meta IS NULL OR embedding_meta = CAST(:fingerprint AS jsonb))
+            ORDER BY resume_embedding <=> :job_embedding
+            LIMIT :k
+        """).bindparams(bindparam("job_embedding", type_=Vector(768))), {
+            "job_embedding": job_embedding,
+            "fingerprint": json.dumps(self.embedding_fingerprint),
+            "k": k
+        }).fetchall()
+        
+        return {row.id: float(row.similarity) for row in rows}
+    
+    def _prepare_batch(
+        self,
+        job: Job,
+        db: Session,
+        candidate_ids: Optional[List[int]] = None,
+        similarity_of: Optional[Dict[int, float]] = None
+    ) -> Tuple[List[Any], Dict[str, Any], Optional[np.ndarray]]:
+        """
+        Load candidate rows, job requirements and semantic similarities
+        
+        similarity_of supplies similarities already computed by the
+        database (see _semantic_shortlist) instead of the embedding store.
+        
+        Returns:
+            (candidates, job_requirements, similarities)
+        """
+        # Requirements depend only on the job, so NER runs once per search.
+        # When it has to run, it overlaps the candidate query and the
+        # similarity GEMV (torch/ORT and BLAS release the GIL)
+        job_requirements = self._stored_job_requirements(job)
+        requirements_future = None
+        if job_requirements is None:
+            requirements_future = _MATCHER_EXECUTOR.submit(
+                self.extract_job_requirements, job.description
+            )
+        
+        # One projected query, streamed in chunks; no DB I/O in the scoring loop
+        query = self._candidate_match_query(db, with_embeddings=False)
+        if candidate_ids is not None:
+            query = query.filter(Candidate.id.in_(candidate_ids))
+        candidates = query.yield_per(1000).all()
+        if not candidates:
+            similarities = None
+        elif similarity_of is not None:
+            similarities = np.fromiter(
+                (similarity_of[candidate.id] for candidate in candidates),
+                dtype=np.float32, count=len(candidates)
+            )
+        else:
+            similarities = self._calculate_semantic_similarity_batch(candidates, job, db)
+        
+        if requirements_future is not None:
+            job_requirements = requirements_future.result()
+            self._persist_job_requirements(job, job_requirements, db)
+        
+        return candidates, job_requirements, similarities
+    
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Indices of the k highest scores, best first
+        
+        A partition finds the k-th score in O(N); only scores at or above it
+        are sorted. Ties keep candidate order, as the previous stable full
+        sort did.
+        """
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        if k < len(scores):
+            # Keep every score tied with the k-th so the stable sort decides ties
+            kth_score = -np.partition(-scores, k - 1)[k - 1]
+            top = np.flatnonzero(scores >= kth_score)
+        else:
+            top = np.arange(len(scores))
+        return top[np.argsort(-scores[top], kind="stable")][:k]
+    
+    def _score_components(
+        self,
+        candidates: List[Any],
+        similarities,
+        job_requirements: Dict[str, Any]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Component and overall scores for candidates against already-extracted
+        job requirements and precomputed semantic similarities
+        
+        Per-candidate Python work is limited to packing each feature into a
+        typed array; every component is then one vector expression.
+        
+        Returns:
+            (overall_scores, component_scores), arrays aligned with candidates
+        """
+        component_scores = {
+            "semantic_similarity": np.asarray(similarities, dtype=np.float64),
+            "skills_match": self._skills_match_scores(candidates, job_requirements["skills"]),
+            "experience_match": self._experience_match_scores(candidates, job_requirements["experience_years"]),
+            "education_match": self._education_match_scores(candidates, job_requirements["education_level"]),
+            "location_match": self._location_match_scores(candidates, job_requirements["locations"])
+        }
+        
+        # Weighted sum of all components as one matrix-vector product
+        overall_scores = self._WEIGHT_VECTOR @ np.stack(
+            [component_scores[component] for component in self.SCORE_WEIGHTS]
+        )
+        return np.round(overall_scores, 3), component_scores
+    
+    def _candidate_embedding_text(self, candidate) -> str:
+        """Text used to embed a candidate that has no stored resume embedding"""
+        technical_skills = ' '.join(candidate.skills.get('technical', [])) if candidate.skills else ''
+        return f"{candidate.resume_text or ''} {technical_skills}"
+    
+    def _get_job_embedding(self, job) -> np.ndarray:
+        """Stored 768-dim job embedding, or a freshly generated one"""
+        if job.job_description_embedding is not None and len(job.job_description_embedding) == 768:
+            return np.asarray(job.job_description_embedding, dtype=np.float32)
+        return self.embedding_service.generate_text_embedding(job.description)
+    
+    def _calculate_semantic_similarity_batch(self, candidates, job, db: Session) -> np.ndarray:
+        """
+        Semantic similarity of every candidate against one job
+        
+        One matrix-vector product over the embedding store against the unit
+        job vector scores every stored candidate; the results are gathered
+        by candidate id. Candidates outside the store are handled by
+        _similarities_outside_store.
+        """
+        try:
+            job_embedding = np.asarray(self._get_job_embedding(job), dtype=np.float32)
+            job_norm = float(np.linalg.norm(job_embedding))
+            if job_norm == 0:
+                return np.zeros(len(candidates), dtype=np.float32)
+            job_unit = job_embedding / job_norm
+            
+            row_of, store_embeddings, store_inv_norms = self.embedding_store.snapshot(db)
+            store_similarities = (store_embeddings @ job_unit) * store_inv_norms
+            
+            similarities = np.empty(len(candidates), dtype=np.float32)
+            outside = []
+            for i, candidate in enumerate(candidates):
+                row = row_of.get(candidate.id)
+                if row is None:
+                    outside.append(i)
+                else:
+                    similarities[i] = store_similarities[row]
+            
+            if outside:
+                similarities[outside] = self._similarities_outside_store(
+                    [candidates[i] for i in outside], job_unit, db
+                )
+            
+            return similarities
+            
+        except Exception as e:
+            logger.error(f"Error calculating batch semantic similarity: {e}")
+            return np.full(len(candidates), 0.5, dtype=np.float32)  # Neutral scores on error
+    
+    def _similarities_outside_store(self, candidates, job_unit: np.ndarray, db: Session) -> np.ndarray:
+        """
+        Similarities for candidates without a current int8 embedding
+        
+        Legacy float embeddings are fetched in one query; candidates with
+        none, or with a stale one, are embedded together in one batch.
+        """
+        float_embeddings = {
+            candidate_id: (embedding, embedding_meta)
+            for candidate_id, embedding, embedding_meta in
+            db.query(Candidate.id, Candidate.resume_embedding, Candidate.embedding_meta)
+            .filter(Candidate.id.in_([candidate.id for candidate in candidates]))
+            .all()
+        }
+        
+        embeddings = np.empty((len(candidates), 768), dtype=np.float32)
+        missing = []
+        for i, candidate in enumerate(candidates):
+            embedding, embedding_meta = float_embeddings.get(candidate.id, (None, None))
+            if (embedding is not None and len(embedding) == 768
+                    and self._embedding_is_current(embedding_meta)):
+                embeddings[i] = embedding
+            else:
+                missing.append(i)
+        
+        if missing:
+            embeddings[missing] = self.embedding_service.batch_generate_embeddings(
+                [self._candidate_embedding_text(candidates[i]) for i in missing]
+            )
+        
+        norms = np.linalg.norm(embeddings, axis=1)
+        # Zero rows get a 0 score rather than a division by zero
+        return (embeddings @ job_unit) * np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    
+    def _embedding_is_current(self, embedding_meta: Optional[Dict[str, Any]]) -> bool:
+        """Whether a stored embedding is comparable with the embedding service's (see _current_embedding_clause)"""
+        return embedding_meta is None or embedding_meta == self.embedding_fingerprint
     
     def _calculate_semantic_similarity(self, candidate, job) -> float:
         """
@@ -171,27 +838,44 @@ class JobCandidateMatchingService:
         Uses pre-computed embeddings from database if available
         """
         try:
-            # Try to use pre-computed embeddings from database (768-dim)
-            if candidate.resume_embedding is not None and len(candidate.resume_embedding) == 768:
-                candidate_embedding = np.array(candidate.resume_embedding)
+            # Try to use pre-computed embeddings from database (int8 copy or 768-dim float)
+            # unless they come from a different embedding model
+            stored_is_current = self._embedding_is_current(candidate.embedding_meta)
+            if stored_is_current and candidate.resume_embedding_i8 is not None:
+                candidate_embedding = np.frombuffer(candidate.resume_embedding_i8, dtype=np.int8)
+            elif (stored_is_current and candidate.resume_embedding is not None
+                    and len(candidate.resume_embedding) == 768):
+                candidate_embedding = np.asarray(candidate.resume_embedding, dtype=np.float32)
             else:
                 # Generate new embedding if not available
-                candidate_text = f"{candidate.summary} {' '.join(candidate.skills.get('technical', [])) if candidate.skills else ''}"
-                candidate_emb_list = self.embedding_service.generate_text_embedding(candidate_text)
-                candidate_embedding = np.array(candidate_emb_list)
+                candidate_embedding = self.embedding_service.generate_text_embedding(
+                    self._candidate_embedding_text(candidate)
+                )
             
-            if job.job_description_embedding is not None and len(job.job_description_embedding) == 768:
-                job_embedding = np.array(job.job_description_embedding)
-            else:
-                # Generate new embedding if not available
-                job_emb_list = self.embedding_service.generate_text_embedding(job.description)
-                job_embedding = np.array(job_emb_list)
+            job_embedding = self._get_job_embedding(job)
             
-            # Calculate cosine similarity using embedding service
-            similarity = self.embedding_service.cosine_similarity(
-                candidate_embedding,
-                job_embedding
-            )
+            if simd_cosine is not None and candidate_embedding.dtype == np.int8:
+                # int8 cosine distance (VNNI dot-product kernels where available)
+                job_embedding_i8, _ = quantize_embedding_int8(job_embedding)
+                if job_embedding_i8 is None:
+                    return 0.0
+                similarity = 1.0 - float(simd_cosine(
+                    candidate_embedding,
+                    np.frombuffer(job_embedding_i8, dtype=np.int8)
+                ))
+            elif simd_cosine is not None:
+                # SimSIMD returns cosine distance, computed with AVX-512/NEON kernels
+                similarity = 1.0 - float(simd_cosine(
+                    np.ascontiguousarray(candidate_embedding, dtype=np.float32),
+                    np.ascontiguousarray(job_embedding, dtype=np.float32)
+                ))
+            else:
+                # Calculate cosine similarity using embedding service
+                # (int8 is widened first so the dot products cannot overflow)
+                similarity = self.embedding_service.cosine_similarity(
+                    candidate_embedding.astype(np.float32, copy=False),
+                    job_embedding
+                )
             
             logger.debug(f"Semantic similarity: {similarity:.3f} (using 768-dim JobBERT-v3)")
             return float(similarity)
@@ -200,125 +884,130 @@ class JobCandidateMatchingService:
             logger.error(f"Error calculating semantic similarity: {e}")
             return 0.5  # Return neutral score on error
     
-    def _calculate_skills_match(self, candidate_skills: Dict[str, List[str]], required_skills: List[str]) -> float:
+    def _skills_match_scores(self, candidates: List[Any], required_skills: List[str]) -> np.ndarray:
         """
-        Calculate skills match score
+        Skills match score per candidate
         Candidate skills is a dict with 'technical' and 'soft' keys
-        """
-        if not candidate_skills or not required_skills:
-            return 0.0
         
-        # Extract all skills from candidate (technical + soft)
-        all_candidate_skills = []
-        if isinstance(candidate_skills, dict):
-            all_candidate_skills.extend(candidate_skills.get('technical', []))
-            all_candidate_skills.extend(candidate_skills.get('soft', []))
-        elif isinstance(candidate_skills, list):
-            all_candidate_skills = candidate_skills
-        
-        if not all_candidate_skills:
-            return 0.0
+        Required skills come from SKILL_KEYWORDS, so only known skills can
+        match and each overlap is a popcount of two ANDed bitmasks.
+        """
+        matched_counts = np.zeros(len(candidates), dtype=np.int32)
+        if not required_skills:
+            return matched_counts.astype(np.float64)
         
-        candidate_skills_lower = [skill.lower() for skill in all_candidate_skills]
-        required_skills_lower = [skill.lower() for skill in required_skills]
+        required_mask = 0
+        for skill in required_skills:
+            bit = _SKILL_BITS.get(skill.lower())
+            if bit is None:
+                # Arbitrary required skills fall back to string sets
+                required_mask = None
+                required_lower = {skill.lower() for skill in required_skills}
+                break
+            required_mask |= bit
         
-        matched_skills = set(candidate_skills_lower) & set(required_skills_lower)
-        match_ratio = len(matched_skills) / len(required_skills_lower)
+        for i, candidate in enumerate(candidates):
+            # Extract all skills from candidate (technical + soft)
+            candidate_skills = candidate.skills
+            if isinstance(candidate_skills, dict):
+                all_candidate_skills = candidate_skills.get('technical', []) + candidate_skills.get('soft', [])
+            elif isinstance(candidate_skills, list):
+                all_candidate_skills = candidate_skills
+            else:
+                continue
+            
+            if required_mask is not None:
+                candidate_mask = 0
+                for skill in all_candidate_skills:
+                    candidate_mask |= _SKILL_BITS.get(skill.lower(), 0)
+                matched_counts[i] = (candidate_mask & required_mask).bit_count()
+            else:
+                matched_counts[i] = len({skill.lower() for skill in all_candidate_skills} & required_lower)
         
-        logger.debug(f"Skills match: {len(matched_skills)}/{len(required_skills_lower)} = {match_ratio:.2f}")
-        return min(match_ratio, 1.0)
+        return np.minimum(matched_counts / len(required_skills), 1.0)
     
-    def _calculate_experience_match(self, candidate_exp: int, required_exp: int) -> float:
+    def _experience_match_scores(self, candidates: List[Any], required_exp: Optional[int]) -> np.ndarray:
         """
-        Calculate experience match score
+        Experience match score per candidate: full credit at or above the
+        requirement, partial credit below it, neutral 0.5 if unknown
         """
-        if required_exp is None or candidate_exp is None:
-            return 0.5  # Neutral score if information missing
+        if required_exp is None:
+            return np.full(len(candidates), 0.5)
         
-        if candidate_exp >= required_exp:
-            return 1.0
+        candidate_exp = np.fromiter(
+            (np.nan if c.total_experience_years is None else c.total_experience_years for c in candidates),
+            dtype=np.float64, count=len(candidates)
+        )
+        if required_exp > 0:
+            partial = np.clip(candidate_exp / required_exp, 0.0, 1.0)
         else:
-            # Partial credit for partial experience
-            return max(0.0, candidate_exp / required_exp)
+            partial = np.zeros_like(candidate_exp)
+        scores = np.where(candidate_exp >= required_exp, 1.0, partial)
+        scores[np.isnan(candidate_exp)] = 0.5  # Neutral score if information missing
+        return scores
     
-    def _calculate_education_match(self, candidate_education: str, required_education: str) -> float:
+    def _education_match_scores(self, candidates: List[Any], required_education: Optional[str]) -> np.ndarray:
         """
-        Calculate education match score
+        Education match score per candidate, comparing hierarchy levels
         """
-        if not candidate_education or not required_education:
-            return 0.5
-        
-        education_hierarchy = {
-            "high school": 1,
-            "diploma": 2,
-            "bachelor": 3,
-            "master": 4,
-            "phd": 5,
-            "doctorate": 5
-        }
-        
-        candidate_level = self._get_education_level(candidate_education, education_hierarchy)
-        required_level = self._get_education_level(required_education, education_hierarchy)
+        if not required_education:
+            return np.full(len(candidates), 0.5)
         
-        if candidate_level >= required_level:
-            return 1.0
-        else:
-            return max(0.0, candidate_level / required_level)
+        required_level = self._get_education_level(required_education)
+        # Level 0 marks a candidate without education data
+        candidate_level = np.fromiter(
+            (self._get_education_level(c.education) if c.education else 0 for c in candidates),
+            dtype=np.int8, count=len(candidates)
+        )
+        scores = np.where(candidate_level >= required_level, 1.0, candidate_level / required_level)
+        scores[candidate_level == 0] = 0.5
+        return scores
     
-    def _calculate_location_match(self, candidate_location: str, required_locations: List[str]) -> float:
+    def _location_match_scores(self, candidates: List[Any], required_locations: List[str]) -> np.ndarray:
         """
-        Calculate location match score
+        Location match score per candidate: 1.0 if any required location
+        appears in the candidate's location, 0.5 if either is unknown
         """
-        if not candidate_location or not required_locations:
-            return 0.5
+        if not required_locations:
+            return np.full(len(candidates), 0.5)
         
-        candidate_location_lower = candidate_location.lower()
-        for location in required_locations:
-            if location.lower() in candidate_location_lower:
-                return 1.0
-        
-        return 0.0
+        required_lower = [location.lower() for location in required_locations]
+        # -1 marks a candidate without a location
+        hits = np.fromiter(
+            (
+                any(location in c.location.lower() for location in required_lower) if c.location else -1
+                for c in candidates
+            ),
+            dtype=np.int8, count=len(candidates)
+        )
+        return np.where(hits < 0, 0.5, hits.astype(np.float64))
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """
         Extract skills from text using enhanced keyword matching
         """
-        # Common technology skills (expand based on your domain)
-        skill_keywords = [
-            "python", "java", "javascript", "react", "angular", "vue",
-            "nodejs", "django", "flask", "fastapi", "spring", "sql",
-            "postgresql", "mysql", "mongodb", "docker", "kubernetes",
-            "aws", "azure", "gcp", "machine learning", "ai", "data science",
-            "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy"
-        ]
-        
         text_lower = text.lower()
-        found_skills = []
         
-        for skill in skill_keywords:
-            if skill in text_lower:
-                found_skills.append(skill)
+        if _SKILL_AUTOMATON is not None:
+            # One pass over the text; sorting indexes keeps SKILL_KEYWORDS order
+            found = {index for _, index in _SKILL_AUTOMATON.iter(text_lower)}
+            return [SKILL_KEYWORDS[index] for index in sorted(found)]
         
-        return found_skills
+        return [skill for skill in SKILL_KEYWORDS if skill in text_lower]
     
     def _extract_experience_years(self, text: str) -> int:
         """
         Extract required experience years from job description
         """
-        import re
-        
-        # Look for patterns like "2+ years", "3-5 years experience"
-        patterns = [
-            r"(\d+)\+?\s*years?\s*(?:of\s*)?experience",
-            r"(\d+)\s*to\s*\d+\s*years?",
-            r"minimum\s*(\d+)\s*years?",
-            r"at\s*least\s*(\d+)\s*years?"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return int(match.group(1))
+        # The highest-priority pattern wins, at its leftmost position
+        best = None
+        for match in _EXPERIENCE_RE.finditer(text):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
+        if best:
+            return int(best.group(best.lastindex))
         
         return None
     
@@ -341,17 +1030,29 @@ class JobCandidateMatchingService:
         
         return None
     
-    def _get_education_level(self, education_text: str, hierarchy: Dict[str, int]) -> int:
+    def _get_education_level(self, education: Any) -> int:
         """
         Get numeric education level from text
+        
+        Accepts plain text or the candidate's JSONB education entries
+        ([{"degree": ...}, ...]); the highest level mentioned wins.
         """
-        education_lower = education_text.lower()
+        if isinstance(education, list):
+            education = " ".join(
+                str(entry.get("degree", "")) if isinstance(entry, dict) else str(entry)
+                for entry in education
+            )
+        elif isinstance(education, dict):
+            education = str(education.get("degree", ""))
+        education_lower = education.lower()
         
-        for level, value in hierarchy.items():
-            if level in education_lower:
-                return value
+        if _EDUCATION_AUTOMATON is not None:
+            return max((value for _, value in _EDUCATION_AUTOMATON.iter(education_lower)), default=1)
         
-        return 1  # Default to high school level
+        return max(
+            (value for level, value in EDUCATION_HIERARCHY.items() if level in education_lower),
+            default=1  # Default to high school level
+        )
     
     def _generate_match_explanation(self, scores: Dict[str, float], job_requirements: Dict[str, Any]) -> str:
         """
@@ -0,0 +1,152 @@
+"""
+Exact-match LLM Response Cache
+
+Caches responses of near-deterministic generations (temperature <= 0.1), so
+re-parsing an identical resume or re-sending an identical prompt does not
+trigger a fresh LLM call. Keys are sha256 digests of (provider, model, prompt,
+options), so a response is only reused for exactly the same request to the
+same model.
+
+Storage follows EvaluationCache: Redis with an in-process LRU fallback while
+Redis is unreachable (retried after REDIS_RETRY_SECONDS).
+"""
+
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
+import logging
+import time
+
+import orjson
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache for deterministic LLM responses.
+    """
+
+    KEY_PREFIX = "llm"
+    # Sampling above this temperature is not reproducible enough to cache
+    MAX_CACHEABLE_TEMPERATURE = 0.1
+    # After a Redis error, serve from the in-process cache for this long, then retry
+    REDIS_RETRY_SECONDS = 30.0
+
+    def __init__(self, ttl_seconds: int = 86400, max_local_entries: int = 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            ttl_seconds: Expiry for entries in Redis
+            max_local_entries: Size of the in-process fallback
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_local_entries = max_local_entries
+
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_retry_at = 0.0
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def is_cacheable(self, options) -> bool:
+        """Whether a generation with these LLMOptions is deterministic enough to cache."""
+        return options.temperature <= self.MAX_CACHEABLE_TEMPERATURE
+
+    def key(self, provider: str, model: str, prompt: str, options) -> str:
+        """Build the cache key for a generation request."""
+        # orjson serializes the LLMOptions dataclass directly and returns bytes
+        request = orjson.dumps(
+            {"provider": provider, "model": model, "prompt": prompt, "opts": options},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return f"{self.KEY_PREFIX}:{hashlib.sha256(request).hexdigest()}"
+
+    def _get_redis(self) -> Optional[aioredis.Redis]:
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, socket_connect_timeout=1)
+        return self._redis
+
+    def _disable_redis(self, error: Exception):
+        logger.warning(
+            f"Redis unavailable for LLM response cache, using in-process cache "
+            f"for {self.REDIS_RETRY_SECONDS:.0f}s: {error}"
+        )
+        self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_SECONDS
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            Cached LLMResponse fields as a dict, or None on miss
+        """
+        client = self._get_redis()
+        if client is not None:
+            try:
+                cached = await client.get(key)
+                if cached is not None:
+                    self.hits += 1
+                    logger.debug(f"LLM response cache hit (redis): {key}")
+                    return orjson.loads(cached)
+            except Exception as e:
+                self._disable_redis(e)
+
+        if key in self._local:
+            self._local.move_to_end(key)
+            self.hits += 1
+            logger.debug(f"LLM response cache hit (local): {key}")
+            return dict(self._local[key])
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, response: Dict[str, Any]):
+        """
+        Store a response.
+
+        Args:
+            key: Key from key()
+            response: LLMResponse fields as a dict
+        """
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await client.set(key, orjson.dumps(response), ex=self.ttl_seconds)
+            except Exception as e:
+                self._disable_redis(e)
+
+        self._local[key] = response
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for observability."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "local_entries": len(self._local)
+        }
+
+    async def aclose(self):
+        """Close the Redis connection."""
+        if self._redis is not None:
+            try:
+                await self._redis.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing LLM response cache redis client: {e}")
+            self._redis = None
@@ -28,23 +28,76 @@ Architecture:
     LLMService (Orchestrator)
         - Manages providers
         - Handles automatic failover
-        - Tracks provider health
+        - Tracks provider health (per-provider circuit breaker)
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Any, Optional, List, TypeVar
+from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import partial
+import asyncio
+import json
 import logging
-import aiohttp
+import threading
+import httpx
+import math
+import numpy as np
+import orjson
+import random
 import time
-from functools import lru_cache
+from collections import deque
 import google.generativeai as genai
 
 from app.core.config import settings
+from app.services.llm_cache import LLMResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Request bodies are pre-serialized with orjson rather than httpx's stdlib encoder
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Ollama responses worth retrying: rate limiting and transient server errors
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+T = TypeVar("T")
+
+
+def extract_json_object(text: str) -> Dict[str, Any]:
+    """
+    Decode the first JSON object embedded in LLM output.
+    
+    Bare JSON is parsed with orjson. Otherwise decodes in place with
+    raw_decode (no slice copy, no scan to the end of the text). If decoding
+    from a '{' fails, e.g. a stray brace in leading prose, the next '{' is
+    tried instead.
+    
+    Raises:
+        json.JSONDecodeError: If no JSON object can be decoded
+    """
+    # Fast path: with format="json" the output is usually a bare object
+    try:
+        obj = orjson.loads(text)
+        if isinstance(obj, dict):
+            return obj
+    except orjson.JSONDecodeError:
+        pass
+    
+    start = text.find('{')
+    if start == -1:
+        raise json.JSONDecodeError("No JSON object found", text, 0)
+    
+    while True:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError:
+            start = text.find('{', start + 1)
+            if start == -1:
+                raise
+
 
 class ProviderStatus(Enum):
     """Provider health status."""
@@ -53,7 +106,7 @@ class ProviderStatus(Enum):
     UNAVAILABLE = "unavailable"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Standardized LLM response."""
     content: str
@@ -63,7 +116,7 @@ class LLMResponse:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMOptions:
     """Options for LLM generation."""
     temperature: float = 0.7
@@ -73,8 +126,101 @@ class LLMOptions:
     system_prompt: Optional[str] = None
 
 
+class JSONCompletionTracker:
+    """
+    Track brace depth over streamed text to detect when a JSON object closes.
+    
+    Braces inside string literals (including escaped quotes) are ignored.
+    """
+    
+    __slots__ = ("depth", "started", "in_string", "escaped")
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True once the top-level object is complete."""
+        for ch in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                if self.started:
+                    self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+@dataclass(slots=True)
+class OllamaJob:
+    """A queued generation request awaiting a worker."""
+    prompt: str
+    options: LLMOptions
+    future: asyncio.Future
+
+
+@dataclass(eq=False, slots=True)
+class CircuitTicket:
+    """Admission through a provider's circuit breaker (returned by allow_request)."""
+    probe: bool = False  # Holds the single half-open probe slot
+
+
+class OllamaTransientError(Exception):
+    """A retryable Ollama failure (429 / 5xx), with the server's Retry-After if given."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _ollama_error(kind: str, response: httpx.Response, body: str) -> Exception:
+    """Exception for a non-200 Ollama response; transient statuses are retryable."""
+    message = f"Ollama {kind} error {response.status_code}: {body}"
+    if response.status_code not in _RETRYABLE_STATUSES:
+        return Exception(message)
+    try:
+        retry_after = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        retry_after = None  # absent, or an HTTP date
+    return OllamaTransientError(message, retry_after)
+
+
 class LLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """
+    Abstract base class for LLM providers.
+    
+    Each provider carries a circuit breaker:
+    - Closed (HEALTHY / DEGRADED): requests flow
+    - Open (UNAVAILABLE): requests are skipped until open_until
+    - Half-open: after open_until one probe request is let through; success
+      closes the circuit, failure re-opens it with a doubled timeout
+    
+    The circuit opens after OPEN_AFTER_FAILURES consecutive failures, or when
+    more than FAILURE_RATE_THRESHOLD of the last FAILURE_WINDOW requests
+    failed (once MIN_REQUESTS_IN_WINDOW have been seen). Providers that are
+    not configured stay open for good.
+    """
+    
+    DEGRADED_AFTER_FAILURES = 3
+    OPEN_AFTER_FAILURES = 5
+    FAILURE_WINDOW = 20
+    MIN_REQUESTS_IN_WINDOW = 10
+    FAILURE_RATE_THRESHOLD = 0.5
+    OPEN_TIMEOUT = 30.0  # seconds, doubled on every failed probe
+    MAX_OPEN_TIMEOUT = 300.0
     
     def __init__(self, name: str):
         self.name = name
@@ -83,6 +229,13 @@ class LLMProvider(ABC):
         self.last_error_time: Optional[float] = None
         self.request_count = 0
         self.error_count = 0
+        
+        # Circuit breaker state
+        self.consecutive_failures = 0
+        self.open_count = 0
+        self.open_until = 0.0
+        self._probe_ticket: Optional[CircuitTicket] = None
+        self._outcomes: "deque[bool]" = deque(maxlen=self.FAILURE_WINDOW)
     
     @abstractmethod
     async def generate(self, prompt: str, options: LLMOptions) -> LLMResponse:
@@ -94,30 +247,113 @@ class LLMProvider(ABC):
         """Check if provider is available."""
         pass
     
+    async def warmup(self) -> bool:
+        """Open connections ahead of the first request (default: one health check)."""
+        return await self.health_check()
+    
+    def mark_unconfigured(self):
+        """Open the circuit permanently (missing credentials; never probed)."""
+        self.status = ProviderStatus.UNAVAILABLE
+        self.open_until = math.inf
+    
+    def is_accepting_requests(self) -> bool:
+        """Whether a request may be sent now (closed, or open with a probe due)."""
+        if self.status != ProviderStatus.UNAVAILABLE:
+            return True
+        return not self.half_open_in_flight and time.time() >= self.open_until
+    
+    @property
+    def half_open_in_flight(self) -> bool:
+        """Whether a half-open probe request is currently running."""
+        return self._probe_ticket is not None
+    
+    def allow_request(self) -> Optional[CircuitTicket]:
+        """
+        Admit a request through the circuit breaker.
+        
+        When the open timeout has elapsed the ticket claims the single
+        half-open probe slot. Pass it to release() once the request has
+        finished.
+        
+        Returns:
+            Admission ticket, or None if the circuit is open
+        """
+        if not self.is_accepting_requests():
+            return None
+        if self.status == ProviderStatus.UNAVAILABLE:
+            self._probe_ticket = CircuitTicket(probe=True)
+            logger.info(f"{self.name} circuit half-open, sending probe request")
+            return self._probe_ticket
+        return CircuitTicket()
+    
+    def release(self, ticket: CircuitTicket, success: Optional[bool] = None):
+        """
+        Finish an admitted request.
+        
+        Only the ticket holding the probe slot settles the half-open state:
+        success closes the circuit, failure re-opens it with a longer
+        timeout, and no verdict (e.g. cancelled) just frees the slot. Other
+        requests, including ones admitted before the circuit opened, never
+        touch it.
+        """
+        if ticket is not self._probe_ticket:
+            return
+        self._probe_ticket = None
+        if success is True:
+            self._close_circuit()
+        elif success is False:
+            # Failed probe: back off for longer
+            self._open_circuit()
+    
+    def _failure_rate_exceeded(self) -> bool:
+        if len(self._outcomes) < self.MIN_REQUESTS_IN_WINDOW:
+            return False
+        failures = self._outcomes.count(False)
+        return failures / len(self._outcomes) > self.FAILURE_RATE_THRESHOLD
+    
+    def _open_circuit(self):
+        self.open_count += 1
+        timeout = min(self.OPEN_TIMEOUT * 2 ** (self.open_count - 1), self.MAX_OPEN_TIMEOUT)
+        self.open_until = time.time() + timeout
+        self.status = ProviderStatus.UNAVAILABLE
+        logger.warning(f"{self.name} circuit open, skipping it for {timeout:.0f}s")
+    
+    def _close_circuit(self):
+        logger.info(f"{self.name} recovered, marking as healthy")
+        self.status = ProviderStatus.HEALTHY
+        self.error_count = 0
+        self.last_error = None
+        self.open_count = 0
+        self.open_until = 0.0
+        self._outcomes.clear()
+    
     def mark_error(self, error: str):
         """Mark provider as having an error."""
         self.last_error = error
         self.last_error_time = time.time()
         self.error_count += 1
+        self.consecutive_failures += 1
+        self._outcomes.append(False)
         
-        # Mark as degraded after 3 errors, unavailable after 5
-        if self.error_count >= 5:
-            self.status = ProviderStatus.UNAVAILABLE
-        elif self.error_count >= 3:
-            self.status = ProviderStatus.DEGRADED
+        # While open, only the probe's release() changes the circuit state
+        if self.status != ProviderStatus.UNAVAILABLE:
+            if self.consecutive_failures >= self.OPEN_AFTER_FAILURES or self._failure_rate_exceeded():
+                self._open_circuit()
+            elif self.consecutive_failures >= self.DEGRADED_AFTER_FAILURES:
+                self.status = ProviderStatus.DEGRADED
         
         logger.warning(f"{self.name} error #{self.error_count}: {error}")
     
     def mark_success(self):
         """Mark provider as successful."""
         self.request_count += 1
+        self.consecutive_failures = 0
+        self._outcomes.append(True)
         
-        # Reset error count after successful request
-        if self.status != ProviderStatus.HEALTHY:
-            logger.info(f"{self.name} recovered, marking as healthy")
-            self.status = ProviderStatus.HEALTHY
-            self.error_count = 0
-            self.last_error = None
+        # Reset error count after a successful request; an open circuit is
+        # only closed by its probe (see release())
+        if self.status == ProviderStatus.DEGRADED:
+            self._close_circuit()
     
     def get_health_info(self) -> Dict[str, Any]:
         """Get provider health information."""
@@ -127,13 +363,19 @@ class LLMProvider(ABC):
             "request_count": self.request_count,
             "error_count": self.error_count,
             "last_error": self.last_error,
-            "last_error_time": self.last_error_time
+            "last_error_time": self.last_error_time,
+            "circuit_open_until": self.open_until if self.status == ProviderStatus.UNAVAILABLE else None
         }
 
 
 class OllamaCloudProvider(LLMProvider):
     """Ollama Cloud provider (Primary)."""
     
+    # Transient failures are retried briefly before failing over to the next provider
+    MAX_RETRIES = 2
+    RETRY_BASE_DELAY = 0.5  # seconds, doubled per attempt (with jitter)
+    RETRY_MAX_DELAY = 8.0  # a longer Retry-After fails over instead of waiting
+    
     def __init__(self, config_settings=None):
         super().__init__("Ollama Cloud")
         self.settings = config_settings or settings
@@ -141,22 +383,105 @@ class OllamaCloudProvider(LLMProvider):
         self.base_url = self.settings.OLLAMA_CLOUD_URL
         self.model = self.settings.OLLAMA_MODEL
         
+        # Shared HTTP client (created lazily inside the running event loop)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        
+        # Client-side worker pool sized to the server's parallel slots; callers
+        # wait in a bounded FIFO queue instead of piling up inside Ollama
+        self._num_workers = max(1, self.settings.OLLAMA_NUM_PARALLEL or 1)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        
         if not self.api_key:
             logger.warning("OLLAMA_API_KEY not set, Ollama Cloud provider unavailable")
-            self.status = ProviderStatus.UNAVAILABLE
+            self.mark_unconfigured()
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+        
+        One pooled client keeps connections alive across requests; with
+        HTTP/2 enabled concurrent generations are multiplexed over a single
+        connection instead of each needing its own socket. Idle connections
+        are kept for 75s (httpx default: 5s) so requests a few seconds apart
+        still skip the TCP+TLS handshake.
+        """
+        if self._client is None or self._client.is_closed:
+            async with self._client_lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.base_url,
+                        headers={"Authorization": f"Bearer {self.api_key}"},
+                        http2=self.settings.OLLAMA_HTTP2,
+                        limits=httpx.Limits(
+                            max_connections=self.settings.OLLAMA_MAX_CONNECTIONS,
+                            max_keepalive_connections=self.settings.OLLAMA_MAX_KEEPALIVE,
+                            keepalive_expiry=75.0
+                        ),
+                        timeout=httpx.Timeout(120.0, connect=10.0)
+                    )
+        return self._client
+    
+    async def aclose(self):
+        """Stop queue workers and close the shared HTTP client."""
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    def _ensure_workers(self) -> asyncio.Queue:
+        """Start the queue and worker tasks on first use (needs a running loop)."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._num_workers * 8)
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"ollama-worker-{i}")
+                for i in range(self._num_workers)
+            ]
+            logger.info(f"Started {self._num_workers} Ollama worker(s)")
+        return self._queue
+    
+    async def _worker(self):
+        """Pull queued jobs and run them one at a time."""
+        queue = self._queue
+        while True:
+            job: OllamaJob = await queue.get()
+            try:
+                # Caller gave up while queued; don't spend a slot on it
+                if job.future.cancelled():
+                    continue
+                result = await self._generate_now(job.prompt, job.options)
+                if not job.future.done():
+                    job.future.set_result(result)
+            except asyncio.CancelledError:
+                if not job.future.done():
+                    job.future.cancel()
+                raise
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                queue.task_done()
     
     async def generate(self, prompt: str, options: LLMOptions) -> LLMResponse:
-        """Generate text using Ollama Cloud API."""
-        if self.status == ProviderStatus.UNAVAILABLE:
+        """Generate text using Ollama Cloud API (queued behind the worker pool)."""
+        if self.status == ProviderStatus.UNAVAILABLE and not self.half_open_in_flight:
             raise Exception(f"{self.name} is unavailable")
         
+        queue = self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(OllamaJob(prompt=prompt, options=options, future=future))
+        return await future
+    
+    async def _generate_now(self, prompt: str, options: LLMOptions) -> LLMResponse:
+        """Send a single generation request to Ollama Cloud."""
         try:
-            # Prepare request
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             # Build payload
             payload = {
                 "model": self.model,
@@ -177,19 +502,25 @@ class OllamaCloudProvider(LLMProvider):
             if options.response_format == "json":
                 payload["format"] = "json"
             
-            # Make request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=120)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Ollama API error {response.status}: {error_text}")
-                    
-                    result = await response.json()
+            # Make request over the shared connection pool
+            client = await self._get_client()
+            
+            if options.response_format == "json":
+                # Stream JSON generations and stop as soon as the object closes,
+                # instead of waiting for the model to exhaust num_predict
+                result = await self._with_retries(lambda: self._generate_streaming_json(client, payload))
+            else:
+                async def _post() -> Dict[str, Any]:
+                    response = await client.post(
+                        "/api/generate",
+                        content=orjson.dumps(payload),
+                        headers=_JSON_HEADERS
+                    )
+                    if response.status_code != 200:
+                        raise _ollama_error("API", response, response.text)
+                    return orjson.loads(response.content)
+                
+                result = await self._with_retries(_post)
             
             # Extract response
             content = result.get("response", "")
@@ -218,25 +549,144 @@ class OllamaCloudProvider(LLMProvider):
             self.mark_error(str(e))
             raise
     
+    async def embed_many(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Embed texts via Ollama's /api/embed, one request per batch of inputs.
+        
+        Batches are sent concurrently, so N texts cost ceil(N / batch_size)
+        round trips instead of N.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum inputs per request
+            
+        Returns:
+            float16 array of shape (len(texts), dim)
+        """
+        if self.status == ProviderStatus.UNAVAILABLE and not self.half_open_in_flight:
+            raise Exception(f"{self.name} is unavailable")
+        if not texts:
+            return np.empty((0, 0), dtype=np.float16)
+        
+        client = await self._get_client()
+        
+        async def _embed_batch(batch: List[str]) -> List[List[float]]:
+            response = await client.post(
+                "/api/embed",
+                content=orjson.dumps({"model": self.settings.OLLAMA_EMBED_MODEL, "input": batch}),
+                headers=_JSON_HEADERS
+            )
+            if response.status_code != 200:
+                raise _ollama_error("embed", response, response.text)
+            return orjson.loads(response.content)["embeddings"]
+        
+        try:
+            batches = await asyncio.gather(*[
+                self._with_retries(partial(_embed_batch, texts[i:i + batch_size]))
+                for i in range(0, len(texts), batch_size)
+            ])
+        except Exception as e:
+            self.mark_error(str(e))
+            raise
+        
+        self.mark_success()
+        # float16 halves memory; plenty of precision for similarity search
+        return np.asarray([emb for batch in batches for emb in batch], dtype=np.float16)
+    
+    async def _with_retries(self, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an Ollama request, retrying transient failures with exponential backoff.
+        
+        429 / 5xx responses and dropped connections (e.g. a pooled keep-alive
+        connection the server already closed) are retried up to MAX_RETRIES
+        times, honouring Retry-After. Anything else raises immediately so the
+        circuit breaker and provider failover see it.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                return await request()
+            except (OllamaTransientError, httpx.ConnectError, httpx.RemoteProtocolError) as e:
+                retry_after = getattr(e, "retry_after", None)
+                if attempt == self.MAX_RETRIES or (retry_after or 0) > self.RETRY_MAX_DELAY:
+                    raise
+                if retry_after is None:
+                    retry_after = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt * (0.5 + random.random()))
+                logger.warning(f"{self.name} transient failure ({e}), retry {attempt + 1}/{self.MAX_RETRIES} in {retry_after:.1f}s")
+                await asyncio.sleep(retry_after)
+    
+    async def _generate_streaming_json(
+        self,
+        client: httpx.AsyncClient,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Stream a JSON generation, closing the connection once the object is complete.
+        
+        Returns a dict shaped like the non-streaming /api/generate response.
+        Token counts are only present if the final "done" chunk was received.
+        """
+        payload = {**payload, "stream": True}
+        tracker = JSONCompletionTracker()
+        parts: List[str] = []
+        result: Dict[str, Any] = {}
+        
+        async with client.stream(
+            "POST",
+            "/api/generate",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode("utf-8", errors="replace")
+                raise _ollama_error("API", response, error_text)
+            
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                if chunk.get("error"):
+                    raise Exception(f"Ollama API error: {chunk['error']}")
+                
+                text = chunk.get("response", "")
+                parts.append(text)
+                
+                if chunk.get("done"):
+                    result = chunk
+                    break
+                if tracker.feed(text):
+                    # Leaving the context manager closes the stream and aborts generation
+                    logger.debug("JSON object complete, aborting Ollama stream early")
+                    break
+        
+        result["response"] = "".join(parts)
+        return result
+    
     async def health_check(self) -> bool:
         """Check if Ollama Cloud is available."""
         if not self.api_key:
             return False
         
         try:
-            headers = {"Authorization": f"Bearer {self.api_key}"}
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    return response.status == 200
+            client = await self._get_client()
+            response = await client.get("/api/tags", timeout=10.0)
+            return response.status_code == 200
                     
         except Exception as e:
             logger.debug(f"Ollama health check failed: {e}")
             return False
+    
+    async def warmup(self) -> bool:
+        """
+        Pre-open one pooled connection per worker slot.
+        
+        Concurrent health checks each complete DNS + TCP + TLS (over HTTP/2
+        they share a single connection), so the first generations after
+        startup start on warm connections.
+        """
+        if not self.api_key:
+            return False
+        results = await asyncio.gather(*[self.health_check() for _ in range(self._num_workers)])
+        return any(results)
 
 
 class GeminiProvider(LLMProvider):
@@ -250,7 +700,7 @@ class GeminiProvider(LLMProvider):
         
         if not self.api_key:
             logger.warning("GOOGLE_API_KEY not set, Gemini provider unavailable")
-            self.status = ProviderStatus.UNAVAILABLE
+            self.mark_unconfigured()
         else:
             # Configure Gemini
             genai.configure(api_key=self.api_key)
@@ -258,7 +708,7 @@ class GeminiProvider(LLMProvider):
     
     async def generate(self, prompt: str, options: LLMOptions) -> LLMResponse:
         """Generate text using Google Gemini API."""
-        if self.status == ProviderStatus.UNAVAILABLE:
+        if self.status == ProviderStatus.UNAVAILABLE and not self.half_open_in_flight:
             raise Exception(f"{self.name} is unavailable")
         
         try:
@@ -278,9 +728,9 @@ class GeminiProvider(LLMProvider):
                 top_p=options.top_p
             )
             
-            # Generate (Gemini SDK is sync, we'll run in executor if needed)
-            # For now, direct call (consider using asyncio.to_thread for true async)
-            response = self.client.generate_content(
+            # Async SDK call, so concurrent requests overlap instead of
+            # blocking the event loop one after another
+            response = await self.client.generate_content_async(
                 full_prompt,
                 generation_config=generation_config
             )
@@ -316,9 +766,9 @@ class GeminiProvider(LLMProvider):
             return False
         
         try:
-            # Simple check: list models
-            models = genai.list_models()
-            return len(list(models)) > 0
+            # Simple check: list models (sync SDK call, kept off the event loop)
+            models = await asyncio.to_thread(lambda: list(genai.list_models()))
+            return len(models) > 0
         except Exception as e:
             logger.debug(f"Gemini health check failed: {e}")
             return False
@@ -335,6 +785,8 @@ class LLMService:
     def __init__(self):
         self.settings = settings
         self.providers: List[LLMProvider] = []
+        # Exact-match cache for low-temperature (near-deterministic) generations
+        self.response_cache = LLMResponseCache()
         self._setup_providers()
     
     def _setup_providers(self):
@@ -359,6 +811,8 @@ class LLMService:
     async def generate(
         self,
         prompt: str,
+        options: Optional[LLMOptions] = None,
+        *,
         temperature: float = 0.7,
         max_tokens: int = 2000,
         top_p: float = 0.9,
@@ -368,8 +822,12 @@ class LLMService:
         """
         Generate text using available providers with automatic failover.
         
+        Responses to low-temperature requests are cached per provider and
+        model; a cache hit is returned without calling the provider.
+        
         Args:
             prompt: The prompt to generate from
+            options: Generation options; when given, the keyword options below are ignored
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens to generate
             top_p: Nucleus sampling parameter
@@ -382,44 +840,86 @@ class LLMService:
         Raises:
             Exception: If all providers fail
         """
-        options = LLMOptions(
-            temperature=temperature,
-            max_tokens=max_tokens,
-            top_p=top_p,
-            response_format=response_format,
-            system_prompt=system_prompt
-        )
+        if options is None:
+            options = LLMOptions(
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                response_format=response_format,
+                system_prompt=system_prompt
+            )
         
         errors = []
+        cacheable = self.response_cache.is_cacheable(options)
         
         # Try each provider in order
         for provider in self.providers:
-            if provider.status == ProviderStatus.UNAVAILABLE:
-                logger.debug(f"Skipping {provider.name} (unavailable)")
+            if not provider.is_accepting_requests():
+                logger.debug(f"Skipping {provider.name} (circuit open)")
                 continue
             
+            cache_key = None
+            if cacheable:
+                cache_key = self.response_cache.key(provider.name, provider.model, prompt, options)
+                cached = await self.response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"✓ Served from response cache ({provider.name})")
+                    cached["metadata"] = {**(cached.get("metadata") or {}), "cache_hit": True}
+                    return LLMResponse(**cached)
+            
+            ticket = provider.allow_request()
+            if ticket is None:
+                continue
+            success = None
             try:
                 logger.info(f"Attempting generation with {provider.name}")
                 response = await provider.generate(prompt, options)
+                success = True
                 logger.info(f"✓ Generated with {provider.name} ({response.usage.get('total_tokens', 0) if response.usage else 0} tokens)")
+                if cache_key is not None:
+                    await self.response_cache.set(cache_key, asdict(response))
                 return response
                 
             except Exception as e:
+                success = False
                 error_msg = f"{provider.name} failed: {str(e)}"
                 logger.warning(error_msg)
                 errors.append(error_msg)
                 continue
+            finally:
+                provider.release(ticket, success)
         
         # All providers failed
         error_summary = "; ".join(errors)
         raise Exception(f"All LLM providers failed: {error_summary}")
     
+    async def warmup(self):
+        """
+        Warm up provider connections concurrently (run in the background at startup).
+        
+        Failures are logged and never raised; an unreachable provider is
+        handled by normal failover on the first request.
+        """
+        providers = [p for p in self.providers if p.is_accepting_requests()]
+        results = await asyncio.gather(
+            *[provider.warmup() for provider in providers],
+            return_exceptions=True
+        )
+        for provider, result in zip(providers, results):
+            if result is True:
+                logger.info(f"✓ {provider.name} connections warmed up")
+            elif isinstance(result, BaseException):
+                logger.warning(f"{provider.name} warm-up failed: {result}")
+            else:
+                logger.warning(f"{provider.name} warm-up failed: health check did not pass")
+    
     async def health_check(self) -> Dict[str, Any]:
         """Check health of all providers."""
         health_info = {
             "providers": [],
             "available_count": 0,
-            "total_count": len(self.providers)
+            "total_count": len(self.providers),
+            "response_cache": self.response_cache.stats()
         }
         
         for provider in self.providers:
@@ -433,28 +933,76 @@ class LLMService:
         
         return health_info
     
+    async def embed_many(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Embed texts in batches using the Ollama provider.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum inputs per request
+            
+        Returns:
+            float16 array of shape (len(texts), dim)
+        
+        Raises:
+            Exception: If no Ollama provider is configured
+        """
+        for provider in self.providers:
+            if isinstance(provider, OllamaCloudProvider):
+                ticket = provider.allow_request()
+                if ticket is None:
+                    raise Exception(f"{provider.name} is unavailable")
+                success = None
+                try:
+                    embeddings = await provider.embed_many(texts, batch_size)
+                    success = True
+                    return embeddings
+                except Exception:
+                    success = False
+                    raise
+                finally:
+                    provider.release(ticket, success)
+        raise Exception("No embedding-capable LLM provider configured")
+    
+    def has_available_provider(self) -> bool:
+        """Whether any provider is currently eligible for requests."""
+        return any(p.is_accepting_requests() for p in self.providers)
+    
     def get_provider_stats(self) -> List[Dict[str, Any]]:
         """Get statistics for all providers."""
         return [provider.get_health_info() for provider in self.providers]
+    
+    async def aclose(self):
+        """Release network resources held by providers and the response cache (call on shutdown)."""
+        for provider in self.providers:
+            close = getattr(provider, "aclose", None)
+            if close is not None:
+                try:
+                    await close()
+                except Exception as e:
+                    logger.warning(f"Error closing {provider.name}: {e}")
+        await self.response_cache.aclose()
 
 
 # Singleton instance
 _llm_service_instance: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
 
 
-@lru_cache(maxsize=1)
 def get_llm_service() -> LLMService:
     """
     Get singleton LLM service instance.
     
+    Created once under a lock; later calls only read the module global.
+    
     Returns:
         LLMService instance
     """
     global _llm_service_instance
-    
     if _llm_service_instance is None:
-        _llm_service_instance = LLMService()
-    
+        with _llm_service_lock:
+            if _llm_service_instance is None:
+                _llm_service_instance = LLMService()
     return _llm_service_instance
 
 
@@ -3,48 +3,89 @@ LLM-based Resume Parser
 Uses Multi-Provider LLM (Ollama Cloud + Google Gemini) to parse resume text into structured JSON.
 Validates the returned JSON using Pydantic schemas and generates 768-dim embeddings using JobBERT-v3.
 """
-import json
+import asyncio
+import copy
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from datetime import datetime
 import numpy as np
 
 from app.core.config import settings
 from app.schemas.resume_schema import ResumeParseResult
-from app.services.llm_provider import get_llm_service, LLMOptions
+from app.services.llm_provider import get_llm_service, LLMOptions, extract_json_object
 from app.services.embedding_service import get_embedding_service
+from app.services.pdf_text import iter_pdf_pages
 
 logger = logging.getLogger(__name__)
 
+# Contact patterns, compiled once (the fallback path runs exactly when LLMs fail)
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+_PHONE_RE = re.compile(r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+
+# Whitespace runs left by PDF/DOCX extraction
+_SPACES_RE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES_RE = re.compile(r" ?\n[ \n]*")
+
+# Rough size of an LLM token in English text (as in RAGService.augment_prompt)
+_CHARS_PER_TOKEN = 4
+
+# Fixed instruction prefix; embeddings, raw_text and parsed_at are filled in
+# by the parser, so the LLM is not asked to echo them
+_PROMPT_PREFIX = """
+You are an expert resume parser. Given the full text of a candidate's resume (delimited below), extract structured information and return ONLY valid JSON. The JSON must follow this format exactly (fields may be null or empty lists):
+
+{
+  "email": "...",
+  "phone": "...",
+  "full_name": "...",
+  "location": "...",
+  "skills": {
+    "technical": ["skill1", "skill2"],
+    "soft": ["skill1", "skill2"]
+  },
+  "education": [{"degree":"...","university":"...","start_date":"...","end_date":"...","details":"..."}],
+  "work_experience": [{"company":"...","title":"...","start_date":"...","end_date":"...","location":"...","description":"..."}],
+  "certifications": ["cert1"],
+  "languages": ["English"],
+  "total_experience_years": null
+}
+
+INSTRUCTIONS:
+1) Parse the resume TEXT exactly once (do NOT hallucinate). Use the resume text below.
+2) Return ONLY valid JSON. Do not include any explanation, commentary, or extra text.
+3) Keep lists concise but include the key items (top technical skills, degrees, and 2-3 most recent roles).
+4) If a field is not present, set it to null or an empty list as appropriate.
+
+Resume Text:
+"""
+_PROMPT_SUFFIX = "\n\nReturn the JSON now.\n"
+
 
 class LLMResumeParser:
     """Parser that uses Multi-Provider LLM to produce structured JSON from resumes."""
 
+    # Near-duplicate resume cache: minimum cosine similarity and size
+    SEMANTIC_CACHE_THRESHOLD = 0.97
+    SEMANTIC_CACHE_MAX_ENTRIES = 1024
+
+    # Resume text sent to the LLM, in approximate tokens (~6000 characters)
+    PROMPT_TOKEN_BUDGET = 1500
+
     def __init__(self):
         self.llm_service = get_llm_service()
         self.embedding_service = get_embedding_service()
         
+        # Recent successful parses: unit text embeddings (one row each), the
+        # contact email of each resume and the parse without embeddings
+        self._parse_cache_matrix = np.empty((0, self.embedding_service.EMBEDDING_DIMENSION), dtype=np.float32)
+        self._parse_cache_emails: List[str] = []
+        self._parse_cache_results: List[Dict[str, Any]] = []
+        
         logger.info("LLM Resume Parser initialized with multi-provider LLM and JobBERT-v3 (768-dim)")
 
-    def _extract_text_from_pdf(self, file_path: str) -> str:
-        try:
-            # Lazy import to avoid top-level dependency errors during import-time checks
-            import PyPDF2
-
-            with open(file_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                text = []
-                for page in reader.pages:
-                    txt = page.extract_text() or ""
-                    text.append(txt)
-                return "\n".join(text).strip()
-        except Exception as e:
-            logger.error("PDF text extraction failed: %s", e)
-            raise
-
     def _extract_text_from_docx(self, file_path: str) -> str:
         try:
             # Lazy import to avoid top-level dependency errors during import-time checks
@@ -57,116 +98,268 @@ class LLMResumeParser:
             logger.error("DOCX text extraction failed: %s", e)
             raise
 
-    def _extract_text(self, file_path: str) -> str:
+    def _iter_text(self, file_path: str) -> Iterator[str]:
+        """Resume text in chunks: one per page for PDFs, the whole document for DOCX."""
         path = Path(file_path)
         ext = path.suffix.lower()
         if ext == '.pdf':
-            return self._extract_text_from_pdf(file_path)
+            return iter_pdf_pages(file_path)
         elif ext in ['.docx', '.doc']:
-            return self._extract_text_from_docx(file_path)
+            return iter([self._extract_text_from_docx(file_path)])
         else:
             raise ValueError(f"Unsupported file type: {ext}")
 
-    def generate_embeddings(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+    def _extract_text(self, file_path: str) -> str:
+        return "\n".join(self._iter_text(file_path)).strip()
+
+    async def _stream_text(self, file_path: str) -> AsyncIterator[str]:
+        """
+        Yield resume text chunks as a worker thread extracts them.
+        
+        Extraction is blocking CPU work, so it stays off the event loop;
+        chunks are handed over through a queue as each page finishes.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def produce():
+            try:
+                for chunk in self._iter_text(file_path):
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            else:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        extraction = loop.run_in_executor(None, produce)
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+        await extraction
+
+    async def _extract_text_and_start_llm(self, file_path: str, options: LLMOptions) -> Tuple[str, Optional[asyncio.Task]]:
+        """
+        Extract the resume text, starting the LLM call while later pages are still extracting.
+        
+        The prompt only carries the first PROMPT_TOKEN_BUDGET tokens of the
+        resume, so once the extracted prefix fills the budget the prompt is
+        final: the LLM call starts right away and overlaps the remaining
+        pages (which are still needed for raw_text and the embedding).
+        
+        Returns:
+            (full resume text, running LLM task or None if the prompt was
+            not final before extraction finished)
+        """
+        max_chars = self.PROMPT_TOKEN_BUDGET * _CHARS_PER_TOKEN
+        chunks: List[str] = []
+        extracted_chars = 0
+        llm_call = None
+        try:
+            async for chunk in self._stream_text(file_path):
+                chunks.append(chunk)
+                extracted_chars += len(chunk) + 1
+                # Collapsing whitespace only shrinks the text: skip the check until it can pass
+                if llm_call is None and extracted_chars > max_chars + 1:
+                    snippet = self._final_prompt_snippet("\n".join(chunks))
+                    if snippet is not None:
+                        llm_call = asyncio.create_task(
+                            self.llm_service.generate(_PROMPT_PREFIX + snippet + _PROMPT_SUFFIX, options)
+                        )
+        except BaseException:
+            self._discard_llm_call(llm_call)
+            raise
+        return "\n".join(chunks).strip(), llm_call
+
+    @staticmethod
+    def _discard_llm_call(llm_call: Optional[asyncio.Task]):
+        """Cancel an early-started LLM call whose response is no longer needed."""
+        if llm_call is None:
+            return
+        llm_call.cancel()
+        # Retrieve a failure that finished before the cancel, so asyncio does not log it
+        llm_call.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def generate_embeddings(self, text: str, skills: Optional[List[str]] = None) -> tuple[np.ndarray, np.ndarray]:
         """
         Generate 768-dim embeddings using JobBERT-v3.
         Returns (resume_embedding, skills_embedding) as numpy arrays.
-        """
-        resume_emb_list = self.embedding_service.generate_text_embedding(text)
-        skills_emb_list = self.embedding_service.generate_text_embedding(text)
         
-        # Convert lists to numpy arrays
-        resume_emb = np.array(resume_emb_list)
-        skills_emb = np.array(skills_emb_list)
+        Long resume text is embedded window by window and mean-pooled rather
+        than truncated. With skills, the resume windows and the comma-joined
+        skills are encoded in one batched model pass. Without, skills_embedding
+        is the (same, read-only) embedding of the full text.
+        """
+        skills_text = ", ".join(skills) if skills else ""
+        if not skills_text:
+            embedding, = self.embedding_service.generate_long_text_embeddings([text])
+            return embedding, embedding
         
+        resume_emb, skills_emb = self.embedding_service.generate_long_text_embeddings([text, skills_text])
         return resume_emb, skills_emb
 
-    def _build_prompt(self, text: str) -> str:
-        """Construct a prompt instructing the model to return strict JSON matching the schema."""
-        prompt = f"""
-You are an expert resume parser. Given the full text of a candidate's resume (delimited below), extract structured information and return ONLY valid JSON. The JSON must follow this format exactly (fields may be null or empty lists):
+    @staticmethod
+    def _skill_names(skills: Optional[Dict[str, Any]]) -> List[str]:
+        """Technical then soft skills as one list (the order regenerate_embeddings.py uses)."""
+        if not skills:
+            return []
+        return [skill for key in ('technical', 'soft') for skill in (skills.get(key) or [])]
 
-{{
-  "email": "...",
-  "phone": "...",
-  "full_name": "...",
-  "location": "...",
-  "skills": {{
-    "technical": ["skill1", "skill2"],
-    "soft": ["skill1", "skill2"]
-  }},
-  "education": [{{"degree":"...","university":"...","start_date":"...","end_date":"...","details":"..."}}],
-  "work_experience": [{{"company":"...","title":"...","start_date":"...","end_date":"...","location":"...","description":"..."}}],
-  "certifications": ["cert1"],
-  "languages": ["English"],
-  "resume_embedding": null,
-  "skills_embedding": null,
-  "raw_text": null,
-  "parsed_at": null,
-  "total_experience_years": null
-}}
+    async def _skills_embedding(self, skills: Optional[Dict[str, Any]], resume_embedding: np.ndarray) -> np.ndarray:
+        """
+        Embedding of the parsed skills, or the resume embedding when there are none.
+        
+        Goes through the embedding micro-batcher (same vector as
+        generate_skills_embedding), so skills of concurrently parsed
+        resumes are encoded in one model pass.
+        """
+        names = self._skill_names(skills)
+        if not names:
+            return resume_embedding
+        return await self.embedding_service.agenerate_text_embedding(", ".join(names))
+
+    @staticmethod
+    def _contact_email(text: str) -> Optional[str]:
+        """First email address in the resume text, lowercased (None if there is none)."""
+        match = _EMAIL_RE.search(text)
+        return match.group(0).lower() if match else None
+
+    def _semantic_cache_get(self, embedding: np.ndarray, email: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Cached parse of a near-duplicate resume (re-upload with trivial edits).
+        
+        A hit needs cosine similarity >= SEMANTIC_CACHE_THRESHOLD and the same
+        contact email, so resumes of different people built from one template
+        never share a parse. Embeddings are unit length, so cosine is a dot
+        product.
+        """
+        if email is None or not self._parse_cache_emails or not embedding.any():
+            return None
+        similarities = self._parse_cache_matrix @ embedding
+        for i in np.argsort(-similarities):
+            if similarities[i] < self.SEMANTIC_CACHE_THRESHOLD:
+                break
+            if self._parse_cache_emails[i] == email:
+                logger.info(f"Resume parse served from semantic cache (similarity={similarities[i]:.4f})")
+                return copy.deepcopy(self._parse_cache_results[i])
+        return None
+
+    def _semantic_cache_put(self, embedding: np.ndarray, email: Optional[str], parsed_data: Dict[str, Any]):
+        """Remember a successful parse (oldest entries are evicted first)."""
+        if email is None or not embedding.any():
+            return
+        result = {k: v for k, v in parsed_data.items()
+                  if k not in ('resume_embedding', 'skills_embedding', 'embedding_meta', 'raw_text', 'parsed_at')}
+        limit = self.SEMANTIC_CACHE_MAX_ENTRIES
+        self._parse_cache_matrix = np.vstack([self._parse_cache_matrix, embedding[np.newaxis, :]])[-limit:]
+        self._parse_cache_emails = (self._parse_cache_emails + [email])[-limit:]
+        self._parse_cache_results = (self._parse_cache_results + [copy.deepcopy(result)])[-limit:]
 
-INSTRUCTIONS:
-1) Parse the resume TEXT exactly once (do NOT hallucinate). Use the resume text below.
-2) Return ONLY valid JSON. Do not include any explanation, commentary, or extra text.
-3) Keep lists concise but include the key items (top technical skills, degrees, and 2-3 most recent roles).
-4) If a field is not present, set it to null or an empty list as appropriate.
+    def _build_prompt(self, text: str) -> str:
+        """
+        Construct a prompt instructing the model to return strict JSON matching the schema.
+        
+        The instructions are a constant prefix, so providers with prompt
+        prefix caching reuse it across resumes; only the resume text varies.
+        """
+        return _PROMPT_PREFIX + self._prompt_snippet(text) + _PROMPT_SUFFIX
 
-Resume Text:
-"""
-        # include only first ~6000 chars to keep prompt size reasonable
-        max_chars = 6000
-        snippet = text[:max_chars]
-        prompt += snippet
-        prompt += "\n\nReturn the JSON now.\n"
-        return prompt
+    def _prompt_snippet(self, text: str) -> str:
+        """
+        Resume text cut to PROMPT_TOKEN_BUDGET (approximate tokens).
+        
+        Whitespace runs from PDF extraction are collapsed first so the budget
+        is spent on content, and the cut falls on a word boundary.
+        """
+        text = _BLANK_LINES_RE.sub("\n", _SPACES_RE.sub(" ", text)).strip()
+        max_chars = self.PROMPT_TOKEN_BUDGET * _CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        cut = text.rfind(" ", 0, max_chars + 1)
+        return text[:cut if cut > 0 else max_chars]
+
+    def _final_prompt_snippet(self, text_prefix: str) -> Optional[str]:
+        """
+        _prompt_snippet of the full text, if this leading part of it already decides it.
+        
+        Collapsing whitespace is local, so everything before the trailing
+        whitespace run of the prefix is final; the snippet is decided once
+        that covers the budget plus the word-boundary lookahead.
+        """
+        text = _BLANK_LINES_RE.sub("\n", _SPACES_RE.sub(" ", text_prefix)).lstrip().rstrip(" \n")
+        max_chars = self.PROMPT_TOKEN_BUDGET * _CHARS_PER_TOKEN
+        if len(text) <= max_chars + 1:
+            return None
+        return self._prompt_snippet(text)
 
     async def parse(self, file_path: str) -> Dict[str, Any]:
         """
         Parse a resume file and return a validated dict matching ResumeParseResult.
         Uses Multi-Provider LLM with automatic failover.
+        
+        resume_embedding / skills_embedding are float32 numpy arrays rather
+        than lists: pgvector columns and the Candidate int8 sync accept them
+        as-is, without a list round-trip.
         """
         logger.info("LLMResumeParser.parse called for %s", file_path)
 
-        text = self._extract_text(file_path)
+        options = LLMOptions(
+            temperature=0.1,
+            max_tokens=1500,
+            response_format="json"
+        )
+
+        # For long resumes the LLM call is already running while the last pages extract
+        text, llm_call = await self._extract_text_and_start_llm(file_path, options)
         if not text or len(text) < 50:
+            self._discard_llm_call(llm_call)
             raise ValueError("Extracted text is too short or empty")
 
-        prompt = self._build_prompt(text)
-
         try:
-            # Use Multi-Provider LLM service with automatic failover
-            options = LLMOptions(
-                temperature=0.1,
-                max_tokens=1500,
-                response_format="json"
+            # One embedding serves both the near-duplicate lookup and resume_embedding
+            # (mean of max_seq_length windows, so long resumes are not truncated)
+            text_embedding = np.asarray(
+                await self.embedding_service.agenerate_long_text_embedding(text), dtype=np.float32
             )
-            
-            llm_response = await self.llm_service.generate(prompt, options)
+            email = self._contact_email(text)
+            cached = self._semantic_cache_get(text_embedding, email)
+            if cached is not None:
+                cached['raw_text'] = text
+                cached['parsed_at'] = datetime.utcnow().isoformat()
+                cached['resume_embedding'] = text_embedding
+                cached['skills_embedding'] = await self._skills_embedding(cached.get('skills'), text_embedding)
+                cached['embedding_meta'] = self.embedding_service.fingerprint
+                return cached
+
+            # Use Multi-Provider LLM service with automatic failover
+            if llm_call is None:
+                llm_call = asyncio.create_task(self.llm_service.generate(self._build_prompt(text), options))
+            llm_response = await llm_call
             
             if not llm_response or not llm_response.content:
                 raise ValueError("Empty response from LLM")
             
             logger.info(f"Resume parsed using {llm_response.provider}")
             
-            response_text = llm_response.content
-
-            # Extract JSON substring
-            start = response_text.find('{')
-            end = response_text.rfind('}')
-            if start == -1 or end == -1:
-                raise ValueError("Response from LLM did not contain JSON")
+            # First JSON object in the output (orjson fast path for bare JSON;
+            # leading prose or trailing text around the object is skipped)
+            parsed = extract_json_object(llm_response.content)
 
-            json_str = response_text[start:end+1]
-            parsed = json.loads(json_str)
+            # Vectors echoed by the LLM are not JobBERT-v3 embeddings (wrong space,
+            # often wrong size); the embedding computed above replaces them
+            parsed.pop('resume_embedding', None)
+            parsed.pop('skills_embedding', None)
 
             # Ensure important keys exist
             if 'skills' not in parsed:
                 parsed['skills'] = {'technical': [], 'soft': []}
 
-            # Attach raw_text and parsed_at if missing
-            parsed.setdefault('raw_text', text)
-            parsed.setdefault('parsed_at', datetime.utcnow().isoformat())
+            # Attach raw_text and parsed_at if missing (the LLM may still return nulls)
+            parsed['raw_text'] = parsed.get('raw_text') or text
+            parsed['parsed_at'] = parsed.get('parsed_at') or datetime.utcnow().isoformat()
 
             # Validate via Pydantic schema
             try:
@@ -177,11 +370,13 @@ Resume Text:
 
             parsed_data = validated.model_dump()
 
-            # Generate 768-dim JobBERT-v3 embeddings if missing
-            if not parsed_data.get('resume_embedding'):
-                resume_emb, skills_emb = self.generate_embeddings(parsed_data.get('raw_text', text))
-                parsed_data['resume_embedding'] = resume_emb.tolist()
-                parsed_data['skills_embedding'] = skills_emb.tolist()
+            # 768-dim JobBERT-v3 embeddings: resume text (computed above) and
+            # skills; only the short skills text needs another model pass
+            parsed_data['resume_embedding'] = text_embedding
+            parsed_data['skills_embedding'] = await self._skills_embedding(parsed_data.get('skills'), text_embedding)
+            parsed_data['embedding_meta'] = self.embedding_service.fingerprint
+
+            self._semantic_cache_put(text_embedding, email, parsed_data)
 
             logger.info(f"Resume parsed successfully with 768-dim embeddings (provider: {llm_response.provider})")
             return parsed_data
@@ -205,20 +400,28 @@ Resume Text:
             }
 
             # Try to extract email and phone via regex
-            email_match = re.search(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b", text)
-            phone_match = re.search(r"(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", text)
+            email_match = _EMAIL_RE.search(text)
+            phone_match = _PHONE_RE.search(text)
             if email_match:
                 fallback['email'] = email_match.group(0)
             if phone_match:
                 fallback['phone'] = phone_match.group(0)
 
             try:
-                resume_emb, skills_emb = self.generate_embeddings(text)
-                fallback['resume_embedding'] = resume_emb.tolist()
-                fallback['skills_embedding'] = skills_emb.tolist()
+                # Micro-batched with concurrent parses (cache hits when the embedding above succeeded);
+                # no skills were parsed, so both embeddings are the resume text's
+                resume_emb = await self.embedding_service.agenerate_long_text_embedding(text)
+                fallback['resume_embedding'] = resume_emb
+                fallback['skills_embedding'] = resume_emb
+                fallback['embedding_meta'] = self.embedding_service.fingerprint
             except Exception:
                 fallback['resume_embedding'] = None
                 fallback['skills_embedding'] = None
+                fallback['embedding_meta'] = None
 
             logger.warning("Returning fallback resume parse with basic info")
             return fallback
+
+        finally:
+            # No-op once awaited; cancels it on a semantic cache hit or an early failure
+            self._discard_llm_call(llm_call)
@@ -0,0 +1,70 @@
+"""
+PDF Text Extraction
+Page-by-page text extraction for resume PDFs, shared by LLMResumeParser and the local ResumeParser.
+Uses PDFium (pypdfium2, C++) when installed and selected by PDF_TEXT_EXTRACTOR, PyPDF2 otherwise.
+"""
+import logging
+import threading
+from typing import Iterator
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# PDFium is not thread-safe; extractions from worker threads take turns, one
+# page at a time. Reentrant, since a suspended generator may be closed by the
+# garbage collector while its thread already holds the lock.
+_PDFIUM_LOCK = threading.RLock()
+
+
+def iter_pdf_pages(file_path: str) -> Iterator[str]:
+    """Text of each page of a PDF, in order (extracted lazily as the iterator is consumed)."""
+    if settings.PDF_TEXT_EXTRACTOR == "pdfium":
+        try:
+            # Lazy import: optional dependency
+            import pypdfium2  # noqa: F401
+            return _iter_pdf_pages_pdfium(file_path)
+        except ImportError:
+            logger.debug("pypdfium2 not installed, extracting PDF text with PyPDF2")
+    return _iter_pdf_pages_pypdf2(file_path)
+
+
+def _iter_pdf_pages_pdfium(file_path: str) -> Iterator[str]:
+    """Extract PDF text with PDFium (C++), much faster than PyPDF2 on multi-page resumes."""
+    import pypdfium2 as pdfium
+
+    try:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+            page_count = len(pdf)
+        try:
+            for index in range(page_count):
+                # Held per page only, never across a yield, so a slow or
+                # abandoned consumer does not block other extractions
+                with _PDFIUM_LOCK:
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                yield text
+        finally:
+            with _PDFIUM_LOCK:
+                pdf.close()
+    except Exception as e:
+        logger.error("PDF text extraction failed: %s", e)
+        raise
+
+
+def _iter_pdf_pages_pypdf2(file_path: str) -> Iterator[str]:
+    try:
+        # Lazy import to avoid top-level dependency errors during import-time checks
+        import PyPDF2
+
+        with open(file_path, 'rb') as f:
+            reader = PyPDF2.PdfReader(f)
+            for page in reader.pages:
+                yield page.extract_text() or ""
+    except Exception as e:
+        logger.error("PDF text extraction failed: %s", e)
+        raise
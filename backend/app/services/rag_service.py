@@ -6,7 +6,10 @@ using pgvector and JobBERT-v3 768-dimensional embeddings.
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from pgvector.sqlalchemy import Vector
+import numpy as np
+import asyncio
 import logging
 
 from app.models.company_knowledge import CompanyKnowledge
@@ -65,7 +68,7 @@ class RAGService:
         try:
             # Generate 768-dim embedding
             logger.info(f"Generating embedding for document: {title}")
-            embedding = self.embedding_service.generate_text_embedding(content)
+            embedding = await self.embedding_service.agenerate_text_embedding(content)
             
             # Create document
             doc = CompanyKnowledge(
@@ -101,6 +104,10 @@ class RAGService:
         """
         Search for similar documents using pgvector cosine similarity.
         
+        Stored and query embeddings are unit length (EmbeddingService
+        invariant), so cosine similarity is the inner product: the query
+        ranks by <#> (negative inner product) on the vector_ip_ops HNSW index.
+        
         Args:
             db: Database session
             query: Search query text
@@ -124,7 +131,7 @@ class RAGService:
         try:
             # Generate query embedding
             logger.info(f"Searching for: {query[:50]}...")
-            query_embedding = self.embedding_service.generate_text_embedding(query)
+            query_embedding = await self.embedding_service.agenerate_text_embedding(query)
             
             # Build SQL with pgvector similarity
             # Handle optional doc_types filter
@@ -138,12 +145,12 @@ class RAGService:
                         doc_type,
                         metadata,
                         created_at,
-                        1 - (embedding <=> :query_embedding) AS similarity
+                        -(embedding <#> :query_embedding) AS similarity
                     FROM company_knowledge
                     WHERE organization_id = :org_id
                         AND doc_type = ANY(:doc_types)
-                        AND (1 - (embedding <=> :query_embedding)) >= :threshold
-                    ORDER BY embedding <=> :query_embedding
+                        AND (embedding <#> :query_embedding) <= -:threshold
+                    ORDER BY embedding <#> :query_embedding
                     LIMIT :top_k
                 """)
             else:
@@ -156,17 +163,19 @@ class RAGService:
                         doc_type,
                         metadata,
                         created_at,
-                        1 - (embedding <=> :query_embedding) AS similarity
+                        -(embedding <#> :query_embedding) AS similarity
                     FROM company_knowledge
                     WHERE organization_id = :org_id
-                        AND (1 - (embedding <=> :query_embedding)) >= :threshold
-                    ORDER BY embedding <=> :query_embedding
+                        AND (embedding <#> :query_embedding) <= -:threshold
+                    ORDER BY embedding <#> :query_embedding
                     LIMIT :top_k
                 """)
+            # Typed as a pgvector parameter: pgvector serializes the float32 array itself
+            sql = sql.bindparams(bindparam("query_embedding", type_=Vector(768)))
             
             # Execute query with appropriate parameters
             params = {
-                "query_embedding": str(query_embedding),
+                "query_embedding": np.asarray(query_embedding, dtype=np.float32),
                 "org_id": organization_id,
                 "threshold": threshold,
                 "top_k": top_k
@@ -174,9 +183,8 @@ class RAGService:
             if doc_types:
                 params["doc_types"] = doc_types
             
-            result = db.execute(sql, params)
-            
-            rows = result.fetchall()
+            # Sync DB call runs in a worker thread to keep the event loop free
+            rows = await asyncio.to_thread(lambda: db.execute(sql, params).fetchall())
             
             # Format results
             results = [
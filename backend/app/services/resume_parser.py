@@ -13,13 +13,14 @@ os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 
 import re
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 
 # PDF/DOCX extraction
-import PyPDF2
 import docx
+from app.services.pdf_text import iter_pdf_pages
 
 # NLP and embeddings
 import spacy
@@ -55,6 +56,8 @@ class ResumeParser:
     - anass1209/resume-job-matcher-all-MiniLM-L6-v2 for job matching
     """
     
+    EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+    
     def __init__(self):
         """Initialize NLP models with GPU optimization (may take 30-60 seconds on first run)."""
         # Detect optimal device
@@ -69,7 +72,7 @@ class ResumeParser:
             raise
         
         logger.info(f"Loading sentence-transformers embedding model on {self.device}...")
-        self.embedding_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2', device=self.device)
+        self.embedding_model = SentenceTransformer(self.EMBEDDING_MODEL_NAME, device=self.device)
         
         logger.info("Loading BERT-based NER model (research-backed: 76.3M downloads)...")
         try:
@@ -113,14 +116,9 @@ class ResumeParser:
         }
     
     def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file."""
+        """Extract text from PDF file (PDFium when installed, else PyPDF2)."""
         try:
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+            return "\n".join(iter_pdf_pages(file_path)).strip()
         except Exception as e:
             logger.error(f"Error extracting text from PDF {file_path}: {e}")
             raise
@@ -367,6 +365,7 @@ class ResumeParser:
             # Vector embeddings (384 dimensions each)
             'resume_embedding': resume_embedding.tolist(),  # Convert numpy to list for JSON
             'skills_embedding': skills_embedding.tolist(),
+            'embedding_meta': {'model': self.EMBEDDING_MODEL_NAME, 'dim': len(resume_embedding)},
             
             # Metadata
             'raw_text': text,
@@ -381,17 +380,26 @@ class ResumeParser:
 
 # Singleton instance (lazy-loaded)
 _parser_instance: Optional[Any] = None
+_parser_lock = threading.Lock()
 
 
 def get_resume_parser() -> Any:
     """
     Get singleton parser instance. Prefer LLM-based parser when enabled in settings;
     falls back to the local spaCy-based ResumeParser if LLM parser cannot be initialized.
+    
+    Created once under a lock (sync endpoints run in a thread pool, and each
+    parser loads models); later calls only read the module global.
     """
     global _parser_instance
-    if _parser_instance is not None:
-        return _parser_instance
+    if _parser_instance is None:
+        with _parser_lock:
+            if _parser_instance is None:
+                _parser_instance = _create_resume_parser()
+    return _parser_instance
 
+
+def _create_resume_parser() -> Any:
     # Lazy import settings to avoid heavy startup cost if unused
     try:
         from app.core.config import settings
@@ -400,8 +408,7 @@ def get_resume_parser() -> Any:
                 from app.services.llm_resume_parser import LLMResumeParser
 
                 logger.info("Initializing LLM-based resume parser (OLLAMA)")
-                _parser_instance = LLMResumeParser()
-                return _parser_instance
+                return LLMResumeParser()
             except Exception as e:
                 logger.warning(
                     "Failed to initialize LLMResumeParser: %s. Falling back to local ResumeParser.", e
@@ -411,5 +418,4 @@ def get_resume_parser() -> Any:
         logger.debug("Could not import settings; using local ResumeParser")
 
     # Fallback to original parser
-    _parser_instance = ResumeParser()
-    return _parser_instance
+    return ResumeParser()
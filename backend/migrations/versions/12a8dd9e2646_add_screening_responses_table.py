@@ -0,0 +1,94 @@
+"""add_screening_responses_table
+
+Revision ID: 12a8dd9e2646
+Revises: 1b87ab8285b7
+Create Date: 2026-10-17 10:12:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = '12a8dd9e2646'
+down_revision: Union[str, Sequence[str], None] = '1b87ab8285b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Move screening responses from JSONB array to a child table."""
+    op.create_table(
+        'screening_responses',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('screening_id', sa.Integer(), nullable=False),
+        sa.Column('question_id', sa.String(50), nullable=False),
+        sa.Column('response', sa.Text(), nullable=False),
+        sa.Column('evaluation', JSONB, nullable=True),
+        sa.Column('timestamp', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.PrimaryKeyConstraint('id'),
+        sa.ForeignKeyConstraint(['screening_id'], ['screenings.id'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_screening_responses_id', 'screening_responses', ['id'])
+    op.create_index('ix_screening_responses_screening_id', 'screening_responses', ['screening_id'])
+
+    # Copy existing JSONB responses into the new table
+    op.execute("""
+        INSERT INTO screening_responses (screening_id, question_id, response, evaluation, timestamp)
+        SELECT
+            s.id,
+            COALESCE(elem->>'question_id', ''),
+            COALESCE(elem->>'response', elem->>'answer', ''),
+            elem->'evaluation',
+            COALESCE((elem->>'timestamp')::timestamp, s.created_at)
+        FROM screenings s
+        CROSS JOIN LATERAL jsonb_array_elements(s.responses) AS elem
+        WHERE jsonb_typeof(s.responses) = 'array'
+    """)
+
+    # Keep the answered counter in sync for list views; distinct questions, as
+    # counted at runtime, so repeated answers in old JSONB data count once
+    op.execute("""
+        UPDATE screenings s
+        SET questions_answered = sub.cnt
+        FROM (
+            SELECT screening_id, COUNT(DISTINCT question_id) AS cnt
+            FROM screening_responses
+            GROUP BY screening_id
+        ) sub
+        WHERE sub.screening_id = s.id
+    """)
+
+    op.drop_column('screenings', 'responses')
+
+
+def downgrade() -> None:
+    """Downgrade schema - Fold screening_responses back into the JSONB column."""
+    op.add_column('screenings', sa.Column('responses', JSONB, nullable=True))
+
+    op.execute("""
+        UPDATE screenings s
+        SET responses = sub.items
+        FROM (
+            SELECT
+                screening_id,
+                jsonb_agg(
+                    jsonb_build_object(
+                        'question_id', question_id,
+                        'response', response,
+                        'evaluation', evaluation,
+                        'timestamp', to_char(timestamp, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+                    ) ORDER BY timestamp
+                ) AS items
+            FROM screening_responses
+            GROUP BY screening_id
+        ) sub
+        WHERE sub.screening_id = s.id
+    """)
+
+    op.drop_index('ix_screening_responses_screening_id', table_name='screening_responses')
+    op.drop_index('ix_screening_responses_id', table_name='screening_responses')
+    op.drop_table('screening_responses')
@@ -0,0 +1,46 @@
+"""company_knowledge_inner_product_index
+
+Revision ID: 3e9855d370fa
+Revises: f2c8a5e1b7d3
+Create Date: 2026-10-17 21:12:47.905318
+
+"""
+from typing import Sequence, Union
+import json
+
+from alembic import op
+import sqlalchemy as sa
+import numpy as np
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e9855d370fa'
+down_revision: Union[str, Sequence[str], None] = 'f2c8a5e1b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Unit-length knowledge embeddings searched by inner product."""
+    # Rows stored before embeddings were normalized at generation time
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, embedding::text FROM company_knowledge")).fetchall()
+    for doc_id, embedding_text in rows:
+        values = np.asarray(json.loads(embedding_text), dtype=np.float32)
+        norm = float(np.linalg.norm(values))
+        if norm == 0.0 or abs(norm - 1.0) < 1e-4:
+            continue
+        bind.execute(
+            sa.text("UPDATE company_knowledge SET embedding = CAST(:embedding AS vector) WHERE id = :id"),
+            {"embedding": json.dumps((values / norm).tolist()), "id": doc_id}
+        )
+
+    # On unit vectors inner product ranks like cosine, without the per-row norms
+    op.drop_index('ix_company_knowledge_embedding', table_name='company_knowledge')
+    op.execute('CREATE INDEX ix_company_knowledge_embedding ON company_knowledge USING hnsw (embedding vector_ip_ops)')
+
+
+def downgrade() -> None:
+    """Downgrade schema - Restore the cosine HNSW index (embeddings stay normalized)."""
+    op.drop_index('ix_company_knowledge_embedding', table_name='company_knowledge')
+    op.execute('CREATE INDEX ix_company_knowledge_embedding ON company_knowledge USING hnsw (embedding vector_cosine_ops)')
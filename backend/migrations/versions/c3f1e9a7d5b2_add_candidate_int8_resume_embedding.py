@@ -0,0 +1,48 @@
+"""add_candidate_int8_resume_embedding
+
+Revision ID: c3f1e9a7d5b2
+Revises: 12a8dd9e2646
+Create Date: 2026-10-17 14:05:19.337160
+
+"""
+from typing import Sequence, Union
+import json
+
+from alembic import op
+import sqlalchemy as sa
+import numpy as np
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1e9a7d5b2'
+down_revision: Union[str, Sequence[str], None] = '12a8dd9e2646'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Store an int8-quantized copy of each resume embedding."""
+    op.add_column('candidates', sa.Column('resume_embedding_i8', sa.LargeBinary(), nullable=True))
+    op.add_column('candidates', sa.Column('resume_embedding_scale', sa.Float(), nullable=True))
+
+    # Backfill existing embeddings (symmetric per-vector scale, embedding ≈ i8 * scale)
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, resume_embedding::text FROM candidates WHERE resume_embedding IS NOT NULL"
+    )).fetchall()
+    for candidate_id, embedding_text in rows:
+        values = np.asarray(json.loads(embedding_text), dtype=np.float32)
+        max_abs = float(np.abs(values).max()) if values.size else 0.0
+        if max_abs == 0.0:
+            continue
+        scale = max_abs / 127.0
+        bind.execute(
+            sa.text("UPDATE candidates SET resume_embedding_i8 = :i8, resume_embedding_scale = :scale WHERE id = :id"),
+            {"i8": np.round(values / scale).astype(np.int8).tobytes(), "scale": scale, "id": candidate_id}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the int8 resume embedding columns."""
+    op.drop_column('candidates', 'resume_embedding_scale')
+    op.drop_column('candidates', 'resume_embedding_i8')
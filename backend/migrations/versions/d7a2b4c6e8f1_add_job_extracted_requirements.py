@@ -0,0 +1,33 @@
+"""add_job_extracted_requirements
+
+Revision ID: d7a2b4c6e8f1
+Revises: c3f1e9a7d5b2
+Create Date: 2026-10-17 15:22:47.901834
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2b4c6e8f1'
+down_revision: Union[str, Sequence[str], None] = 'c3f1e9a7d5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Persist the job matcher's extracted requirements per job."""
+    op.add_column(
+        'jobs',
+        sa.Column('extracted_requirements', JSONB, nullable=True,
+                  comment='Fingerprinted NER/keyword requirements extracted by the job matcher')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop persisted extracted requirements."""
+    op.drop_column('jobs', 'extracted_requirements')
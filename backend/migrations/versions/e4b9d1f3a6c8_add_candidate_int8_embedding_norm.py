@@ -0,0 +1,41 @@
+"""add_candidate_int8_embedding_norm
+
+Revision ID: e4b9d1f3a6c8
+Revises: d7a2b4c6e8f1
+Create Date: 2026-10-17 16:48:03.114925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import numpy as np
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9d1f3a6c8'
+down_revision: Union[str, Sequence[str], None] = 'd7a2b4c6e8f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Store the L2 norm of each int8 resume embedding."""
+    op.add_column('candidates', sa.Column('resume_embedding_i8_norm', sa.Float(), nullable=True))
+
+    # Backfill from the existing int8 copies
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, resume_embedding_i8 FROM candidates WHERE resume_embedding_i8 IS NOT NULL"
+    )).fetchall()
+    for candidate_id, embedding_i8 in rows:
+        norm = float(np.linalg.norm(np.frombuffer(bytes(embedding_i8), dtype=np.int8).astype(np.float32)))
+        bind.execute(
+            sa.text("UPDATE candidates SET resume_embedding_i8_norm = :norm WHERE id = :id"),
+            {"norm": norm, "id": candidate_id}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the int8 resume embedding norm."""
+    op.drop_column('candidates', 'resume_embedding_i8_norm')
@@ -0,0 +1,33 @@
+"""add_candidate_embedding_meta
+
+Revision ID: f2c8a5e1b7d3
+Revises: e4b9d1f3a6c8
+Create Date: 2026-10-17 18:41:06.512387
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a5e1b7d3'
+down_revision: Union[str, Sequence[str], None] = 'e4b9d1f3a6c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Record which embedding model produced each candidate's vectors."""
+    op.add_column(
+        'candidates',
+        sa.Column('embedding_meta', JSONB, nullable=True,
+                  comment='Embedding fingerprint: model, dim, tokenizer hash, normalization version')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - Drop the candidate embedding fingerprint."""
+    op.drop_column('candidates', 'embedding_meta')
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Export dslim/bert-base-NER to ONNX with dynamic int8 quantization.
+
+The job matcher loads the result when NER_ONNX_MODEL_DIR points at the
+output directory (requires optimum[onnxruntime]). Quantization targets
+AVX-512 VNNI; other x86 CPUs still run the model, just without VNNI.
+
+Usage:
+    python scripts/export_ner_onnx.py [--output-dir ./models/bert-base-ner-onnx-int8]
+"""
+
+import argparse
+import logging
+import tempfile
+
+from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "dslim/bert-base-NER"
+
+
+def export(output_dir: str):
+    """Export the FP32 model to ONNX, then write the int8 model and tokenizer."""
+    with tempfile.TemporaryDirectory() as export_dir:
+        logger.info(f"Exporting {MODEL_NAME} to ONNX...")
+        model = ORTModelForTokenClassification.from_pretrained(MODEL_NAME, export=True)
+        model.save_pretrained(export_dir)
+
+        logger.info("Applying dynamic int8 quantization (AVX-512 VNNI)...")
+        quantizer = ORTQuantizer.from_pretrained(export_dir)
+        quantizer.quantize(
+            save_dir=output_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        )
+
+    AutoTokenizer.from_pretrained(MODEL_NAME).save_pretrained(output_dir)
+    logger.info(f"✓ Quantized NER model written to {output_dir} (set NER_ONNX_MODEL_DIR to use it)")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=f'Export {MODEL_NAME} to int8 ONNX')
+    parser.add_argument(
+        '--output-dir',
+        default='./models/bert-base-ner-onnx-int8',
+        help='Directory for the quantized model (default: ./models/bert-base-ner-onnx-int8)'
+    )
+    args = parser.parse_args()
+    export(args.output_dir)
+
+
+if __name__ == '__main__':
+    main()
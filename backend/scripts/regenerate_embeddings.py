@@ -205,6 +205,7 @@ class EmbeddingRegenerator:
                             include_experience=experience if experience else None
                         )
                         candidate.resume_embedding = resume_embedding
+                        candidate.embedding_meta = self.embedding_service.fingerprint
                         
                         # Generate skills embedding
                         if skills:
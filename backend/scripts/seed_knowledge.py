@@ -20,7 +20,7 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.models.company_knowledge import CompanyKnowledge
 from app.models.organization import Organization
-from app.services.embedding_service import EmbeddingService
+from app.services.embedding_service import get_embedding_service
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -254,7 +254,7 @@ def seed_knowledge():
         logger.info(f"Seeding knowledge for organization: {org.name}")
         
         # Initialize embedding service
-        embedding_service = EmbeddingService()
+        embedding_service = get_embedding_service()
         
         # Check if knowledge already exists
         existing_count = db.query(CompanyKnowledge).filter_by(organization_id=org.id).count()
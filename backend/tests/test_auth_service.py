@@ -0,0 +1,69 @@
+"""
+Authentication Service Tests
+Token decoding is memoized, so expiry must be re-checked on cache hits
+"""
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import auth_service
+from app.services.auth_service import JWTError, create_access_token, decode_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth_service._decode_token_cached.cache_clear()
+    yield
+    auth_service._decode_token_cached.cache_clear()
+
+
+class TestDecodeToken:
+    """decode_token against the memoized verifier"""
+
+    def test_decode_round_trip(self):
+        """Test a fresh token decodes to its payload"""
+        token = create_access_token({"sub": 7}, expires_delta=timedelta(minutes=5))
+        payload = decode_token(token)
+
+        assert payload["sub"] == "7"
+        assert payload["type"] == "access"
+
+    def test_repeat_decode_is_cached(self):
+        """Test a second decode of the same token skips verification"""
+        token = create_access_token({"sub": 7}, expires_delta=timedelta(minutes=5))
+        decode_token(token)
+        decode_token(token)
+
+        info = auth_service._decode_token_cached.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_expired_while_cached(self, monkeypatch):
+        """Test a cached token is rejected once its exp has passed"""
+        token = create_access_token({"sub": 7}, expires_delta=timedelta(seconds=60))
+        payload = decode_token(token)
+
+        later = SimpleNamespace(time=lambda: payload["exp"] + 1)
+        monkeypatch.setattr(auth_service, "time", later)
+
+        with pytest.raises(JWTError, match="Signature has expired"):
+            decode_token(token)
+        assert auth_service._decode_token_cached.cache_info().hits == 1
+
+    def test_cached_payload_is_not_shared(self):
+        """Test callers cannot mutate the cached payload"""
+        token = create_access_token({"sub": 7}, expires_delta=timedelta(minutes=5))
+        decode_token(token)["sub"] = "8"
+
+        assert decode_token(token)["sub"] == "7"
+
+    def test_invalid_token_is_not_cached(self):
+        """Test a bad signature raises on every call"""
+        token = create_access_token({"sub": 7}, expires_delta=timedelta(minutes=5))
+        tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+        for _ in range(2):
+            with pytest.raises(JWTError, match="Token validation failed"):
+                decode_token(tampered)
+        assert auth_service._decode_token_cached.cache_info().currsize == 0
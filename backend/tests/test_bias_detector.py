@@ -0,0 +1,96 @@
+"""
+Rule-Based Bias Detection Tests
+Every scanning backend must raise exactly the hits of one regex scan per pattern
+"""
+import re
+
+import pytest
+
+from app.services.bias_detector import BiasCategory, BiasDetector, _literal_keywords
+
+
+def reference_scan(text):
+    """The original rule-based scan: every pattern on its own, in pattern order"""
+    hits = []
+    for category, patterns in BiasDetector.BIAS_PATTERNS.items():
+        for pattern in patterns:
+            for match in re.finditer(pattern, text.lower(), re.IGNORECASE):
+                hits.append((match.start(), match.end(), category))
+    return hits
+
+
+def available_backends():
+    backends = {"regex": BiasDetector._scan_regex}
+    if BiasDetector.KEYWORD_AUTOMATON is not None:
+        backends["aho_corasick"] = BiasDetector._scan_keywords
+    if BiasDetector.HYPERSCAN_DB is not None:
+        backends["hyperscan"] = BiasDetector._scan_hyperscan
+    return backends
+
+
+ALL_KEYWORDS = [
+    keyword
+    for patterns in BiasDetector.BIAS_PATTERNS.values()
+    for pattern in patterns
+    for keyword in _literal_keywords(pattern) or []
+]
+
+PARITY_TEXTS = [
+    "Are you a native speaker of English?",
+    "Estimate the man-hours for this project",
+    "Describe a project you led end to end.",
+    "Is he a digital native with family obligations and a young family?",
+    "Please state your Visa Status, year of birth and ESL level.",
+    " ".join(ALL_KEYWORDS),
+    "-".join(ALL_KEYWORDS),
+    "".join(ALL_KEYWORDS),
+] + [f"Tell us about {keyword}." for keyword in ALL_KEYWORDS]
+
+
+class TestRuleBasedParity:
+    """All scanning backends agree with the per-pattern scan"""
+
+    @pytest.mark.parametrize("backend", sorted(available_backends()))
+    def test_backend_matches_reference(self, backend):
+        """Test every backend reports the same hits, in the same order"""
+        scan = available_backends()[backend]
+        for text in PARITY_TEXTS:
+            hits = [
+                (start, end, BiasDetector.COMPILED_PATTERNS[expression_id][0])
+                for expression_id, start, end in scan(text)
+            ]
+            assert hits == reference_scan(text), text
+
+    def test_scan_patterns_matches_reference(self):
+        """Test the selected backend agrees with the reference"""
+        for text in PARITY_TEXTS:
+            assert BiasDetector._scan_patterns(text) == reference_scan(text), text
+
+
+class TestRuleBasedDetections:
+    """Detections raised for overlapping protected-category terms"""
+
+    def test_native_speaker_flags_race_and_nationality(self):
+        """Test a phrase hit by two categories raises both flags"""
+        detector = BiasDetector.__new__(BiasDetector)
+        detections = detector.detect_bias_rule_based("Are you a native speaker of English?")
+
+        flagged = {(d.category, d.explanation) for d in detections}
+        assert (BiasCategory.RACE, "Detected race bias: 'native speaker'") in flagged
+        assert (BiasCategory.NATIONALITY, "Detected nationality bias: 'native'") in flagged
+
+    def test_overlapping_patterns_in_one_category(self):
+        """Test overlapping hits from two patterns of the same category are both kept"""
+        detector = BiasDetector.__new__(BiasDetector)
+        detections = detector.detect_bias_rule_based("Estimate the man-hours")
+
+        explanations = [d.explanation for d in detections if d.category == BiasCategory.GENDER]
+        assert explanations == [
+            "Detected gender bias: 'man'",
+            "Detected gender bias: 'man-hours'"
+        ]
+
+    def test_clean_text_has_no_hits(self):
+        """Test text without protected terms raises nothing"""
+        detector = BiasDetector.__new__(BiasDetector)
+        assert detector.detect_bias_rule_based("Describe a project you led end to end.") == []
@@ -0,0 +1,66 @@
+"""
+Job Matcher Tests
+Requirement extraction must keep the original pattern priority
+"""
+import re
+
+import pytest
+
+from app.services.job_matcher import JobCandidateMatchingService
+
+
+BASELINE_EXPERIENCE_PATTERNS = [
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+    r'(\d+)\s*to\s*\d+\s*years?',
+    r'minimum\s*(\d+)\s*years?',
+    r'at\s*least\s*(\d+)\s*years?',
+]
+
+
+def baseline_experience_years(text):
+    """The original extraction: first pattern in priority order that matches anywhere"""
+    for pattern in BASELINE_EXPERIENCE_PATTERNS:
+        match = re.search(pattern, text.lower())
+        if match:
+            return int(match.group(1))
+    return None
+
+
+@pytest.fixture
+def matcher():
+    # Skip __init__: the extractors need no models
+    return JobCandidateMatchingService.__new__(JobCandidateMatchingService)
+
+
+class TestExtractExperienceYears:
+    """_extract_experience_years against the per-pattern baseline"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Minimum 2 years in cloud; 5+ years experience with Python", 5),
+        ("3 to 5 years in backend. 7 years of experience preferred", 7),
+        ("At least 4 years in fintech, minimum 6 years overall", 6),
+        ("At least 4 years in fintech", 4),
+        ("2 to 3 years of Go", 2),
+        ("Senior engineer, 10+ Years Experience", 10),
+        ("No experience requirement listed", None),
+    ])
+    def test_priority_examples(self, matcher, text, expected):
+        """Test a higher-priority pattern wins even when it appears later"""
+        assert matcher._extract_experience_years(text) == expected
+
+    def test_matches_baseline(self, matcher):
+        """Test every ordering of the patterns agrees with the baseline"""
+        phrases = [
+            "5+ years experience",
+            "8 years of experience",
+            "3 to 5 years",
+            "minimum 2 years",
+            "at least 4 years",
+            "1 year in support",
+        ]
+        texts = [
+            f"{first}; {second}. {third}"
+            for first in phrases for second in phrases for third in phrases
+        ]
+        for text in texts:
+            assert matcher._extract_experience_years(text) == baseline_experience_years(text), text